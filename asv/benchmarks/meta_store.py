@@ -0,0 +1,138 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import xorbits._mars.dataframe as md
+from xorbits._mars.core import tile
+from xorbits._mars.services.meta.metas import DataFrameChunkMeta
+from xorbits._mars.services.meta.store import get_meta_store
+
+N_CHUNKS = 100_000
+N_BANDS = 8
+
+
+def _gen_metas():
+    df = md.DataFrame(pd.DataFrame(np.random.rand(10, 4)), chunk_size=(10, 4))
+    chunk = tile(df).chunks[0]
+    bands = [(f"127.0.0.1:{i}", "numa-0") for i in range(N_BANDS)]
+    metas = []
+    for i in range(N_CHUNKS):
+        key = f"chunk_{i}"
+        metas.append(
+            (
+                key,
+                DataFrameChunkMeta(
+                    object_id=key,
+                    shape=chunk.shape,
+                    dtypes_value=chunk.dtypes_value,
+                    index_value=chunk.index_value,
+                    index=(i, 0),
+                    memory_size=1024,
+                    store_size=1024,
+                    bands=[bands[i % N_BANDS]],
+                ),
+            )
+        )
+    return metas
+
+
+class MetaStoreSuite:
+    """
+    Benchmark that times and measures meta stores with many chunks
+    """
+
+    params = ["dict", "columnar"]
+    param_names = ["store"]
+
+    def setup(self, store_name):
+        self.metas = _gen_metas()
+        self.store_cls = get_meta_store(store_name)
+        self.store = self._fill(self.store_cls("session_id"), copy=True)
+        gc.collect()
+
+    def _fill(self, store, copy=False):
+        metas = self.metas
+        if copy:
+            # metas are deserialized into new objects in the store actor,
+            # thus the store is filled with copies
+            metas = [
+                (key, type(meta)(**{k: getattr(meta, k) for k in meta.__slots__}))
+                for key, meta in metas
+            ]
+
+        async def fill():
+            await store.set_meta.batch(
+                *[store.set_meta.delay(key, meta) for key, meta in metas]
+            )
+
+        asyncio.run(fill())
+        return store
+
+    def time_batch_set_meta(self, store_name):
+        self._fill(self.store_cls("session_id"))
+
+    def time_batch_get_meta(self, store_name):
+        store = self.store
+
+        async def get():
+            await store.get_meta.batch(
+                *[
+                    store.get_meta.delay(key, fields=["bands", "memory_size"])
+                    for key, _ in self.metas
+                ]
+            )
+
+        asyncio.run(get())
+
+    def track_memory(self, store_name):
+        gc.collect()
+        tracemalloc.start()
+        snapshot = tracemalloc.take_snapshot()
+        store = self._fill(self.store_cls("session_id"), copy=True)
+        gc.collect()
+        size = sum(
+            stat.size_diff
+            for stat in tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        )
+        tracemalloc.stop()
+        del store
+        return size
+
+    track_memory.unit = "bytes"
+
+
+class MetaStoreGCSuite:
+    """
+    Benchmark that times full garbage collections with filled meta stores
+    """
+
+    params = ["dict", "columnar"]
+    param_names = ["store"]
+
+    def setup(self, store_name):
+        suite = MetaStoreSuite()
+        suite.setup(store_name)
+        # only objects held by the store are left
+        self.store = suite.store
+        del suite
+        gc.collect()
+
+    def time_gc_collect(self, store_name):
+        gc.collect()
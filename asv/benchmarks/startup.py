@@ -0,0 +1,41 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+# make sure necessary pyc files generated
+import xorbits
+
+del xorbits
+
+_init_code = """
+import xorbits
+xorbits.init(n_cpu={n_cpu}, web=False)
+xorbits.shutdown()
+"""
+
+
+class ClusterStartupSuite:
+    """
+    Benchmark that times startup of local clusters
+    """
+
+    timeout = 300
+    params = [1, 4]
+    param_names = ["n_cpu"]
+
+    def time_init_local_cluster(self, n_cpu):
+        proc = subprocess.Popen([sys.executable, "-c", _init_code.format(n_cpu=n_cpu)])
+        proc.wait(self.timeout)
@@ -16,21 +16,53 @@ import argparse
 import functools
 import inspect
 import json
+import logging
+import os
+import sys
 import time
-from typing import Callable, List, Dict
+from typing import Callable, Dict, List, NamedTuple, Union
 
 import xorbits
 import xorbits.pandas as xd
+from xorbits._mars.dataframe.datasource.tpch import gen_tpch
+from xorbits._mars.deploy.oscar.session import get_default_session
+from xorbits.core.adapter import from_mars
+
+try:
+    from .stats import QueryStatsCollector, compare_with_baseline
+except ImportError:  # run as a script
+    from stats import QueryStatsCollector, compare_with_baseline
+
+
+class GeneratedDataSet(NamedTuple):
+    """TPC-H tables generated by the workers instead of read from files."""
+
+    scale_factor: float
+    seed: int = 0
+
+
+DataSet = Union[str, GeneratedDataSet]
+
+
+def _load_table(
+    data_set: DataSet, table: str, use_arrow_dtype: bool, storage_options: Dict
+) -> xd.DataFrame:
+    if isinstance(data_set, GeneratedDataSet):
+        return from_mars(
+            gen_tpch(table, scale_factor=data_set.scale_factor, seed=data_set.seed)
+        )
+    return xd.read_parquet(
+        data_set + "/" + table,
+        use_arrow_dtype=use_arrow_dtype,
+        storage_options=storage_options,
+    )
 
 
 @functools.lru_cache
 def load_lineitem(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/lineitem"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "lineitem", use_arrow_dtype, storage_options)
     df["L_SHIPDATE"] = xd.to_datetime(df.L_SHIPDATE, format="%Y-%m-%d")
     df["L_RECEIPTDATE"] = xd.to_datetime(df.L_RECEIPTDATE, format="%Y-%m-%d")
     df["L_COMMITDATE"] = xd.to_datetime(df.L_COMMITDATE, format="%Y-%m-%d")
@@ -39,79 +71,58 @@ def load_lineitem(
 
 @functools.lru_cache
 def load_part(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/part"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "part", use_arrow_dtype, storage_options)
     return df
 
 
 @functools.lru_cache
 def load_orders(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/orders"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "orders", use_arrow_dtype, storage_options)
     df["O_ORDERDATE"] = xd.to_datetime(df.O_ORDERDATE, format="%Y-%m-%d")
     return df
 
 
 @functools.lru_cache
 def load_customer(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/customer"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "customer", use_arrow_dtype, storage_options)
     return df
 
 
 @functools.lru_cache
 def load_nation(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/nation"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "nation", use_arrow_dtype, storage_options)
     return df
 
 
 @functools.lru_cache
 def load_region(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/region"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "region", use_arrow_dtype, storage_options)
     return df
 
 
 @functools.lru_cache
 def load_supplier(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/supplier"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "supplier", use_arrow_dtype, storage_options)
     return df
 
 
 @functools.lru_cache
 def load_partsupp(
-    data_folder: str, use_arrow_dtype: bool = None, **storage_options
+    data_folder: DataSet, use_arrow_dtype: bool = None, **storage_options
 ) -> xd.DataFrame:
-    data_path = data_folder + "/partsupp"
-    df = xd.read_parquet(
-        data_path, use_arrow_dtype=use_arrow_dtype, storage_options=storage_options
-    )
+    df = _load_table(data_folder, "partsupp", use_arrow_dtype, storage_options)
     return df
 
 
@@ -1032,11 +1043,12 @@ def q22(customer, orders):
 
 
 def run_queries(
-    root: str,
+    root: DataSet,
     storage_options: Dict[str, str],
     queries: List[int],
     use_arrow_dtype: bool = None,
-):
+    stats_collector: QueryStatsCollector = None,
+) -> Dict[str, Dict[str, float]]:
     total_start = time.time()
     print("Start data loading")
     queries_to_args = dict()
@@ -1052,20 +1064,41 @@ def run_queries(
     xorbits.run(list(datasets_to_load))
     print(f"Data loading time (s): {time.time() - total_start}")
 
+    results = dict()
     total_start = time.time()
     for query in queries:
+        if stats_collector is not None:
+            stats_collector.start()
+        query_start = time.time()
         globals()[f"q{query:02}"](*queries_to_args[query])
+        if stats_collector is not None:
+            results[f"q{query:02}"] = stats_collector.stop()
+        else:
+            results[f"q{query:02}"] = {"wall_time": time.time() - query_start}
     print(f"Total query execution time (s): {time.time() - total_start}")
+    return results
 
 
 def main():
     parser = argparse.ArgumentParser(description="tpch-queries")
-    parser.add_argument(
+    data_group = parser.add_mutually_exclusive_group(required=True)
+    data_group.add_argument(
         "--data_set",
         type=str,
-        required=True,
         help="Path to the TPC-H dataset.",
     )
+    data_group.add_argument(
+        "--scale_factor",
+        type=float,
+        help="Generate TPC-H dataset with the scale factor in the cluster "
+        "instead of reading it from files.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed to generate TPC-H dataset.",
+    )
     parser.add_argument(
         "--storage_options",
         type=str,
@@ -1091,9 +1124,31 @@ def main():
         required=False,
         help="The endpoint of existing Xorbits cluster."
     )
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=False,
+        help="Path to write per-query statistics as a json file.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        required=False,
+        help="Path to the json file of baseline statistics to compare with.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Relative increase of a metric against the baseline "
+        "which is reported as a regression.",
+    )
 
     args = parser.parse_args()
-    data_set = args.data_set
+    if args.data_set is not None:
+        data_set = args.data_set
+    else:
+        data_set = GeneratedDataSet(args.scale_factor, args.seed)
     use_arrow_dtype = args.use_arrow_dtype
 
     # credentials to access the datasource.
@@ -1108,17 +1163,45 @@ def main():
         queries = args.queries
     print(f"Queries to run: {queries}")
 
+    if args.endpoint is None:
+        # shuffled bytes are collected from task profiling results,
+        # for an existing cluster, set it when starting the supervisor
+        os.environ["MARS_ENABLE_PROFILING"] = "1"
+        # do not print profiling results of every task
+        logging.getLogger("xorbits._mars.deploy.oscar.session").setLevel(
+            logging.ERROR
+        )
     xorbits.init(address=args.endpoint)
     try:
-        run_queries(
+        session = get_default_session()
+        stats_collector = None
+        web_endpoint = session.get_web_endpoint()
+        if web_endpoint is not None:
+            stats_collector = QueryStatsCollector(web_endpoint, session.session_id)
+        results = run_queries(
             data_set,
             storage_options=storage_options,
             queries=queries,
             use_arrow_dtype=use_arrow_dtype,
+            stats_collector=stats_collector,
         )
     finally:
         xorbits.shutdown()
 
+    print(json.dumps(results, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as fp:
+            baseline = json.load(fp)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     print(f"Running TPC-H against Xorbits v{xorbits.__version__}")
@@ -0,0 +1,135 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+# metrics where a larger value means a regression
+METRICS = ["wall_time", "peak_worker_memory", "bytes_shuffled", "bytes_spilled"]
+
+# cluster node role of workers, see `xorbits._mars.services.core.NodeRole`
+_WORKER_ROLE = 1
+
+
+def _get_json(url: str) -> Dict:
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+class QueryStatsCollector:
+    """
+    Collect wall time, peak worker memory, bytes shuffled and bytes spilled
+    of the queries running in a session through the web service of the
+    cluster.
+
+    Memory and spill sizes are sampled from the node information uploaded
+    by workers periodically, and bytes shuffled are read from the profiling
+    results of tasks, thus the cluster should run with
+    ``MARS_ENABLE_PROFILING=1``.
+    """
+
+    def __init__(self, web_endpoint: str, session_id: str, interval: float = 0.5):
+        self._web_endpoint = web_endpoint.rstrip("/")
+        self._session_id = session_id
+        self._interval = interval
+
+        self._stop_event = threading.Event()
+        self._sampler = None
+        self._start_time = None
+        self._start_spilled = 0
+        self._peak_memory = 0
+        self._peak_spilled = 0
+
+    def _sample_workers(self):
+        url = (
+            f"{self._web_endpoint}/api/cluster/nodes"
+            f"?role={_WORKER_ROLE}&resource=1&detail=1"
+        )
+        memory_used = spilled = 0
+        for node in _get_json(url)["nodes"].values():
+            for res in node.get("resource", {}).values():
+                if "memory_total" in res and "cpu_total" in res:
+                    memory_used += res["memory_total"] - res["memory_avail"]
+            storage = node.get("detail", {}).get("storage", {})
+            for levels in storage.values():
+                spilled += levels.get("disk", {}).get("size_used") or 0
+        return memory_used, spilled
+
+    def _sample(self):
+        while not self._stop_event.wait(self._interval):
+            memory_used, spilled = self._sample_workers()
+            self._peak_memory = max(self._peak_memory, memory_used)
+            self._peak_spilled = max(self._peak_spilled, spilled)
+
+    def _get_shuffled_bytes(self) -> int:
+        url = f"{self._web_endpoint}/api/session/{self._session_id}/task"
+        shuffled = 0
+        for task in _get_json(url)["tasks"]:
+            if (task["start_time"] or 0) < self._start_time:
+                continue
+            profiling = task.get("profiling") or {}
+            general = profiling.get("supervisor", {}).get("general", {})
+            shuffled += general.get("shuffle_bytes", 0)
+        return shuffled
+
+    def start(self):
+        self._start_time = time.time()
+        self._peak_memory, self._start_spilled = self._sample_workers()
+        self._peak_spilled = self._start_spilled
+        self._stop_event.clear()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> Dict[str, float]:
+        wall_time = time.time() - self._start_time
+        self._stop_event.set()
+        self._sampler.join()
+        memory_used, spilled = self._sample_workers()
+        return {
+            "wall_time": wall_time,
+            "peak_worker_memory": max(self._peak_memory, memory_used),
+            "bytes_shuffled": self._get_shuffled_bytes(),
+            "bytes_spilled": max(self._peak_spilled, spilled) - self._start_spilled,
+        }
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = 0.1,
+) -> List[str]:
+    """
+    Compare query results with the baseline and return descriptions of
+    metrics that regress more than `tolerance`.
+    """
+    regressions = []
+    for query, stats in results.items():
+        base_stats = baseline.get(query)
+        if not base_stats:
+            continue
+        for metric in METRICS:
+            value: Optional[float] = stats.get(metric)
+            base_value: Optional[float] = base_stats.get(metric)
+            if value is None or not base_value:
+                continue
+            ratio = value / base_value
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{query} {metric}: {value:.6g} vs baseline {base_value:.6g} "
+                    f"(+{(ratio - 1) * 100:.1f}%)"
+                )
+    return regressions
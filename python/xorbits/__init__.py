@@ -14,7 +14,7 @@
 
 
 from . import _version
-from .core import run
+from .core import cache, run, uncache
 from .deploy import init, shutdown
 
 
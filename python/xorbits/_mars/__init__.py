@@ -17,6 +17,14 @@ from . import _version
 from .config import options
 from .core.context import get_context
 from .deploy.oscar import new_cluster_in_ray, new_ray_session
-from .session import execute, fetch, fetch_log, new_session, stop_server
+from .session import (
+    execute,
+    fetch,
+    fetch_log,
+    new_session,
+    persist,
+    stop_server,
+    unpersist,
+)
 
 __version__ = _version.get_versions()["version"]
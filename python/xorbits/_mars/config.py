@@ -393,6 +393,20 @@ default_options.register_option("eager_mode", False, validator=is_bool)
 default_options.register_option(
     "optimize.head_optimize_threshold", 1000, validator=is_integer
 )
+default_options.register_option("optimize.join_reorder", True, validator=is_bool)
+default_options.register_option(
+    "optimize.broadcast_join_threshold", 64 * 1024**2, validator=is_integer
+)
+default_options.register_option(
+    "optimize.broadcast_join_memory_ratio", 0.1, validator=is_numeric
+)
+default_options.register_option("optimize.adaptive_shuffle", True, validator=is_bool)
+# size of every partition after shuffle, chunk_store_limit is used if not specified
+default_options.register_option(
+    "optimize.shuffle_partition_size",
+    None,
+    validator=any_validator(is_null, is_numeric, is_string),
+)
 
 # debug
 default_options.register_option("warn_duplicated_execution", False, validator=is_bool)
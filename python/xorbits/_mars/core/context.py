@@ -117,6 +117,16 @@ class Context(ABC):
         number_of_cpu: int
         """
 
+    @abstractmethod
+    def get_bands_memory_avail(self) -> Dict[BandType, float]:
+        """
+        Get available memory of worker bands.
+
+        Returns
+        -------
+        band_to_memory_avail : dict
+        """
+
     @abstractmethod
     def get_slots(self) -> int:
         """
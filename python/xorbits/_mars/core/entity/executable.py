@@ -189,6 +189,42 @@ class _ExecutableMixin:
         self._check_session(session, "fetch_infos")
         return fetch_infos(self, fields=fields, session=session, **kw)
 
+    def persist(
+        self,
+        session: SessionType = None,
+        level: str = "memory",
+        priority: int = 1,
+        **kw,
+    ):
+        """
+        Execute if not executed and keep the data in storage, later
+        executions of the same tileable reuse the data.
+
+        Parameters
+        ----------
+        session : Session
+            Session to execute and keep the data.
+        level : str
+            Storage level to keep data, 'memory' or 'disk'.
+        priority : int
+            Data with higher priority is spilled later.
+        **kw
+            Keyword arguments passed to ``execute``.
+        """
+        from ...deploy.oscar.session import persist
+
+        session = _get_session(self, session)
+        persist(self, session=session, level=level, priority=priority, **kw)
+        return self
+
+    def unpersist(self, session: SessionType = None):
+        from ...deploy.oscar.session import unpersist
+
+        session = _get_session(self, session)
+        self._check_session(session, "unpersist")
+        unpersist(self, session=session)
+        return self
+
     def _attach_session(self, session: SessionType):
         if session not in self._executed_sessions:
             _cleaner.register(self, session)
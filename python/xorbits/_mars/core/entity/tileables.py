@@ -409,6 +409,14 @@ class Tileable(Entity):
             return result
 
 
+    def persist(self, session=None, **kw):
+        self.data.persist(session=session, **kw)
+        return self
+
+    def unpersist(self, session=None):
+        self.data.unpersist(session=session)
+        return self
+
 TILEABLE_TYPE = (Tileable, TileableData)
 
 
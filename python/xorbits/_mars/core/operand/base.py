@@ -89,6 +89,10 @@ class SchedulingHint(Serializable):
     # `gpu` indicates that if the operand should be executed on the GPU.
     gpu = BoolField("gpu", default=None)
     priority = Int32Field("priority", default=None)
+    # number of cpus the operand may use, e.g. the number of threads
+    # used by GIL-free kernels like BLAS, if specified, the subtask
+    # containing the operand will occupy multiple slots of a band
+    num_cpus = Int32Field("num_cpus", default=None)
 
     @classproperty
     @functools.lru_cache(1)
@@ -302,6 +306,15 @@ class Operand(Base, OperatorLogicKeyGeneratorMixin, metaclass=OperandMetaclass):
     def retryable(self) -> bool:
         return True
 
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether results of the operand can be reused by later tasks
+        from result cache of workers. Operands with side effects or
+        reading sources whose changes cannot be detected shall not.
+        """
+        return self.retryable
+
     def get_dependent_data_keys(self):
         return [dep.key for dep in self.inputs or ()]
 
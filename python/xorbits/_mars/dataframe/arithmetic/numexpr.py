@@ -0,0 +1,211 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict
+from itertools import count
+
+import numpy as np
+import pandas as pd
+
+from ...core.operand import Fuse, execute
+from ...tensor import arithmetic
+from ...tensor.fuse.numexpr import (
+    NE_BINOP_TO_STRING as TENSOR_NE_BINOP_TO_STRING,
+    NE_UNARYOP_TO_STRING as TENSOR_NE_UNARYOP_TO_STRING,
+    ne,
+)
+from ..core import SERIES_CHUNK_TYPE
+from ..operands import DataFrameFuseChunkMixin
+from .core import DataFrameBinOp, DataFrameUnaryOp
+
+# numexpr follows C semantics for integer modulo and shifts,
+# thus those operators are excluded
+NE_BINOP_TO_STRING = {
+    op_type: op_str
+    for op_type, op_str in TENSOR_NE_BINOP_TO_STRING.items()
+    if op_type
+    not in (
+        arithmetic.TensorMod,
+        arithmetic.TensorLshift,
+        arithmetic.TensorRshift,
+        arithmetic.TensorAnd,
+        arithmetic.TensorOr,
+    )
+}
+NE_BINOP_TO_STRING.update(
+    {
+        arithmetic.TensorTrueDiv: "/",
+        arithmetic.TensorBitand: "&",
+        arithmetic.TensorBitor: "|",
+    }
+)
+NE_UNARYOP_TO_STRING = {
+    op_type: op_str
+    for op_type, op_str in TENSOR_NE_UNARYOP_TO_STRING.items()
+    if op_type is not arithmetic.TensorConj
+}
+
+
+def _is_numeric_dtype(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _is_numeric_scalar(value) -> bool:
+    if isinstance(value, (bool, np.bool_)):
+        return True
+    return isinstance(value, (int, float, np.integer, np.floating)) and bool(
+        np.isfinite(value)
+    )
+
+
+def can_fuse_series(chunk) -> bool:
+    """
+    Check if the chunk is a Series arithmetic, comparison or boolean
+    operation which can be evaluated by numexpr. As dtypes of chunks
+    may be inaccurate, dtypes of data are checked during execution.
+    """
+    op = chunk.op
+    if not isinstance(chunk, SERIES_CHUNK_TYPE):
+        return False
+    tensor_op_type = getattr(type(op), "tensor_op_type", None)
+    if isinstance(op, DataFrameBinOp):
+        if tensor_op_type not in NE_BINOP_TO_STRING:
+            return False
+        if op.fill_value is not None or op.level is not None:
+            return False
+        if tensor_op_type is arithmetic.TensorPower and not (
+            isinstance(op.lhs, SERIES_CHUNK_TYPE)
+            and _is_numeric_scalar(op.rhs)
+            and op.rhs >= 0
+        ):
+            # integer power raises for negative exponents in pandas
+            return False
+        operands = [op.lhs, op.rhs]
+    elif isinstance(op, DataFrameUnaryOp):
+        if tensor_op_type not in NE_UNARYOP_TO_STRING:
+            return False
+        operands = op.inputs
+    else:
+        return False
+    return all(
+        isinstance(operand, SERIES_CHUNK_TYPE) or _is_numeric_scalar(operand)
+        for operand in operands
+    )
+
+
+def _get_common_index(inputs):
+    index = None
+    for data in inputs:
+        if not isinstance(data, pd.Series) or not _is_numeric_dtype(data.dtype):
+            return None
+        if index is None:
+            index = data.index
+        elif data.index is not index and not data.index.equals(index):
+            return None
+    return index
+
+
+def _match_name(a, b):
+    if a is b or a == b:
+        return a
+    return None
+
+
+def _to_expr(value) -> str:
+    if isinstance(value, np.generic):
+        value = value.item()
+    return str(value)
+
+
+class DataFrameNeFuseChunk(Fuse, DataFrameFuseChunkMixin):
+    _op_type_ = None  # no opcode, cannot be serialized
+
+    @property
+    def output_types(self):
+        return self.outputs[-1].chunk.op.output_types
+
+    @classmethod
+    def _evaluate(cls, op, inputs, index):
+        chunk = op.outputs[0]
+        counter = count()
+        key_to_var = defaultdict(lambda: f"V_{counter.__next__()}")
+        local_dict = dict()
+        # chunk key -> (expression, Series name)
+        exprs = dict()
+        for key, data in inputs.items():
+            var = key_to_var[key]
+            local_dict[var] = data.to_numpy()
+            exprs[key] = (var, data.name)
+
+        for node in chunk.composed:
+            node_op = node.op
+            tensor_op_type = type(node_op).tensor_op_type
+            if tensor_op_type in NE_UNARYOP_TO_STRING:
+                expr, name = exprs[node.inputs[0].key]
+                exprs[node.key] = (
+                    f"{NE_UNARYOP_TO_STRING[tensor_op_type]}({expr})",
+                    name,
+                )
+                continue
+
+            operand_exprs, names = [], []
+            for operand in (node_op.lhs, node_op.rhs):
+                if isinstance(operand, SERIES_CHUNK_TYPE):
+                    expr, name = exprs[operand.key]
+                    operand_exprs.append(expr)
+                    names.append(name)
+                else:
+                    operand_exprs.append(_to_expr(operand))
+            name = names[0] if len(names) == 1 else _match_name(*names)
+            op_str = NE_BINOP_TO_STRING[tensor_op_type]
+            exprs[node.key] = (
+                f"({operand_exprs[0]} {op_str} {operand_exprs[1]})",
+                name,
+            )
+
+        expr, name = exprs[chunk.key]
+        # The numexpr.evaluate is thread safe: https://github.com/pydata/numexpr/pull/200
+        res = ne.evaluate(expr, local_dict=local_dict, global_dict={})
+        return pd.Series(res, index=index, name=name)
+
+    @classmethod
+    def _execute_composed(cls, op, inputs):
+        results = dict(inputs)
+        for node in op.outputs[0].composed:
+            execute(results, node.op)
+        return results[op.outputs[0].key]
+
+    @classmethod
+    def execute(cls, ctx, op):
+        chunk = op.outputs[0]
+        inputs = {c.key: ctx[c.key] for c in op.inputs}
+        index = _get_common_index(inputs.values())
+        if index is not None:
+            # result dtype follows the type promotion of pandas,
+            # which is inferred from empty inputs
+            expected = cls._execute_composed(
+                op, {key: data.iloc[:0] for key, data in inputs.items()}
+            )
+            try:
+                res = cls._evaluate(op, inputs, index)
+            except (TypeError, ValueError, KeyError, NotImplementedError):
+                pass
+            else:
+                if res.dtype != expected.dtype:
+                    res = res.astype(expected.dtype)
+                ctx[chunk.key] = res
+                return
+        # inputs need to be aligned, or are not supported by numexpr,
+        # fall back to executing operands one by one
+        ctx[chunk.key] = cls._execute_composed(op, inputs)
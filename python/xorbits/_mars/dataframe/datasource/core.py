@@ -125,6 +125,11 @@ class IncrementalIndexDatasource(HeadOptimizedDataSource):
 
     incremental_index_recorder_name = StringField("incremental_index_recorder_name")
 
+    @property
+    def cacheable(self) -> bool:
+        # chunks recording sizes for incremental index shall be executed
+        return getattr(self, "incremental_index_recorder_name", None) is None
+
 
 class IncrementalIndexDataSourceMixin(DataFrameOperandMixin):
     __slots__ = ()
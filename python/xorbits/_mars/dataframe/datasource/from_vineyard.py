@@ -44,6 +44,10 @@ class DataFrameFromVineyard(DataFrameOperand, DataFrameOperandMixin):
     # a dummy attr to make sure ops have different keys
     operator_index = Int32Field("operator_index")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, object_id=None, **kw):
         super().__init__(
             vineyard_socket=vineyard_socket,
@@ -169,6 +173,10 @@ class DataFrameFromVineyardChunk(DataFrameOperand, DataFrameOperandMixin):
     # ObjectID of chunk in vineyard
     object_id = StringField("object_id")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, object_id=None, **kw):
         super().__init__(vineyard_socket=vineyard_socket, object_id=object_id, **kw)
 
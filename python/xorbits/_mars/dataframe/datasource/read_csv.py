@@ -21,9 +21,13 @@ import numpy as np
 import pandas as pd
 
 try:
+    import pyarrow as pa
     from pyarrow import NativeFile
+    from pyarrow import csv as pa_csv
 except ImportError:  # pragma: no cover
+    pa = None
     NativeFile = None
+    pa_csv = None
 
 from ... import opcodes as OperandDef
 from ...config import options
@@ -33,13 +37,14 @@ from ...serialization.serializables import (
     AnyField,
     BoolField,
     DictField,
+    Float64Field,
     Int32Field,
     Int64Field,
     ListField,
     StringField,
 )
 from ...utils import FixedSizeFileObject, lazy_import, parse_readable_size
-from ..arrays import ArrowStringDtype
+from ..arrays import ArrowStringArray, ArrowStringDtype
 from ..utils import build_empty_df, contain_arrow_dtype, parse_index, to_arrow_dtypes
 from .core import (
     ColumnPruneSupportedDataSourceMixin,
@@ -115,6 +120,12 @@ class DataFrameReadCSV(
     storage_options = DictField("storage_options")
     merge_small_files = BoolField("merge_small_files")
     merge_small_file_options = DictField("merge_small_file_options")
+    engine = StringField("engine", default=None)
+    # statistics of head rows to estimate row counts of chunks
+    head_row_num = Int64Field("head_row_num", default=None)
+    head_raw_bytes = Int64Field("head_raw_bytes", default=None)
+    head_memory_size = Float64Field("head_memory_size", default=None)
+    estimated_row_num = Int64Field("estimated_row_num", default=None)
 
     def get_columns(self):
         return self.usecols
@@ -207,6 +218,10 @@ class DataFrameReadCSV(
                 chunk_op.path = path
                 chunk_op.offset = offset
                 chunk_op.size = min(chunk_bytes, total_bytes - offset)
+                if op.head_row_num and op.head_raw_bytes:
+                    chunk_op.estimated_row_num = int(
+                        np.ceil(chunk_op.size * op.head_row_num / op.head_raw_bytes)
+                    )
                 shape = (np.nan, len(dtypes))
                 index_value = parse_index(df.index_value.to_pandas(), path, index_num)
                 new_chunk = chunk_op.new_chunk(
@@ -239,6 +254,8 @@ class DataFrameReadCSV(
     @classmethod
     def _pandas_read_csv(cls, f, op):
         csv_kwargs = op.extra_params.copy()
+        if op.engine is not None:
+            csv_kwargs["engine"] = op.engine
         out_df = op.outputs[0]
         start, end = _find_chunk_start_end(f, op.offset, op.size, out_df.index[0] == 0)
         f.seek(start)
@@ -282,6 +299,79 @@ class DataFrameReadCSV(
                 df = df[op.usecols]
         return df
 
+    @classmethod
+    def _pyarrow_read_csv(cls, f, op):
+        out_df = op.outputs[0]
+        if op.compression is not None:
+            start, end = 0, None
+            b = f.read()
+        else:
+            start, end = _find_chunk_start_end(
+                f, op.offset, op.size, out_df.index[0] == 0
+            )
+            f.seek(start)
+            b = f.read(end - start)
+        dtypes = out_df.dtypes
+        if not b:
+            # the last chunk may be empty
+            df = build_empty_df(dtypes)
+            if op.keep_usecols_order and not isinstance(op.usecols, list):
+                # convert to Series, if usecols is a scalar
+                df = df[op.usecols]
+            return df
+
+        skip_rows = 0
+        if op.header == 0 and (out_df.index[0] == 0 or start == 0):
+            # The first chunk contains header
+            skip_rows = 1
+        names = list(op.names)
+        if op.usecols:
+            usecols = op.usecols if isinstance(op.usecols, list) else [op.usecols]
+            included = set(usecols)
+            if op.index_col is not None:
+                included.add(names[op.index_col])
+            include_columns = [name for name in names if name in included]
+        else:
+            include_columns = names
+        # parse string columns as strings instead of inferring types in every chunk
+        column_types = {
+            name: pa.string()
+            for name, dtype in dtypes.items()
+            if name in include_columns
+            and (isinstance(dtype, ArrowStringDtype) or dtype == np.dtype("O"))
+        }
+        table = pa_csv.read_csv(
+            pa.BufferReader(b),
+            read_options=pa_csv.ReadOptions(
+                column_names=names, skip_rows=skip_rows, use_threads=True
+            ),
+            parse_options=pa_csv.ParseOptions(delimiter=op.sep),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=include_columns,
+                # keep empty strings for arrow string columns like the C engine
+                strings_can_be_null=not contain_arrow_dtype(dtypes),
+            ),
+        )
+        if op.nrows is not None:
+            table = table.slice(0, op.nrows)
+
+        arrow_columns = cls._select_arrow_dtype(dtypes)
+        df = table.drop(list(arrow_columns)).to_pandas()
+        for name in column_types:
+            if name not in arrow_columns and table.column(name).null_count > 0:
+                # missing strings are NaN for the C engine
+                df[name] = df[name].fillna(np.nan)
+        for name in arrow_columns:
+            # convert to arrow string arrays without building python strings
+            df[name] = ArrowStringArray(table.column(name))
+        df = df[include_columns]
+        if op.index_col is not None:
+            df = df.set_index(names[op.index_col])
+        if op.keep_usecols_order:
+            df = df[op.usecols]
+        return df
+
     @classmethod
     def _cudf_read_csv(cls, op):  # pragma: no cover
         if op.usecols:
@@ -333,9 +423,13 @@ class DataFrameReadCSV(
         with open_file(
             op.path, compression=op.compression, storage_options=op.storage_options
         ) as f:
-            if op.compression is not None:
+            if op.engine == "pyarrow" and not op.gpu:
+                df = cls._pyarrow_read_csv(f, op)
+            elif op.compression is not None:
                 # As we specify names and dtype, we need to skip header rows
                 csv_kwargs["header"] = op.header
+                if op.engine is not None:
+                    csv_kwargs["engine"] = op.engine
                 dtypes = op.outputs[0].dtypes
                 if contain_arrow_dtype(dtypes):
                     # when keep_default_na is True which is default,
@@ -358,8 +452,16 @@ class DataFrameReadCSV(
                 df = cls._cudf_read_csv(op) if op.gpu else cls._pandas_read_csv(f, op)
         ctx[out_df.key] = df
 
+    @classmethod
     def estimate_size(cls, ctx, op):
-        phy_size = op.size * (op.memory_scale or 1)
+        if (
+            op.memory_scale is None
+            and op.estimated_row_num is not None
+            and op.head_memory_size is not None
+        ):
+            phy_size = int(op.estimated_row_num * op.head_memory_size / op.head_row_num)
+        else:
+            phy_size = op.size * (op.memory_scale or 1)
         ctx[op.outputs[0].key] = (phy_size, phy_size * 2)
 
     def __call__(
@@ -483,9 +585,13 @@ def read_csv(
         to preserve and not interpret dtype.
         If converters are specified, they will be applied INSTEAD
         of dtype conversion.
-    engine : {'c', 'python'}, optional
+    engine : {'c', 'python', 'pyarrow'}, optional
         Parser engine to use. The C engine is faster while the python engine is
-        currently more feature-complete.
+        currently more feature-complete. The pyarrow engine parses every chunk
+        with ``pyarrow.csv`` in multiple threads, and reads string columns as
+        arrow strings directly when `use_arrow_dtype` is True. Only `sep` of a
+        single character, `names`, `header`, `index_col`, `usecols`, `nrows`,
+        `skiprows` and `compression` are supported by the pyarrow engine.
     converters : dict, optional
         Dict of functions for converting values in certain columns. Keys can either
         be integers or column labels.
@@ -687,6 +793,17 @@ def read_csv(
     >>> auth_path = build_oss_path(file_path, access_key_id, access_key_secret, end_point)
     >>> md.read_csv(auth_path)
     """
+    engine = kwargs.get("engine")
+    if engine == "pyarrow":
+        if pa_csv is None:  # pragma: no cover
+            raise ImportError("pyarrow is required when engine='pyarrow'")
+        if sep is None or len(sep) != 1:
+            raise ValueError("sep should be a single character when engine='pyarrow'")
+        unsupported = sorted(k for k in kwargs if k != "engine")
+        if unsupported:
+            raise ValueError(
+                f"Options {unsupported} are not supported when engine='pyarrow'"
+            )
     # infer dtypes and columns
     if isinstance(path, (list, tuple)):
         file_path = path[0]
@@ -727,11 +844,16 @@ def read_csv(
             header = 0
         if names is None:
             names = list(mini_df.columns)
+            if engine == "pyarrow" and isinstance(index_col, int):
+                # pyarrow requires names of all columns in the file
+                names.insert(index_col, mini_df.index.name)
         if usecols:
             usecols = usecols if isinstance(usecols, list) else [usecols]
             col_index = sorted(mini_df.columns.get_indexer(usecols))
             mini_df = mini_df.iloc[:, col_index]
 
+    head_row_num = len(mini_df)
+    head_memory_size = float(mini_df.memory_usage(deep=True).sum())
     if isinstance(mini_df.index, pd.RangeIndex):
         index_value = parse_index(pd.RangeIndex(-1))
     else:
@@ -755,6 +877,9 @@ def read_csv(
         memory_scale=memory_scale,
         merge_small_files=merge_small_files,
         merge_small_file_options=merge_small_file_options,
+        head_row_num=head_row_num,
+        head_raw_bytes=len(b),
+        head_memory_size=head_memory_size,
         **kwargs,
     )
     chunk_bytes = chunk_bytes or options.chunk_store_limit
@@ -52,6 +52,10 @@ class DataFrameReadRayDataset(
     incremental_index = BoolField("incremental_index", default=None)
     nrows = Int64Field("nrows", default=None)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     @classmethod
     def _tile_partitioned(cls, op: "DataFrameReadRayDataset"):
         out_df = op.outputs[0]
@@ -156,6 +160,10 @@ class DataFrameReadMLDataset(HeadOptimizedDataSource):
     mldataset = ReferenceField("mldataset", "ray.util.data.MLDataset", default=None)
     columns = ListField("columns", default=None)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, **kw):
         super().__init__(_output_types=[OutputType.dataframe], **kw)
 
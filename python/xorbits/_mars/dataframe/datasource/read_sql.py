@@ -16,12 +16,15 @@
 import binascii
 import datetime
 import pickle
+import threading
 import uuid
+from collections import OrderedDict
 from typing import List, Union
 
 import cloudpickle
 import numpy as np
 import pandas as pd
+from pandas._libs import lib
 
 from ... import opcodes as OperandDef
 from ...config import options
@@ -39,13 +42,50 @@ from ...serialization.serializables import (
 from ...tensor.utils import normalize_chunk_sizes
 from ...typing import OperandType, TileableType
 from ..arrays import ArrowStringDtype
-from ..utils import create_sa_connection, parse_index, to_arrow_dtypes
+from ..utils import (
+    arrow_table_to_pandas_dataframe,
+    create_sa_connection,
+    parse_index,
+    to_arrow_dtypes,
+)
 from .core import (
     ColumnPruneSupportedDataSourceMixin,
     IncrementalIndexDatasource,
     IncrementalIndexDataSourceMixin,
 )
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+# number of rows fetched from cursors for every arrow batch
+_FETCH_BATCH_ROWS = 65536
+_MAX_CACHED_ENGINES = 16
+
+_engines = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def _get_engine(con, engine_kwargs=None):
+    """
+    Get engine of the connection string which is cached in current process,
+    thus connections in its pool can be reused by chunks.
+    """
+    import sqlalchemy as sa
+
+    key = (con, cloudpickle.dumps(engine_kwargs or dict()))
+    with _engines_lock:
+        try:
+            _engines.move_to_end(key)
+            return _engines[key]
+        except KeyError:
+            engine = _engines[key] = sa.create_engine(con, **(engine_kwargs or dict()))
+            if len(_engines) > _MAX_CACHED_ENGINES:
+                _, evicted = _engines.popitem(last=False)
+                evicted.dispose()
+            return engine
+
 
 class DataFrameReadSQLLogicKeyGenerator(OperatorLogicKeyGeneratorMixin):
     def _get_logic_key_token_values(self):
@@ -104,6 +144,10 @@ class DataFrameReadSQL(
     right_end = BoolField("right_end")
     nrows = Int64Field("nrows", default=None)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def get_columns(self):
         return self.columns
 
@@ -175,7 +219,7 @@ class DataFrameReadSQL(
                 deep=True, index=True
             ).sum() / len(test_df)
 
-        if self.method == "offset":
+        if self.method != "partition" or self.num_partitions is None:
             # fetch size
             size = list(
                 engine_or_conn.execute(
@@ -238,7 +282,21 @@ class DataFrameReadSQL(
                         con, columns=self.columns + (self.index_col or [])
                     )
 
+            if self.method == "auto":
+                self.partition_col = self._get_auto_partition_col(selectable, test_df)
+                if self.partition_col is None:
+                    self.method = "offset"
+                else:
+                    self.method = "partition"
+                    # keep range index identical to the one from offsets
+                    self.incremental_index = True
+
             if self.method == "partition":
+                if self.num_partitions is None:
+                    self.num_partitions = len(
+                        self._get_row_chunk_sizes(shape, chunk_size)
+                    )
+                    shape = (np.nan, shape[1])
                 if not self.index_col or self.partition_col not in self.index_col:
                     part_frame = test_df
                 else:
@@ -280,22 +338,45 @@ class DataFrameReadSQL(
                 raw_chunk_size=chunk_size,
             )
 
+    @staticmethod
+    def _get_auto_partition_col(selectable, test_df: pd.DataFrame):
+        """
+        Select the single numeric or datetime primary key of the table
+        to split the table by ranges.
+        """
+        primary_key = getattr(selectable, "primary_key", None)
+        if primary_key is None or len(primary_key) != 1 or len(test_df) == 0:
+            return None
+        col_name = list(primary_key)[0].name
+        if col_name in test_df.columns:
+            dtype = test_df[col_name].dtype
+        elif col_name in (test_df.index.names or []):
+            dtype = test_df.index.to_frame()[col_name].dtype
+        else:
+            return None
+        if dtype == np.bool_ or not issubclass(dtype.type, (np.number, np.datetime64)):
+            return None
+        return col_name
+
+    def _get_row_chunk_sizes(self, shape, chunk_size):
+        if self.row_memory_usage is None:
+            # No data selected
+            return (0,)
+        chunk_size = chunk_size or options.chunk_size
+        if chunk_size is None:
+            chunk_size = (
+                int(options.chunk_store_limit / self.row_memory_usage),
+                shape[1],
+            )
+        return normalize_chunk_sizes(shape, chunk_size)[0]
+
     @classmethod
     def _tile_offset(cls, op: "DataFrameReadSQL"):
         df = op.outputs[0]
 
-        if op.row_memory_usage is not None:
-            # Data selected
-            chunk_size = df.extra_params.raw_chunk_size or options.chunk_size
-            if chunk_size is None:
-                chunk_size = (
-                    int(options.chunk_store_limit / op.row_memory_usage),
-                    df.shape[1],
-                )
-            row_chunk_sizes = normalize_chunk_sizes(df.shape, chunk_size)[0]
-        else:
-            # No data selected
-            row_chunk_sizes = (0,)
+        row_chunk_sizes = op._get_row_chunk_sizes(
+            df.shape, df.extra_params.raw_chunk_size
+        )
         offsets = np.cumsum((0,) + row_chunk_sizes).tolist()
 
         out_chunks = []
@@ -343,25 +424,21 @@ class DataFrameReadSQL(
     def _tile_partition(cls, op: "DataFrameReadSQL"):
         df = op.outputs[0]
 
-        selectable = op._get_selectable(None)
+        engine = _get_engine(op.con, op.engine_kwargs)
+        selectable = op._get_selectable(engine)
 
         if op.low_limit is None or op.high_limit is None:
-            import sqlalchemy as sa
             from sqlalchemy import sql
 
-            engine = sa.create_engine(op.con, **(op.engine_kwargs or dict()))
-            try:
-                part_col = selectable.columns[op.partition_col]
-                range_results = engine.execute(
-                    sql.select([sql.func.min(part_col), sql.func.max(part_col)])
-                )
+            part_col = selectable.columns[op.partition_col]
+            range_results = engine.execute(
+                sql.select([sql.func.min(part_col), sql.func.max(part_col)])
+            )
 
-                op.low_limit, op.high_limit = next(range_results)
-                if op.parse_dates and op.partition_col in op.parse_dates:
-                    op.low_limit = op._parse_datetime(op.low_limit)
-                    op.high_limit = op._parse_datetime(op.high_limit)
-            finally:
-                engine.dispose()
+            op.low_limit, op.high_limit = next(range_results)
+            if op.parse_dates and op.partition_col in op.parse_dates:
+                op.low_limit = op._parse_datetime(op.low_limit)
+                op.high_limit = op._parse_datetime(op.high_limit)
 
         if isinstance(op.low_limit, (datetime.datetime, np.datetime64, pd.Timestamp)):
             seps = pd.date_range(op.low_limit, op.high_limit, op.num_partitions + 1)
@@ -417,6 +494,51 @@ class DataFrameReadSQL(
             # just skip incremental process
             return super().post_tile(op, results)
 
+    @classmethod
+    def _read_arrow_batches(cls, engine, query, op: "DataFrameReadSQL"):
+        """
+        Fetch rows of the query into arrow batches, thus strings can be
+        stored as arrow arrays without creating object arrays. None is
+        returned if rows cannot be converted into arrow arrays.
+        """
+        with engine.connect() as conn:
+            result = conn.execute(query)
+            names = list(result.keys())
+            batches = []
+            try:
+                while True:
+                    rows = result.fetchmany(_FETCH_BATCH_ROWS)
+                    if not rows:
+                        break
+                    values = lib.to_object_array_tuples(rows)
+                    arrays = [
+                        pa.array(values[:, i], from_pandas=True)
+                        for i in range(len(names))
+                    ]
+                    batches.append(pa.Table.from_arrays(arrays, names=names))
+                if not batches:
+                    return None
+                table = pa.concat_tables(batches, promote=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                return None
+
+        if op.coerce_float:
+            for i, field in enumerate(table.schema):
+                if pa.types.is_decimal(field.type):
+                    table = table.set_column(
+                        i, field.name, table.column(i).cast(pa.float64())
+                    )
+        df = arrow_table_to_pandas_dataframe(table)
+        for col in op.parse_dates or []:
+            if col not in df.columns:  # pragma: no cover
+                continue
+            args = op.parse_dates[col] if isinstance(op.parse_dates, dict) else {}
+            args = {"format": args} if isinstance(args, str) else args
+            df[col] = pd.to_datetime(df[col], **args)
+        if op.index_col:
+            df = df.set_index(op.index_col)
+        return df
+
     @classmethod
     def execute(cls, ctx, op: "DataFrameReadSQL"):
         import sqlalchemy as sa
@@ -430,53 +552,58 @@ class DataFrameReadSQL(
 
         out = op.outputs[0]
 
-        engine = sa.create_engine(op.con, **(op.engine_kwargs or dict()))
-        try:
-            selectable = op._get_selectable(engine)
-
-            columns = [selectable.columns[col] for col in op.columns]
-            column_names = set(op.columns)
-            if op.index_col:
-                for icol in op.index_col:
-                    if icol not in column_names:
-                        columns.append(selectable.columns[icol])
-
-            # convert to python timestamp in case np / pd time types not handled
-            op.low_limit = _adapt_datetime(op.low_limit)
-            op.high_limit = _adapt_datetime(op.high_limit)
-
-            query = sa.sql.select(columns)
-            if op.method == "partition":
-                part_col = selectable.columns[op.partition_col]
-                if op.left_end:
-                    query = query.where(part_col < op.high_limit)
-                elif op.right_end:
-                    query = query.where(part_col >= op.low_limit)
-                else:
-                    query = query.where(
-                        (part_col >= op.low_limit) & (part_col < op.high_limit)
-                    )
-
-            if hasattr(selectable, "primary_key") and len(selectable.primary_key) > 0:
-                # if table has primary key, sort as the order
-                query = query.order_by(*list(selectable.primary_key))
-            elif op.index_col:
-                # if no primary key, sort as the index_col
-                query = query.order_by(
-                    *[selectable.columns[col] for col in op.index_col]
-                )
+        engine = _get_engine(op.con, op.engine_kwargs)
+        selectable = op._get_selectable(engine)
+
+        columns = [selectable.columns[col] for col in op.columns]
+        column_names = set(op.columns)
+        if op.index_col:
+            for icol in op.index_col:
+                if icol not in column_names:
+                    columns.append(selectable.columns[icol])
+
+        # convert to python timestamp in case np / pd time types not handled
+        op.low_limit = _adapt_datetime(op.low_limit)
+        op.high_limit = _adapt_datetime(op.high_limit)
+
+        query = sa.sql.select(columns)
+        if op.method == "partition":
+            part_col = selectable.columns[op.partition_col]
+            if op.left_end:
+                query = query.where(part_col < op.high_limit)
+            elif op.right_end:
+                query = query.where(part_col >= op.low_limit)
             else:
-                # at last, we sort by all the columns
-                query = query.order_by(*columns)
+                query = query.where(
+                    (part_col >= op.low_limit) & (part_col < op.high_limit)
+                )
 
-            if op.method == "offset":
-                query = query.limit(out.shape[0])
-                if op.offset > 0:
-                    query = query.offset(op.offset)
+        if hasattr(selectable, "primary_key") and len(selectable.primary_key) > 0:
+            # if table has primary key, sort as the order
+            query = query.order_by(*list(selectable.primary_key))
+        elif op.index_col:
+            # if no primary key, sort as the index_col
+            query = query.order_by(*[selectable.columns[col] for col in op.index_col])
+        else:
+            # at last, we sort by all the columns
+            query = query.order_by(*columns)
 
-            if op.nrows is not None:
-                query = query.limit(op.nrows)
+        if op.method == "offset":
+            query = query.limit(out.shape[0])
+            if op.offset > 0:
+                query = query.offset(op.offset)
 
+        if op.nrows is not None:
+            query = query.limit(op.nrows)
+
+        use_arrow_dtype = op.use_arrow_dtype
+        if use_arrow_dtype is None:
+            use_arrow_dtype = options.dataframe.use_arrow_dtype
+
+        df = None
+        if use_arrow_dtype and pa is not None:
+            df = cls._read_arrow_batches(engine, query, op)
+        if df is None:
             df = pd.read_sql(
                 query,
                 engine,
@@ -484,29 +611,24 @@ class DataFrameReadSQL(
                 coerce_float=op.coerce_float,
                 parse_dates=op.parse_dates,
             )
-            if op.method == "offset" and op.index_col is None and op.offset > 0:
-                index = pd.RangeIndex(op.offset, op.offset + out.shape[0])
-                if op.nrows is not None:
-                    index = index[: op.nrows]
-                df.index = index
-
-            use_arrow_dtype = op.use_arrow_dtype
-            if use_arrow_dtype is None:
-                use_arrow_dtype = options.dataframe.use_arrow_dtype
-            if use_arrow_dtype:
-                dtypes = to_arrow_dtypes(df.dtypes, test_df=df)
-                for i in range(len(dtypes)):
-                    dtype = dtypes.iloc[i]
-                    if isinstance(dtype, ArrowStringDtype):
-                        df.iloc[:, i] = df.iloc[:, i].astype(dtype)
-
-            if out.ndim == 2:
-                ctx[out.key] = df
-            else:
-                # this happens when column pruning results in one single series
-                ctx[out.key] = df.iloc[:, 0]
-        finally:
-            engine.dispose()
+        if op.method == "offset" and op.index_col is None and op.offset > 0:
+            index = pd.RangeIndex(op.offset, op.offset + out.shape[0])
+            if op.nrows is not None:
+                index = index[: op.nrows]
+            df.index = index
+
+        if use_arrow_dtype:
+            dtypes = to_arrow_dtypes(df.dtypes, test_df=df)
+            for i in range(len(dtypes)):
+                dtype = dtypes.iloc[i]
+                if isinstance(dtype, ArrowStringDtype):
+                    df.iloc[:, i] = df.iloc[:, i].astype(dtype)
+
+        if out.ndim == 2:
+            ctx[out.key] = df
+        else:
+            # this happens when column pruning results in one single series
+            ctx[out.key] = df.iloc[:, 0]
 
     @classmethod
     def post_execute(cls, ctx: Union[dict, Context], op: OperandType):
@@ -538,7 +660,7 @@ def _read_sql(
 ):
     if chunksize is not None:
         raise NotImplementedError("read_sql_query with chunksize not supported")
-    method = "offset" if partition_col is None else "partition"
+    method = "auto" if partition_col is None else "partition"
 
     op = DataFrameReadSQL(
         table_or_sql=table_or_sql,
@@ -643,11 +765,13 @@ def read_sql(
         specified, the range ``[low_limit, high_limit]`` will be divided
         into ``n_partitions`` chunks with equal lengths. We do not
         guarantee the sizes of chunks be equal. When the value is None,
-        ``OFFSET`` and ``LIMIT`` clauses will be used to cut the result
-        of the query.
+        the table will be split by the range of its primary key if it
+        is a single numeric or datetime column, otherwise ``OFFSET``
+        and ``LIMIT`` clauses will be used to cut the result of the query.
     num_partitions : int, default None
         The number of chunks to divide the result of the query into,
-        when ``partition_col`` is specified.
+        when ``partition_col`` is specified. If not specified, it is
+        decided by the number of rows and ``chunk_size``.
     low_limit : default None
         The lower bound of the range of column ``partition_col``. If not
         specified, a query will be executed to query the minimum of
@@ -758,11 +882,13 @@ def read_sql_table(
         specified, the range ``[low_limit, high_limit]`` will be divided
         into ``n_partitions`` chunks with equal lengths. We do not
         guarantee the sizes of chunks be equal. When the value is None,
-        ``OFFSET`` and ``LIMIT`` clauses will be used to cut the result
-        of the query.
+        the table will be split by the range of its primary key if it
+        is a single numeric or datetime column, otherwise ``OFFSET``
+        and ``LIMIT`` clauses will be used to cut the result of the query.
     num_partitions : int, default None
         The number of chunks to divide the result of the query into,
-        when ``partition_col`` is specified.
+        when ``partition_col`` is specified. If not specified, it is
+        decided by the number of rows and ``chunk_size``.
     low_limit : default None
         The lower bound of the range of column ``partition_col``. If not
         specified, a query will be executed to query the minimum of
@@ -888,11 +1014,13 @@ def read_sql_query(
         specified, the range ``[low_limit, high_limit]`` will be divided
         into ``n_partitions`` chunks with equal lengths. We do not
         guarantee the sizes of chunks be equal. When the value is None,
-        ``OFFSET`` and ``LIMIT`` clauses will be used to cut the result
-        of the query.
+        the table will be split by the range of its primary key if it
+        is a single numeric or datetime column, otherwise ``OFFSET``
+        and ``LIMIT`` clauses will be used to cut the result of the query.
     num_partitions : int, default None
         The number of chunks to divide the result of the query into,
-        when ``partition_col`` is specified.
+        when ``partition_col`` is specified. If not specified, it is
+        decided by the number of rows and ``chunk_size``.
     low_limit : default None
         The lower bound of the range of column ``partition_col``. If not
         specified, a query will be executed to query the minimum of
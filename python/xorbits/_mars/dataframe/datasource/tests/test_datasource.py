@@ -511,6 +511,33 @@ def test_read_sql():
             assert isinstance(c.op, DataFrameReadSQL)
             assert c.op.offset is not None
 
+        # tables with primary keys are split by ranges of keys
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(uri)
+        try:
+            m = sa.MetaData()
+            sa.Table(
+                "test_pk",
+                m,
+                sa.Column("id", sa.Integer, primary_key=True),
+                sa.Column("b", sa.String),
+            )
+            m.create_all(engine)
+            test_df.rename(columns={"a": "id"}).to_sql(
+                "test_pk", engine, index=False, if_exists="append"
+            )
+        finally:
+            engine.dispose()
+
+        df = read_sql_table("test_pk", uri, chunk_size=4)
+        assert np.isnan(df.shape[0])
+        df = tile(df)
+        assert len(df.chunks) == 3
+        for c in df.chunks:
+            assert c.op.method == "partition"
+            assert c.op.partition_col == "id"
+
         with pytest.raises(NotImplementedError):
             read_sql_table(table_name, uri, chunksize=4, index_col=b"a")
         with pytest.raises(TypeError):
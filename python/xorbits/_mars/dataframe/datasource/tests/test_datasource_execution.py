@@ -42,6 +42,7 @@ except ImportError:  # pragma: no cover
 from .... import dataframe as md
 from .... import tensor as mt
 from ....config import option_context
+from ....core import tile
 from ....tests.core import require_cudf, require_ray
 from ....utils import arrow_array_to_objects, lazy_import, pd_release_version
 from ...utils import ray_deprecate_ml_dataset
@@ -51,6 +52,7 @@ from ..from_tensor import dataframe_from_1d_tileables, dataframe_from_tensor
 from ..index import from_pandas as from_pandas_index
 from ..index import from_tileable
 from ..series import from_pandas as from_pandas_series
+from ..tpch import BLOCK_ROWS, gen_tpch, generate_tpch_blocks
 
 ray = lazy_import("ray")
 _date_range_use_inclusive = pd_release_version[:2] >= (1, 4)
@@ -755,6 +757,68 @@ def test_read_csv_use_arrow_dtype(setup):
         pd.testing.assert_frame_equal(arrow_array_to_objects(result), pdf)
 
 
+@pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+def test_read_csv_pyarrow_engine(setup):
+    rs = np.random.RandomState(0)
+    df = pd.DataFrame(
+        {
+            "col1": rs.rand(100),
+            "col2": rs.choice(["a" * 2, "b" * 3, "c" * 4, ""], (100,)),
+            "col3": np.arange(100),
+            "col4": rs.rand(100) > 0.5,
+        }
+    )
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = os.path.join(tempdir, "test.csv")
+        df.to_csv(file_path, index=False)
+
+        pdf = pd.read_csv(file_path)
+        mdf = md.read_csv(
+            file_path, engine="pyarrow", chunk_bytes=200, merge_small_files=False
+        )
+        chunk_ops = [c.op for c in tile(mdf).chunks]
+        assert all(op.estimated_row_num > 0 for op in chunk_ops)
+        assert sum(op.estimated_row_num for op in chunk_ops) >= len(df)
+        result = mdf.execute().fetch()
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), pdf)
+
+        # test column pruning
+        mdf = md.read_csv(file_path, engine="pyarrow", chunk_bytes=200)
+        result = mdf[["col3", "col1"]].execute().fetch()
+        pd.testing.assert_frame_equal(
+            result.reset_index(drop=True), pdf[["col3", "col1"]]
+        )
+
+        # test index_col and head
+        pdf = pd.read_csv(file_path, index_col=0)
+        mdf = md.read_csv(file_path, engine="pyarrow", index_col=0, chunk_bytes=200)
+        pd.testing.assert_frame_equal(mdf.execute().fetch(), pdf)
+        pd.testing.assert_frame_equal(mdf.head(3).execute().fetch(), pdf.head(3))
+
+        # test arrow dtype
+        pdf = pd.read_csv(file_path, keep_default_na=False)
+        mdf = md.read_csv(
+            file_path, engine="pyarrow", use_arrow_dtype=True, chunk_bytes=200
+        )
+        result = mdf.execute().fetch()
+        assert isinstance(result.dtypes.iloc[1], md.ArrowStringDtype)
+        pd.testing.assert_frame_equal(
+            arrow_array_to_objects(result).reset_index(drop=True), pdf
+        )
+
+        with pytest.raises(ValueError):
+            md.read_csv(file_path, engine="pyarrow", na_values=["a"])
+
+    # test compression
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = os.path.join(tempdir, "test.gzip")
+        df.to_csv(file_path, compression="gzip", index=False)
+
+        pdf = pd.read_csv(file_path, compression="gzip")
+        mdf = md.read_csv(file_path, engine="pyarrow", compression="gzip")
+        pd.testing.assert_frame_equal(mdf.execute().fetch(), pdf)
+
+
 @require_cudf
 def test_read_csv_gpu_execution(setup_gpu):
     with tempfile.TemporaryDirectory() as tempdir:
@@ -974,6 +1038,61 @@ def test_read_sql_execution(setup):
             engine.dispose()
 
 
+@pytest.mark.skipif(sqlalchemy is None, reason="sqlalchemy not installed")
+def test_read_sql_auto_partition(setup):
+    import sqlalchemy as sa
+
+    rs = np.random.RandomState(0)
+    # keys are not evenly distributed
+    ids = np.sort(rs.choice(10000, size=100, replace=False)) ** 2
+    test_df = pd.DataFrame(
+        {
+            "id": ids,
+            "a": rs.randint(0, 10, size=100),
+            "b": [f"s{i}" if i % 7 != 0 else None for i in range(100)],
+            "c": rs.rand(100),
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as d:
+        uri = "sqlite:///" + os.path.join(d, "test.db")
+        engine = sa.create_engine(uri)
+        try:
+            m = sa.MetaData()
+            sa.Table(
+                "test",
+                m,
+                sa.Column("id", sa.BigInteger, primary_key=True),
+                sa.Column("a", sa.Integer),
+                sa.Column("b", sa.String),
+                sa.Column("c", sa.Float),
+            )
+            m.create_all(engine)
+            test_df.sample(frac=1, random_state=rs).to_sql(
+                "test", engine, index=False, if_exists="append"
+            )
+        finally:
+            engine.dispose()
+
+        r = md.read_sql_table("test", uri, chunk_size=10)
+        result = r.execute().fetch()
+        pd.testing.assert_frame_equal(result, test_df)
+
+        r = md.read_sql_table("test", uri, chunk_size=10, index_col="id")
+        result = r.execute().fetch()
+        pd.testing.assert_frame_equal(result, test_df.set_index("id"))
+
+        r = md.read_sql_table("test", uri, chunk_size=30, columns=["b", "c"])
+        result = r.execute().fetch()
+        pd.testing.assert_frame_equal(result, test_df[["b", "c"]])
+
+        if pa is not None:
+            r = md.read_sql_table("test", uri, chunk_size=10, use_arrow_dtype=True)
+            result = r.execute().fetch()
+            assert isinstance(result.dtypes.iloc[2], md.ArrowStringDtype)
+            pd.testing.assert_frame_equal(arrow_array_to_objects(result), test_df)
+
+
 @pytest.mark.skipif(pa is None, reason="pyarrow not installed")
 def test_read_sql_use_arrow_dtype(setup):
     rs = np.random.RandomState(0)
@@ -1124,6 +1243,61 @@ if fastparquet is not None:
     parquet_engines.append("fastparquet")
 
 
+def test_gen_tpch_execution(setup):
+    with pytest.raises(ValueError):
+        gen_tpch("unknown")
+    with pytest.raises(ValueError):
+        gen_tpch("orders", scale_factor=0)
+
+    region = gen_tpch("region").execute().fetch()
+    assert region["R_NAME"].tolist() == [
+        "AFRICA",
+        "AMERICA",
+        "ASIA",
+        "EUROPE",
+        "MIDDLE EAST",
+    ]
+
+    # data does not depend on chunk sizes
+    orders = gen_tpch("orders", scale_factor=0.02, seed=1, chunk_size=BLOCK_ROWS)
+    assert len(tile(orders).chunks) == 3
+    result = gen_tpch("orders", scale_factor=0.02, seed=1).execute().fetch()
+    expected = generate_tpch_blocks("orders", 0.02, 1, 0, 3)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["O_ORDERKEY"].is_unique
+    assert (result["O_CUSTKEY"] % 3 != 0).all()
+
+    result = orders.execute().fetch()
+    pd.testing.assert_frame_equal(result, expected)
+
+    # different seeds generate different data
+    other = gen_tpch("orders", scale_factor=0.02, seed=2).execute().fetch()
+    assert not other["O_TOTALPRICE"].equals(result["O_TOTALPRICE"])
+
+    # lineitem agrees with orders
+    lineitem = gen_tpch("lineitem", scale_factor=0.02, seed=1, chunk_size=BLOCK_ROWS)
+    lineitem = lineitem.execute().fetch()
+    assert set(lineitem["L_ORDERKEY"]) == set(result["O_ORDERKEY"])
+    joined = lineitem.merge(result, left_on="L_ORDERKEY", right_on="O_ORDERKEY")
+    assert (joined["L_SHIPDATE"] > joined["O_ORDERDATE"]).all()
+    total_prices = (
+        (joined.L_EXTENDEDPRICE * (1 + joined.L_TAX) * (1 - joined.L_DISCOUNT))
+        .groupby(joined.L_ORDERKEY)
+        .sum()
+    )
+    np.testing.assert_allclose(
+        total_prices.values,
+        result.set_index("O_ORDERKEY")["O_TOTALPRICE"].loc[total_prices.index],
+        atol=0.01,
+    )
+
+    # every lineitem has a matched partsupp
+    partsupp = gen_tpch("partsupp", scale_factor=0.02, seed=1).execute().fetch()
+    assert partsupp.shape == (16000, 5)
+    pairs = set(zip(partsupp["PS_PARTKEY"], partsupp["PS_SUPPKEY"]))
+    assert all(p in pairs for p in zip(lineitem["L_PARTKEY"], lineitem["L_SUPPKEY"]))
+
+
 @pytest.mark.skipif(
     len(parquet_engines) == 1, reason="pyarrow and fastparquet are not installed"
 )
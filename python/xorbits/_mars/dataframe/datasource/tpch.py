@@ -0,0 +1,692 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deterministic TPC-H data generator.
+
+Every table is generated in blocks of ``BLOCK_ROWS`` rows of its driving
+table, and each block draws from its own random stream derived from
+``(seed, table, block)``. Chunks always cover whole blocks, so the generated
+data only depends on the seed and the scale factor, never on the chunk size
+or on the worker which generates it. Values follow the distributions of the
+TPC-H specification closely enough for q01-q22 to produce meaningful results,
+but are not byte-identical to ``dbgen`` output.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ... import opcodes as OperandDef
+from ...config import options
+from ...core import OutputType
+from ...core.operand import OperatorLogicKeyGeneratorMixin
+from ...serialization.serializables import Float64Field, Int64Field, StringField
+from ..operands import DataFrameOperand, DataFrameOperandMixin
+from ..utils import parse_index
+
+BLOCK_ROWS = 10_000
+
+_START_DATE = np.datetime64("1992-01-01")
+_CURRENT_DATE = np.datetime64("1995-06-17")
+_END_DATE = np.datetime64("1998-12-31")
+
+_REGIONS = ["AFRICA", "AMERICA", "ASIA", "EUROPE", "MIDDLE EAST"]
+_NATIONS = [
+    ("ALGERIA", 0),
+    ("ARGENTINA", 1),
+    ("BRAZIL", 1),
+    ("CANADA", 1),
+    ("EGYPT", 4),
+    ("ETHIOPIA", 0),
+    ("FRANCE", 3),
+    ("GERMANY", 3),
+    ("INDIA", 2),
+    ("INDONESIA", 2),
+    ("IRAN", 4),
+    ("IRAQ", 4),
+    ("JAPAN", 2),
+    ("JORDAN", 4),
+    ("KENYA", 0),
+    ("MOROCCO", 0),
+    ("MOZAMBIQUE", 0),
+    ("PERU", 1),
+    ("CHINA", 2),
+    ("ROMANIA", 3),
+    ("SAUDI ARABIA", 4),
+    ("VIETNAM", 2),
+    ("RUSSIA", 3),
+    ("UNITED KINGDOM", 3),
+    ("UNITED STATES", 1),
+]
+_COLORS = (
+    "almond antique aquamarine azure beige bisque black blanched blue blush "
+    "brown burlywood burnished chartreuse chiffon chocolate coral cornflower "
+    "cornsilk cream cyan dark deep dim dodger drab firebrick floral forest "
+    "frosted gainsboro ghost goldenrod green grey honeydew hot indian ivory "
+    "khaki lace lavender lawn lemon light lime linen magenta maroon medium "
+    "metallic midnight mint misty moccasin navajo navy olive orange orchid "
+    "pale papaya peach peru pink plum powder puff purple red rose rosy royal "
+    "saddle salmon sandy seashell sienna sky slate smoke snow spring steel "
+    "tan thistle tomato turquoise violet wheat white yellow"
+).split()
+_TYPE_SYLLABLES = (
+    ["STANDARD", "SMALL", "MEDIUM", "LARGE", "ECONOMY", "PROMO"],
+    ["ANODIZED", "BURNISHED", "PLATED", "POLISHED", "BRUSHED"],
+    ["TIN", "NICKEL", "BRASS", "STEEL", "COPPER"],
+)
+_CONTAINER_SYLLABLES = (
+    ["SM", "LG", "MED", "JUMBO", "WRAP"],
+    ["CASE", "BOX", "BAG", "JAR", "PKG", "PACK", "CAN", "DRUM"],
+)
+_SEGMENTS = ["AUTOMOBILE", "BUILDING", "FURNITURE", "MACHINERY", "HOUSEHOLD"]
+_PRIORITIES = ["1-URGENT", "2-HIGH", "3-MEDIUM", "4-NOT SPECIFIED", "5-LOW"]
+_INSTRUCTIONS = ["DELIVER IN PERSON", "COLLECT COD", "NONE", "TAKE BACK RETURN"]
+_MODES = ["REG AIR", "AIR", "RAIL", "SHIP", "TRUCK", "MAIL", "FOB"]
+_WORDS = (
+    "furiously quickly carefully blithely slyly fluffily ironically daringly "
+    "special regular final pending express ironic bold even silent unusual "
+    "requests deposits accounts packages theodolites pinto beans foxes ideas "
+    "instructions dependencies excuses platelets asymptotes courts dolphins "
+    "multipliers warthogs frets dinos attainments somas patterns forges braids "
+    "sleep wake are cajole haggle nag use boost affix detect integrate "
+    "maintain nod was lose sublate solve thrash promise engage hinder print "
+    "above across after against along among around at before behind beneath "
+    "beside between beyond by despite during for from inside into near of on "
+    "outside over past since through to toward under until upon with without"
+).split()
+_ADDRESS_CHARS = np.array(
+    list("0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ,")
+)
+_COMMENT_POOL_SIZE = 1024
+
+# base number of rows of every table when scale factor is 1, lineitem
+# is driven by orders and partsupp by part
+_TABLE_BASE_ROWS = {
+    "region": 5,
+    "nation": 25,
+    "supplier": 10_000,
+    "customer": 150_000,
+    "part": 200_000,
+    "partsupp": 200_000,
+    "orders": 1_500_000,
+    "lineitem": 1_500_000,
+}
+# rows generated by one driving row
+_TABLE_ROW_MULTIPLIERS = {"partsupp": 4, "lineitem": 4}
+# rough memory usage of one row, used to decide chunk sizes
+_TABLE_ROW_MEMORY = {
+    "region": 150,
+    "nation": 200,
+    "supplier": 400,
+    "customer": 450,
+    "part": 400,
+    "partsupp": 250,
+    "orders": 350,
+    "lineitem": 400,
+}
+_TABLE_IDS = {name: i for i, name in enumerate(_TABLE_BASE_ROWS)}
+
+_DATE_TYPE = np.dtype("datetime64[ns]")
+_OBJECT_TYPE = np.dtype(object)
+_INT_TYPE = np.dtype(np.int64)
+_FLOAT_TYPE = np.dtype(np.float64)
+
+_TABLE_SCHEMAS = {
+    "region": {
+        "R_REGIONKEY": _INT_TYPE,
+        "R_NAME": _OBJECT_TYPE,
+        "R_COMMENT": _OBJECT_TYPE,
+    },
+    "nation": {
+        "N_NATIONKEY": _INT_TYPE,
+        "N_NAME": _OBJECT_TYPE,
+        "N_REGIONKEY": _INT_TYPE,
+        "N_COMMENT": _OBJECT_TYPE,
+    },
+    "supplier": {
+        "S_SUPPKEY": _INT_TYPE,
+        "S_NAME": _OBJECT_TYPE,
+        "S_ADDRESS": _OBJECT_TYPE,
+        "S_NATIONKEY": _INT_TYPE,
+        "S_PHONE": _OBJECT_TYPE,
+        "S_ACCTBAL": _FLOAT_TYPE,
+        "S_COMMENT": _OBJECT_TYPE,
+    },
+    "customer": {
+        "C_CUSTKEY": _INT_TYPE,
+        "C_NAME": _OBJECT_TYPE,
+        "C_ADDRESS": _OBJECT_TYPE,
+        "C_NATIONKEY": _INT_TYPE,
+        "C_PHONE": _OBJECT_TYPE,
+        "C_ACCTBAL": _FLOAT_TYPE,
+        "C_MKTSEGMENT": _OBJECT_TYPE,
+        "C_COMMENT": _OBJECT_TYPE,
+    },
+    "part": {
+        "P_PARTKEY": _INT_TYPE,
+        "P_NAME": _OBJECT_TYPE,
+        "P_MFGR": _OBJECT_TYPE,
+        "P_BRAND": _OBJECT_TYPE,
+        "P_TYPE": _OBJECT_TYPE,
+        "P_SIZE": _INT_TYPE,
+        "P_CONTAINER": _OBJECT_TYPE,
+        "P_RETAILPRICE": _FLOAT_TYPE,
+        "P_COMMENT": _OBJECT_TYPE,
+    },
+    "partsupp": {
+        "PS_PARTKEY": _INT_TYPE,
+        "PS_SUPPKEY": _INT_TYPE,
+        "PS_AVAILQTY": _INT_TYPE,
+        "PS_SUPPLYCOST": _FLOAT_TYPE,
+        "PS_COMMENT": _OBJECT_TYPE,
+    },
+    "orders": {
+        "O_ORDERKEY": _INT_TYPE,
+        "O_CUSTKEY": _INT_TYPE,
+        "O_ORDERSTATUS": _OBJECT_TYPE,
+        "O_TOTALPRICE": _FLOAT_TYPE,
+        "O_ORDERDATE": _DATE_TYPE,
+        "O_ORDERPRIORITY": _OBJECT_TYPE,
+        "O_CLERK": _OBJECT_TYPE,
+        "O_SHIPPRIORITY": _INT_TYPE,
+        "O_COMMENT": _OBJECT_TYPE,
+    },
+    "lineitem": {
+        "L_ORDERKEY": _INT_TYPE,
+        "L_PARTKEY": _INT_TYPE,
+        "L_SUPPKEY": _INT_TYPE,
+        "L_LINENUMBER": _INT_TYPE,
+        "L_QUANTITY": _FLOAT_TYPE,
+        "L_EXTENDEDPRICE": _FLOAT_TYPE,
+        "L_DISCOUNT": _FLOAT_TYPE,
+        "L_TAX": _FLOAT_TYPE,
+        "L_RETURNFLAG": _OBJECT_TYPE,
+        "L_LINESTATUS": _OBJECT_TYPE,
+        "L_SHIPDATE": _DATE_TYPE,
+        "L_COMMITDATE": _DATE_TYPE,
+        "L_RECEIPTDATE": _DATE_TYPE,
+        "L_SHIPINSTRUCT": _OBJECT_TYPE,
+        "L_SHIPMODE": _OBJECT_TYPE,
+        "L_COMMENT": _OBJECT_TYPE,
+    },
+}
+
+TPCH_TABLES = list(_TABLE_SCHEMAS)
+
+
+def get_table_driving_rows(table: str, scale_factor: float) -> int:
+    """Number of rows of the table which drives the generation of `table`."""
+    base_rows = _TABLE_BASE_ROWS[table]
+    if table in ("region", "nation"):
+        return base_rows
+    return max(int(base_rows * scale_factor), 1)
+
+
+def _get_rng(seed: int, table: str, block: int, stream: int = 0):
+    return np.random.default_rng([seed, _TABLE_IDS[table], block, stream])
+
+
+def _gen_comments(rng: np.random.Generator, n: int, min_words=2, max_words=12):
+    # comments are drawn from a small random pool to keep generation vectorized
+    pool = np.empty(_COMMENT_POOL_SIZE, dtype=object)
+    lengths = rng.integers(min_words, max_words + 1, size=_COMMENT_POOL_SIZE)
+    words = rng.choice(_WORDS, size=(_COMMENT_POOL_SIZE, max_words))
+    for i, (length, row) in enumerate(zip(lengths, words)):
+        pool[i] = " ".join(row[:length])
+    return pool[rng.integers(0, _COMMENT_POOL_SIZE, size=n)]
+
+
+def _gen_addresses(rng: np.random.Generator, n: int):
+    pool = np.empty(_COMMENT_POOL_SIZE, dtype=object)
+    lengths = rng.integers(10, 41, size=_COMMENT_POOL_SIZE)
+    chars = rng.choice(_ADDRESS_CHARS, size=(_COMMENT_POOL_SIZE, 40))
+    for i, (length, row) in enumerate(zip(lengths, chars)):
+        pool[i] = "".join(row[:length])
+    return pool[rng.integers(0, _COMMENT_POOL_SIZE, size=n)]
+
+
+def _gen_phones(rng: np.random.Generator, nation_keys: np.ndarray):
+    parts = rng.integers(
+        [100, 100, 1000], [1000, 1000, 10000], size=(len(nation_keys), 3)
+    )
+    return np.array(
+        [
+            f"{nation + 10}-{a}-{b}-{c}"
+            for nation, (a, b, c) in zip(nation_keys.tolist(), parts.tolist())
+        ],
+        dtype=object,
+    )
+
+
+def _gen_money(rng: np.random.Generator, low: float, high: float, n: int):
+    return rng.integers(int(low * 100), int(high * 100) + 1, size=n) / 100.0
+
+
+def _format_keys(prefix: str, keys: np.ndarray):
+    return np.array([f"{prefix}#{k:09d}" for k in keys.tolist()], dtype=object)
+
+
+def _retail_price(part_keys: np.ndarray):
+    return (90000 + ((part_keys // 10) % 20001) + 100 * (part_keys % 1000)) / 100.0
+
+
+def _part_supplier(part_keys: np.ndarray, index: np.ndarray, n_supplier: int):
+    return (
+        part_keys + index * (n_supplier // 4 + (part_keys - 1) // n_supplier)
+    ) % n_supplier + 1
+
+
+def _gen_region(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "region", block)
+    return {
+        "R_REGIONKEY": np.arange(len(_REGIONS)),
+        "R_NAME": np.array(_REGIONS, dtype=object),
+        "R_COMMENT": _gen_comments(rng, len(_REGIONS)),
+    }
+
+
+def _gen_nation(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "nation", block)
+    return {
+        "N_NATIONKEY": np.arange(len(_NATIONS)),
+        "N_NAME": np.array([name for name, _ in _NATIONS], dtype=object),
+        "N_REGIONKEY": np.array([region for _, region in _NATIONS]),
+        "N_COMMENT": _gen_comments(rng, len(_NATIONS)),
+    }
+
+
+def _block_keys(table: str, scale_factor: float, block: int) -> np.ndarray:
+    n_rows = get_table_driving_rows(table, scale_factor)
+    start = block * BLOCK_ROWS
+    return np.arange(start + 1, min(start + BLOCK_ROWS, n_rows) + 1)
+
+
+def _gen_supplier(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "supplier", block)
+    keys = _block_keys("supplier", scale_factor, block)
+    n = len(keys)
+    nation_keys = rng.integers(0, len(_NATIONS), size=n)
+    comments = _gen_comments(rng, n)
+    # a few suppliers have complaints from customers, see q16
+    complaints = rng.random(n) < 0.0005
+    comments[complaints] = [
+        f"{c} Customer carefully Complaints" for c in comments[complaints]
+    ]
+    return {
+        "S_SUPPKEY": keys,
+        "S_NAME": _format_keys("Supplier", keys),
+        "S_ADDRESS": _gen_addresses(rng, n),
+        "S_NATIONKEY": nation_keys,
+        "S_PHONE": _gen_phones(rng, nation_keys),
+        "S_ACCTBAL": _gen_money(rng, -999.99, 9999.99, n),
+        "S_COMMENT": comments,
+    }
+
+
+def _gen_customer(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "customer", block)
+    keys = _block_keys("customer", scale_factor, block)
+    n = len(keys)
+    nation_keys = rng.integers(0, len(_NATIONS), size=n)
+    return {
+        "C_CUSTKEY": keys,
+        "C_NAME": _format_keys("Customer", keys),
+        "C_ADDRESS": _gen_addresses(rng, n),
+        "C_NATIONKEY": nation_keys,
+        "C_PHONE": _gen_phones(rng, nation_keys),
+        "C_ACCTBAL": _gen_money(rng, -999.99, 9999.99, n),
+        "C_MKTSEGMENT": np.array(_SEGMENTS, dtype=object)[
+            rng.integers(0, len(_SEGMENTS), size=n)
+        ],
+        "C_COMMENT": _gen_comments(rng, n),
+    }
+
+
+def _gen_part(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "part", block)
+    keys = _block_keys("part", scale_factor, block)
+    n = len(keys)
+    colors = np.array(_COLORS, dtype=object)
+    name_indices = np.argsort(rng.random((n, len(_COLORS))), axis=1)[:, :5]
+    mfgr = rng.integers(1, 6, size=n)
+    brand = mfgr * 10 + rng.integers(1, 6, size=n)
+    types = np.array(
+        [" ".join(t) for t in np.array(np.meshgrid(*_TYPE_SYLLABLES)).T.reshape(-1, 3)],
+        dtype=object,
+    )
+    containers = np.array(
+        [
+            " ".join(c)
+            for c in np.array(np.meshgrid(*_CONTAINER_SYLLABLES)).T.reshape(-1, 2)
+        ],
+        dtype=object,
+    )
+    return {
+        "P_PARTKEY": keys,
+        "P_NAME": np.array([" ".join(r) for r in colors[name_indices]], dtype=object),
+        "P_MFGR": np.array([f"Manufacturer#{m}" for m in mfgr.tolist()], dtype=object),
+        "P_BRAND": np.array([f"Brand#{b}" for b in brand.tolist()], dtype=object),
+        "P_TYPE": types[rng.integers(0, len(types), size=n)],
+        "P_SIZE": rng.integers(1, 51, size=n),
+        "P_CONTAINER": containers[rng.integers(0, len(containers), size=n)],
+        "P_RETAILPRICE": _retail_price(keys),
+        "P_COMMENT": _gen_comments(rng, n, max_words=4),
+    }
+
+
+def _gen_partsupp(seed: int, scale_factor: float, block: int) -> Dict:
+    rng = _get_rng(seed, "partsupp", block)
+    part_keys = np.repeat(_block_keys("partsupp", scale_factor, block), 4)
+    n = len(part_keys)
+    n_supplier = get_table_driving_rows("supplier", scale_factor)
+    supplier_index = np.tile(np.arange(4), n // 4)
+    return {
+        "PS_PARTKEY": part_keys,
+        "PS_SUPPKEY": _part_supplier(part_keys, supplier_index, n_supplier),
+        "PS_AVAILQTY": rng.integers(1, 10000, size=n),
+        "PS_SUPPLYCOST": _gen_money(rng, 1.0, 1000.0, n),
+        "PS_COMMENT": _gen_comments(rng, n),
+    }
+
+
+def _gen_orders_and_lineitem(seed: int, scale_factor: float, block: int):
+    # orders and lineitem share the same random stream, thus both tables
+    # agree on order dates and total prices without any communication
+    rng = _get_rng(seed, "orders", block)
+    order_keys = _block_keys("orders", scale_factor, block)
+    n_order = len(order_keys)
+    n_customer = get_table_driving_rows("customer", scale_factor)
+    n_part = get_table_driving_rows("part", scale_factor)
+    n_supplier = get_table_driving_rows("supplier", scale_factor)
+    n_clerk = max(int(1000 * scale_factor), 1)
+
+    # customers whose keys are multiples of 3 never place orders, see q13 and q22
+    cust_keys = rng.integers(1, n_customer + 1, size=n_order)
+    invalid = cust_keys % 3 == 0
+    cust_keys[invalid] = np.where(
+        cust_keys[invalid] < n_customer, cust_keys[invalid] + 1, cust_keys[invalid] - 1
+    )
+    cust_keys = np.maximum(cust_keys, 1)
+    order_days = (_END_DATE - _START_DATE).astype(int) - 151
+    order_dates = _START_DATE + rng.integers(0, order_days + 1, size=n_order)
+
+    n_lines = rng.integers(1, 8, size=n_order)
+    n_item = int(n_lines.sum())
+    item_order_pos = np.repeat(np.arange(n_order), n_lines)
+    line_numbers = np.arange(n_item) - np.repeat(np.cumsum(n_lines) - n_lines, n_lines)
+    item_order_dates = order_dates[item_order_pos]
+    part_keys = rng.integers(1, n_part + 1, size=n_item)
+    quantities = rng.integers(1, 51, size=n_item).astype(np.float64)
+    discounts = rng.integers(0, 11, size=n_item) / 100.0
+    taxes = rng.integers(0, 9, size=n_item) / 100.0
+    ship_dates = item_order_dates + rng.integers(1, 122, size=n_item)
+    commit_dates = item_order_dates + rng.integers(30, 91, size=n_item)
+    receipt_dates = ship_dates + rng.integers(1, 31, size=n_item)
+    extended_prices = np.round(quantities * _retail_price(part_keys), 2)
+    return_flags = np.where(
+        receipt_dates <= _CURRENT_DATE,
+        np.where(rng.random(n_item) < 0.5, "R", "A"),
+        "N",
+    ).astype(object)
+    shipped = ship_dates <= _CURRENT_DATE
+    line_status = np.where(shipped, "F", "O").astype(object)
+
+    total_prices = np.bincount(
+        item_order_pos,
+        weights=extended_prices * (1 + taxes) * (1 - discounts),
+        minlength=n_order,
+    )
+    n_shipped = np.bincount(
+        item_order_pos, weights=shipped.astype(np.float64), minlength=n_order
+    )
+    order_status = np.where(
+        n_shipped == n_lines, "F", np.where(n_shipped == 0, "O", "P")
+    ).astype(object)
+
+    orders = {
+        "O_ORDERKEY": order_keys,
+        "O_CUSTKEY": cust_keys,
+        "O_ORDERSTATUS": order_status,
+        "O_TOTALPRICE": np.round(total_prices, 2),
+        "O_ORDERDATE": order_dates.astype(_DATE_TYPE),
+        "O_ORDERPRIORITY": np.array(_PRIORITIES, dtype=object)[
+            rng.integers(0, len(_PRIORITIES), size=n_order)
+        ],
+        "O_CLERK": _format_keys("Clerk", rng.integers(1, n_clerk + 1, size=n_order)),
+        "O_SHIPPRIORITY": np.zeros(n_order, dtype=np.int64),
+        "O_COMMENT": _gen_comments(rng, n_order),
+    }
+    lineitem = {
+        "L_ORDERKEY": order_keys[item_order_pos],
+        "L_PARTKEY": part_keys,
+        "L_SUPPKEY": _part_supplier(
+            part_keys, rng.integers(0, 4, size=n_item), n_supplier
+        ),
+        "L_LINENUMBER": line_numbers + 1,
+        "L_QUANTITY": quantities,
+        "L_EXTENDEDPRICE": extended_prices,
+        "L_DISCOUNT": discounts,
+        "L_TAX": taxes,
+        "L_RETURNFLAG": return_flags,
+        "L_LINESTATUS": line_status,
+        "L_SHIPDATE": ship_dates.astype(_DATE_TYPE),
+        "L_COMMITDATE": commit_dates.astype(_DATE_TYPE),
+        "L_RECEIPTDATE": receipt_dates.astype(_DATE_TYPE),
+        "L_SHIPINSTRUCT": np.array(_INSTRUCTIONS, dtype=object)[
+            rng.integers(0, len(_INSTRUCTIONS), size=n_item)
+        ],
+        "L_SHIPMODE": np.array(_MODES, dtype=object)[
+            rng.integers(0, len(_MODES), size=n_item)
+        ],
+        "L_COMMENT": _gen_comments(rng, n_item, max_words=5),
+    }
+    return orders, lineitem
+
+
+def _gen_orders(seed: int, scale_factor: float, block: int) -> Dict:
+    return _gen_orders_and_lineitem(seed, scale_factor, block)[0]
+
+
+def _gen_lineitem(seed: int, scale_factor: float, block: int) -> Dict:
+    return _gen_orders_and_lineitem(seed, scale_factor, block)[1]
+
+
+_TABLE_GENERATORS = {
+    "region": _gen_region,
+    "nation": _gen_nation,
+    "supplier": _gen_supplier,
+    "customer": _gen_customer,
+    "part": _gen_part,
+    "partsupp": _gen_partsupp,
+    "orders": _gen_orders,
+    "lineitem": _gen_lineitem,
+}
+
+
+def generate_tpch_blocks(
+    table: str, scale_factor: float, seed: int, start_block: int, end_block: int
+) -> pd.DataFrame:
+    """
+    Generate rows of blocks in ``[start_block, end_block)`` of a TPC-H table.
+    """
+    schema = _TABLE_SCHEMAS[table]
+    gen = _TABLE_GENERATORS[table]
+    blocks = [gen(seed, scale_factor, block) for block in range(start_block, end_block)]
+    data = dict()
+    for col, dtype in schema.items():
+        values = [b[col] for b in blocks]
+        data[col] = np.concatenate(values) if values else np.empty(0, dtype=dtype)
+    return pd.DataFrame(data, columns=list(schema)).astype(schema, copy=False)
+
+
+class DataFrameGenTPCHLogicKeyGenerator(OperatorLogicKeyGeneratorMixin):
+    def _get_logic_key_token_values(self):
+        return super()._get_logic_key_token_values() + [
+            self.table,
+            self.scale_factor,
+            self.seed,
+        ]
+
+
+class DataFrameGenTPCH(
+    DataFrameOperand, DataFrameOperandMixin, DataFrameGenTPCHLogicKeyGenerator
+):
+    _op_type_ = OperandDef.GEN_TPCH
+
+    table = StringField("table")
+    scale_factor = Float64Field("scale_factor")
+    seed = Int64Field("seed")
+    chunk_size = Int64Field("chunk_size", default=None)
+    # for chunks
+    start_block = Int64Field("start_block", default=None)
+    end_block = Int64Field("end_block", default=None)
+
+    def __init__(self, output_types=None, **kw):
+        super().__init__(_output_types=output_types or [OutputType.dataframe], **kw)
+
+    def _get_n_rows(self):
+        if self.table == "lineitem":
+            # number of lines per order is random
+            return np.nan
+        return get_table_driving_rows(
+            self.table, self.scale_factor
+        ) * _TABLE_ROW_MULTIPLIERS.get(self.table, 1)
+
+    def __call__(self):
+        schema = _TABLE_SCHEMAS[self.table]
+        dtypes = pd.Series(schema)
+        n_rows = self._get_n_rows()
+        if np.isnan(n_rows):
+            index_value = parse_index(
+                pd.RangeIndex(-1), self.table, self.scale_factor, self.seed
+            )
+        else:
+            index_value = parse_index(pd.RangeIndex(n_rows))
+        columns_value = parse_index(dtypes.index, store_data=True)
+        return self.new_dataframe(
+            None,
+            shape=(n_rows, len(schema)),
+            dtypes=dtypes,
+            index_value=index_value,
+            columns_value=columns_value,
+        )
+
+    @classmethod
+    def _get_chunk_blocks(cls, op: "DataFrameGenTPCH") -> List[int]:
+        driving_rows = get_table_driving_rows(op.table, op.scale_factor)
+        n_blocks = -(-driving_rows // BLOCK_ROWS)
+        chunk_size = op.chunk_size or options.chunk_size
+        if chunk_size is None:
+            chunk_size = options.chunk_store_limit // _TABLE_ROW_MEMORY[op.table]
+        elif isinstance(chunk_size, (tuple, list)):
+            chunk_size = chunk_size[0]
+        chunk_size = max(int(chunk_size) // _TABLE_ROW_MULTIPLIERS.get(op.table, 1), 1)
+        # chunks always consist of whole blocks to keep data independent
+        # of chunk sizes
+        blocks_per_chunk = max(chunk_size // BLOCK_ROWS, 1)
+        return list(range(0, n_blocks, blocks_per_chunk)) + [n_blocks]
+
+    @classmethod
+    def tile(cls, op: "DataFrameGenTPCH"):
+        out = op.outputs[0]
+        multiplier = _TABLE_ROW_MULTIPLIERS.get(op.table, 1)
+        driving_rows = get_table_driving_rows(op.table, op.scale_factor)
+        bounds = cls._get_chunk_blocks(op)
+
+        out_chunks = []
+        row_sizes = []
+        for i, (start_block, end_block) in enumerate(zip(bounds[:-1], bounds[1:])):
+            chunk_op = op.copy().reset_key()
+            chunk_op.start_block = start_block
+            chunk_op.end_block = end_block
+            if op.table == "lineitem":
+                n_rows = np.nan
+                index_value = parse_index(
+                    pd.RangeIndex(-1), op.table, op.scale_factor, op.seed, i
+                )
+            else:
+                start = start_block * BLOCK_ROWS * multiplier
+                end = min(end_block * BLOCK_ROWS, driving_rows) * multiplier
+                n_rows = end - start
+                index_value = parse_index(pd.RangeIndex(start, end))
+            out_chunks.append(
+                chunk_op.new_chunk(
+                    None,
+                    shape=(n_rows, out.shape[1]),
+                    dtypes=out.dtypes,
+                    index_value=index_value,
+                    columns_value=out.columns_value,
+                    index=(i, 0),
+                )
+            )
+            row_sizes.append(n_rows)
+
+        new_op = op.copy()
+        params = out.params
+        params["chunks"] = out_chunks
+        params["nsplits"] = (tuple(row_sizes), (out.shape[1],))
+        return new_op.new_dataframes(None, kws=[params])
+
+    @classmethod
+    def execute(cls, ctx, op: "DataFrameGenTPCH"):
+        out = op.outputs[0]
+        df = generate_tpch_blocks(
+            op.table, op.scale_factor, op.seed, op.start_block, op.end_block
+        )
+        if op.table != "lineitem":
+            start = (
+                op.start_block * BLOCK_ROWS * _TABLE_ROW_MULTIPLIERS.get(op.table, 1)
+            )
+            df.index = pd.RangeIndex(start, start + len(df))
+        ctx[out.key] = df
+
+
+def gen_tpch(
+    table: str, scale_factor: float = 1.0, seed: int = 0, chunk_size: int = None
+):
+    """
+    Generate a table of the TPC-H benchmark.
+
+    Chunks are generated in parallel by the workers which execute them,
+    and the result only depends on `scale_factor` and `seed`.
+
+    Parameters
+    ----------
+    table : str
+        Name of the table, one of 'region', 'nation', 'supplier', 'customer',
+        'part', 'partsupp', 'orders' and 'lineitem'.
+    scale_factor : float
+        TPC-H scale factor, 1 generates roughly 1 GB of data.
+    seed : int
+        Seed of the random generator.
+    chunk_size : int, optional
+        Number of rows in each chunk, rounded to a multiple of 10000 rows.
+
+    Returns
+    -------
+    DataFrame
+    """
+    table = table.lower()
+    if table not in _TABLE_SCHEMAS:
+        raise ValueError(
+            f"Unknown TPC-H table {table!r}, should be one of {TPCH_TABLES}"
+        )
+    if scale_factor <= 0:
+        raise ValueError(f"scale_factor should be positive, got {scale_factor}")
+    op = DataFrameGenTPCH(
+        table=table, scale_factor=float(scale_factor), seed=seed, chunk_size=chunk_size
+    )
+    return op()
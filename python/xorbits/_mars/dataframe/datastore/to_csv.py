@@ -65,6 +65,10 @@ class DataFrameToCSV(DataFrameOperand, DataFrameOperandMixin):
     # for chunk
     _output_stat = BoolField("output_stat")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(
         self,
         path=None,
@@ -435,6 +439,10 @@ class DataFrameToCSVStat(TensorOperand, TensorOperandMixin):
     _path = AnyField("path")
     _storage_options = DictField("storage_options")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, path=None, storage_options=None, dtype=None, **kw):
         super().__init__(
             _path=path, _storage_options=storage_options, dtype=dtype, **kw
@@ -51,6 +51,10 @@ class DataFrameToParquet(DataFrameOperand, DataFrameOperandMixin):
     _additional_kwargs = DictField("additional_kwargs")
     _storage_options = DictField("storage_options")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(
         self,
         path=None,
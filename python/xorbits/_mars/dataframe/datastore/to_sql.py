@@ -75,6 +75,10 @@ class DataFrameToSQLTable(
         default=None,
     )
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __call__(self, df_or_series):
         with create_sa_connection(self.con, **(self.engine_kwargs or dict())) as con:
             self.con = str(con.engine.url)
@@ -38,6 +38,10 @@ class DataFrameToVineyardChunk(DataFrameOperand, DataFrameOperandMixin):
     # a dummy attr to make sure ops have different keys
     operator_index = TupleField("operator_index", FieldTypes.int32)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, dtypes=None, **kw):
         super().__init__(
             vineyard_socket=vineyard_socket,
@@ -142,6 +146,10 @@ class DataFrameToVinyardStoreMeta(DataFrameOperand, DataFrameOperandMixin):
     # vineyard ipc socket
     vineyard_socket = StringField("vineyard_socket")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, dtypes=None, **kw):
         super().__init__(
             vineyard_socket=vineyard_socket,
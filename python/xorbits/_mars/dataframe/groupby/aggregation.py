@@ -17,7 +17,7 @@ import functools
 import itertools
 import logging
 import uuid
-from typing import Callable, Dict, List, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -28,6 +28,7 @@ from ...core import ENTITY_TYPE, OutputType
 from ...core.context import get_context
 from ...core.custom_log import redirect_custom_log
 from ...core.operand import OperandStage
+from ...lib.sketches import HyperLogLog
 from ...serialization.serializables import (
     AnyField,
     BoolField,
@@ -51,8 +52,10 @@ from ..operands import DataFrameOperand, DataFrameOperandMixin, DataFrameShuffle
 from ..reduction.aggregation import is_funcs_aggregate, normalize_reduction_funcs
 from ..reduction.core import ReductionAggStep, ReductionCompiler, ReductionSteps
 from ..utils import (
+    adapt_shuffle_size,
     build_concatenated_rows_frame,
     concat_on_columns,
+    get_shuffle_partition_size,
     is_cudf,
     parse_index,
 )
@@ -77,14 +80,40 @@ class SizeRecorder:
     def __init__(self):
         self._raw_records = []
         self._agg_records = []
-
-    def record(self, raw_record: int, agg_record: int):
+        self._agg_row_records = []
+        self._sketch = None
+
+    def record(
+        self,
+        raw_record: int,
+        agg_record: int,
+        agg_rows: int = None,
+        sketch: HyperLogLog = None,
+    ):
         self._raw_records.append(raw_record)
         self._agg_records.append(agg_record)
+        if agg_rows is not None:
+            self._agg_row_records.append(agg_rows)
+        if sketch is not None:
+            if self._sketch is None:
+                self._sketch = sketch
+            else:
+                self._sketch.merge(sketch)
 
     def get(self):
         return self._raw_records, self._agg_records
 
+    def estimate_agg_size(self) -> Optional[float]:
+        """
+        Estimate size of the final aggregation result with the number of
+        distinct groups across all recorded chunks.
+        """
+        agg_rows = sum(self._agg_row_records)
+        if self._sketch is None or agg_rows == 0:
+            return None
+        row_size = sum(self._agg_records) / agg_rows
+        return min(self._sketch.estimate(), agg_rows) * row_size
+
 
 _agg_functions = {
     "sum": lambda x: x.sum(),
@@ -175,12 +204,18 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
     # for chunk
     combine_size = Int32Field("combine_size")
     chunk_store_limit = Int64Field("chunk_store_limit")
+    shuffle_partition_size = Int64Field("shuffle_partition_size", default=None)
     pre_funcs = ListField("pre_funcs")
     agg_funcs = ListField("agg_funcs")
     post_funcs = ListField("post_funcs")
     index_levels = Int32Field("index_levels")
     size_recorder_name = StringField("size_recorder_name")
 
+    @property
+    def cacheable(self) -> bool:
+        # sizes are recorded to choose the method of aggregation
+        return getattr(self, "size_recorder_name", None) is None
+
     def _set_inputs(self, inputs):
         super()._set_inputs(inputs)
         inputs_iter = iter(self._inputs[1:])
@@ -423,10 +458,10 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
         return partition_sort_chunks
 
     @classmethod
-    def _gen_shuffle_chunks(cls, op, chunks):
+    def _gen_shuffle_chunks(cls, op, chunks, n_reducers: int = None):
         # generate map chunks
         map_chunks = []
-        chunk_shape = (len(chunks), 1)
+        chunk_shape = (n_reducers or len(chunks), 1)
         for chunk in chunks:
             # no longer consider as_index=False for the intermediate phases,
             # will do reset_index at last if so
@@ -487,7 +522,9 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
                 by = []
                 for v in map_op.groupby_params["by"]:
                     if isinstance(v, ENTITY_TYPE):
-                        by_chunk = v.cix[chunk.index[0],]
+                        by_chunk = v.cix[
+                            chunk.index[0],
+                        ]
                         chunk_inputs.append(by_chunk)
                         by.append(by_chunk)
                     else:
@@ -645,6 +682,7 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
         in_df: TileableType,
         out_df: TileableType,
         func_infos: ReductionSteps,
+        n_reducers: int = None,
     ):
         if op.groupby_params["sort"] and len(in_df.chunks) > 1:
             agg_chunk_len = len(agg_chunks)
@@ -654,7 +692,7 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
                 op, in_df, agg_chunks, pivot_chunk
             )
         else:
-            reduce_chunks = cls._gen_shuffle_chunks(op, agg_chunks)
+            reduce_chunks = cls._gen_shuffle_chunks(op, agg_chunks, n_reducers)
 
         # Combine groups
         agg_chunks = []
@@ -838,18 +876,25 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
         in_df: TileableType,
         out_df: TileableType,
         func_infos: ReductionSteps,
-        sample_map_chunks: List[ChunkType],
-        sample_agg_sizes: List[int],
+        map_chunks: List[ChunkType],
+        agg_sizes: List[int],
+        estimated_agg_size: float = None,
     ):
         combine_size = op.combine_size
-        left_chunks = cls._gen_map_chunks(
-            op, in_df.chunks[combine_size:], out_df, func_infos
-        )
-        input_size = sum(sample_agg_sizes) / len(sample_agg_sizes)
+        input_size = sum(agg_sizes) / len(agg_sizes)
         combine_chunk_limit = op.chunk_store_limit / 4
+        if estimated_agg_size is not None and estimated_agg_size <= combine_chunk_limit:
+            logger.debug(
+                "Choose tree method for groupby operand %s, "
+                "estimated aggregation size is %s",
+                op,
+                estimated_agg_size,
+            )
+            return cls._combine_tree(op, map_chunks, out_df, func_infos)
+
         combined_chunks, concat_size = cls._build_tree_chunks(
             op,
-            sample_map_chunks + left_chunks,
+            map_chunks,
             func_infos,
             combine_size,
             input_size,
@@ -860,17 +905,31 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
             len(combined_chunks),
             op,
         )
-        if concat_size <= combine_chunk_limit:
+        if estimated_agg_size is None and concat_size <= combine_chunk_limit:
             logger.debug(
                 "Choose tree method after combining chunks for groupby operand %s", op
             )
             return cls._build_out_tileable(op, out_df, combined_chunks, func_infos)
         else:
+            # coalesce or split partitions by size of aggregated data,
+            # every partition should be small enough for the tree method
+            partition_size = op.shuffle_partition_size
+            if partition_size is not None:
+                partition_size = min(partition_size, combine_chunk_limit)
+            n_reducers = adapt_shuffle_size(
+                get_context(),
+                estimated_agg_size
+                if estimated_agg_size is not None
+                else sum(agg_sizes),
+                len(combined_chunks),
+                partition_size,
+            )
             logger.debug(
                 "Choose shuffle method after combining chunks for "
-                "groupby operand %s, chunk count is %s",
+                "groupby operand %s, chunk count is %s, reducer count is %s",
                 op,
                 len(combined_chunks),
+                n_reducers,
             )
             return cls._perform_shuffle(
                 op,
@@ -878,6 +937,7 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
                 in_df,
                 out_df,
                 func_infos,
+                n_reducers,
             )
 
     @classmethod
@@ -889,36 +949,35 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
         func_infos: ReductionSteps,
     ):
         ctx = get_context()
-        combine_size = op.combine_size
         size_recorder_name = str(uuid.uuid4())
         size_recorder = ctx.create_remote_object(size_recorder_name, SizeRecorder)
 
-        # collect the first combine_size chunks, run it
-        # to get the size before and after agg
-        chunks = cls._gen_map_chunks(
-            op, in_df.chunks[:combine_size], out_df, func_infos
-        )
+        # run map stage of all chunks, each of them records sizes before
+        # and after agg as well as a sketch of groups, thus the number
+        # of groups across all chunks can be estimated
+        chunks = cls._gen_map_chunks(op, in_df.chunks, out_df, func_infos)
         for chunk in chunks:
             chunk.op.size_recorder_name = size_recorder_name
         # yield to trigger execution
         yield chunks
 
         raw_sizes, agg_sizes = size_recorder.get()
+        estimated_agg_size = size_recorder.estimate_agg_size()
         # destroy size recorder
         ctx.destroy_remote_object(size_recorder_name)
 
         logger.debug(
             "Start to choose method for Groupby, agg_sizes: %s, raw_sizes: %s, "
-            "sample_count: %s, total_count: %s, chunk_store_limit: %s",
+            "estimated_agg_size: %s, chunk_count: %s, chunk_store_limit: %s",
             agg_sizes,
             raw_sizes,
-            len(agg_sizes),
+            estimated_agg_size,
             len(in_df.chunks),
             op.chunk_store_limit,
         )
 
         return cls._build_tree_and_shuffle_chunks(
-            op, in_df, out_df, func_infos, chunks, agg_sizes
+            op, in_df, out_df, func_infos, chunks, agg_sizes, estimated_agg_size
         )
 
     @classmethod
@@ -1119,8 +1178,13 @@ class DataFrameGroupByAgg(DataFrameOperand, DataFrameOperandMixin):
             raw_size = estimate_pandas_size(in_data)
             # when agg by a list of methods, agg_size should be sum
             agg_size = sum([estimate_pandas_size(item) for item in agg_dfs])
+            # sketch groups to estimate the number of groups of all chunks
+            agg_index = agg_dfs[0].index
+            if op.gpu:  # pragma: no cover
+                agg_index = agg_index.to_pandas()
+            sketch = HyperLogLog.from_data(agg_index)
             size_recorder = ctx.get_remote_object(op.size_recorder_name)
-            size_recorder.record(raw_size, agg_size)
+            size_recorder.record(raw_size, agg_size, len(agg_index), sketch)
 
         ctx[op.outputs[0].key] = tuple(agg_dfs)
 
@@ -1346,6 +1410,7 @@ def agg(groupby, func=None, method="auto", combine_size=None, *args, **kwargs):
         groupby_params=groupby.op.groupby_params,
         combine_size=combine_size or options.combine_size,
         chunk_store_limit=options.chunk_store_limit,
+        shuffle_partition_size=get_shuffle_partition_size(),
         use_inf_as_na=use_inf_as_na,
     )
     return agg_op(groupby)
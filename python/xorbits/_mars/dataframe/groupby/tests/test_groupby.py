@@ -187,11 +187,26 @@ def test_groupby_auto_on_cluster():
         tiled_mdf = tile(mdf)
         r = mdf.groupby("c2").sum()
         func_infos = DataFrameGroupByAgg._compile_funcs(r.op, mdf)
+        map_chunks = DataFrameGroupByAgg._gen_map_chunks(
+            r.op, tiled_mdf.chunks, r, func_infos
+        )
         tiled = DataFrameGroupByAgg._build_tree_and_shuffle_chunks(
-            r.op, tiled_mdf, r, func_infos, tiled_mdf.chunks[:4], [8] * 4
+            r.op, tiled_mdf, r, func_infos, map_chunks, [8] * 4
         )[0]
         assert len(tiled.chunks) == 5
 
+        # estimated size of aggregation result is small, choose tree
+        tiled = DataFrameGroupByAgg._build_tree_and_shuffle_chunks(
+            r.op, tiled_mdf, r, func_infos, map_chunks, [8] * 4, 16
+        )[0]
+        assert len(tiled.chunks) == 1
+
+        # estimated size is large, shuffle even if chunks can be combined
+        tiled = DataFrameGroupByAgg._build_tree_and_shuffle_chunks(
+            r.op, tiled_mdf, r, func_infos, map_chunks, [1] * 4, 1000
+        )[0]
+        assert len(tiled.chunks) > 1
+
 
 def test_groupby_apply():
     df1 = pd.DataFrame(
@@ -709,6 +709,31 @@ def test_groupby_agg_auto_method(setup):
     ).fetch()
     pd.testing.assert_frame_equal(result.sort_index(), raw.groupby("c1").agg("sum"))
 
+    # groups of the first chunks are few while the last chunks are
+    # almost unique, the method should be chosen by groups of all chunks
+    raw = pd.DataFrame(
+        {
+            "c1": np.concatenate([np.zeros(40, dtype=int), np.arange(1, 61)]),
+            "c2": rs.rand(100),
+        }
+    )
+    stages = []
+
+    def _record_stage(ctx, op):
+        stages.append(op.stage)
+        op.execute(ctx, op)
+
+    with option_context({"chunk_store_limit": 3200}):
+        mdf = md.DataFrame(raw, chunk_size=10)
+        r = mdf.groupby("c1").agg("sum")
+        operand_executors = {DataFrameGroupByAgg: _record_stage}
+        result = r.execute(
+            extra_config={"operand_executors": operand_executors, "check_all": False}
+        ).fetch()
+        pd.testing.assert_frame_equal(result.sort_index(), raw.groupby("c1").agg("sum"))
+        # shuffle method generates more than one agg chunks
+        assert stages.count(OperandStage.agg) > 1
+
 
 @pytest.mark.skip_ray_dag  # _fetch_infos() is not supported by ray backend.
 def test_distributed_groupby_agg(setup_cluster):
@@ -750,8 +775,16 @@ def test_distributed_groupby_agg(setup_cluster):
     pd.testing.assert_frame_equal(
         r.fetch().sort_index(), raw.groupby("c2", sort=False).sum().sort_index()
     )
+    # only 3 groups are estimated, use tree
+    assert len(r._fetch_infos()["memory_size"]) == 1
+
+    with option_context({"chunk_store_limit": 1024}):
+        r = mdf.groupby("c1", sort=False).sum().execute()
+    pd.testing.assert_frame_equal(
+        r.fetch().sort_index(), raw.groupby("c1", sort=False).sum().sort_index()
+    )
     # use tree and shuffle
-    assert len(r._fetch_infos()["memory_size"]) == 3
+    assert len(r._fetch_infos()["memory_size"]) > 1
 
 
 def test_groupby_agg_str_cat(setup):
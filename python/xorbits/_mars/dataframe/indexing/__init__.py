@@ -30,6 +30,7 @@ def _install():
     from .iat import iat
     from .iloc import head, iloc, index_getitem, index_setitem, tail
     from .insert import df_insert
+    from .label_index import create_index
     from .loc import loc
     from .reindex import reindex, reindex_like
     from .rename import df_rename, index_rename, index_set_names, series_rename
@@ -54,6 +55,7 @@ def _install():
         setattr(cls, "mask", mask)
         setattr(cls, "where", where)
         setattr(cls, "sample", sample)
+        setattr(cls, "create_index", create_index)
 
     for cls in DATAFRAME_TYPE:
         setattr(cls, "set_index", set_index)
@@ -52,6 +52,7 @@ from ...tensor.utils import (
 from ...utils import classproperty, has_unknown_shape, is_full_slice
 from ..core import SERIES_CHUNK_TYPE, SERIES_TYPE, IndexValue
 from ..utils import parse_index
+from .label_index import lookup_label_index
 from .utils import convert_labels_into_positions
 
 ChunkIndexAxisInfo = namedtuple(
@@ -894,10 +895,30 @@ class LabelNDArrayFancyIndexHandler(_LabelFancyIndexHandler):
                 index = np.atleast_1d(index)
             # does not know the right positions, need postprocess always
             index_info.is_label_asc_sorted = False
-            # do df.loc on each chunk
-            index_info.chunk_index_to_labels = {
-                i: index for i in range(tileable.chunk_shape[input_axis])
-            }
+            label_index = getattr(op, "label_index", None)
+            if (
+                label_index is not None
+                and input_axis == 0
+                and len(label_index.chunks) == tileable.chunk_shape[0]
+                and not op.can_index_miss
+                and not isinstance(
+                    tileable.index_value.value,
+                    (IndexValue.DatetimeIndex, IndexValue.MultiIndex),
+                )
+            ):
+                # only do df.loc on chunks containing labels
+                chunk_index_to_labels = yield from lookup_label_index(
+                    label_index, index
+                )
+                index_info.chunk_index_to_labels = {
+                    i: chunk_index_to_labels.get(i, index[:0])
+                    for i in range(tileable.chunk_shape[input_axis])
+                }
+            else:
+                # do df.loc on each chunk
+                index_info.chunk_index_to_labels = {
+                    i: index for i in range(tileable.chunk_shape[input_axis])
+                }
 
     def process(self, index_info: IndexInfo, context: IndexHandlerContext) -> None:
         tileable = context.tileable
@@ -0,0 +1,159 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import weakref
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ... import opcodes as OperandDef
+from ...core import OutputType
+from ...core.context import Context, get_context
+from ...serialization.serializables import AnyField, StringField
+from ...typing import TileableType
+from ...utils import build_fetch
+from ..operands import DataFrameOperand, DataFrameOperandMixin
+
+# tileable data -> executed label index of the tileable
+_data_to_label_index = weakref.WeakKeyDictionary()
+
+
+class DataFrameLabelIndex(DataFrameOperand, DataFrameOperandMixin):
+    """
+    Index of labels of every chunk, labels are sorted if possible,
+    thus lookups of labels are binary searches on chunks.
+    """
+
+    _op_type_ = OperandDef.DATAFRAME_LABEL_INDEX
+
+    # labels to lookup
+    labels = AnyField("labels", default=None)
+    # build or lookup
+    execution_stage = StringField("execution_stage", default=None)
+
+    def __init__(self, execution_stage=None, **kwargs):
+        kwargs["_output_types"] = [OutputType.object]
+        super().__init__(execution_stage=execution_stage, **kwargs)
+
+    def __call__(self, df_or_series: TileableType):
+        return self.new_tileable([df_or_series])
+
+    @classmethod
+    def tile(cls, op: "DataFrameLabelIndex"):
+        inp = op.inputs[0]
+        chunks = []
+        for c in inp.chunks:
+            if c.ndim == 2 and c.index[1] != 0:
+                # labels on axis 0 are identical for chunks on one row
+                continue
+            build_op = DataFrameLabelIndex(execution_stage="build")
+            chunks.append(build_op.new_chunk([c], index=(c.index[0],)))
+
+        new_op = op.copy()
+        return new_op.new_tileables(
+            op.inputs, chunks=chunks, nsplits=((np.nan,) * len(chunks),)
+        )
+
+    @classmethod
+    def _build(cls, index: pd.Index) -> Union[np.ndarray, pd.Index]:
+        try:
+            return np.unique(index.to_numpy())
+        except TypeError:
+            # labels not comparable, lookup by hashing instead
+            return index.unique()
+
+    @classmethod
+    def _lookup(
+        cls, index_labels: Union[np.ndarray, pd.Index], labels: np.ndarray
+    ) -> np.ndarray:
+        if isinstance(index_labels, np.ndarray):
+            try:
+                if len(index_labels) == 0:
+                    return labels[:0]
+                pos = np.searchsorted(index_labels, labels)
+                pos[pos == len(index_labels)] = 0
+                found = np.asarray(index_labels[pos] == labels, dtype=bool)
+                if found.shape != labels.shape:
+                    # failed to compare elementwise
+                    raise TypeError("labels not comparable")
+                # nan labels are not equal to each other
+                na_labels = pd.isna(labels)
+                if na_labels.any():
+                    found |= na_labels & pd.isna(index_labels).any()
+                return labels[found]
+            except TypeError:
+                pass
+        return labels[pd.Index(labels).isin(index_labels)]
+
+    @classmethod
+    def execute(cls, ctx: Union[dict, Context], op: "DataFrameLabelIndex"):
+        data = ctx[op.inputs[0].key]
+        if op.execution_stage == "build":
+            ctx[op.outputs[0].key] = cls._build(data.index)
+        else:
+            assert op.execution_stage == "lookup"
+            ctx[op.outputs[0].key] = cls._lookup(data, np.asarray(op.labels))
+
+
+def get_label_index(df_or_series: TileableType) -> Optional[TileableType]:
+    return _data_to_label_index.get(getattr(df_or_series, "data", df_or_series))
+
+
+def lookup_label_index(label_index: TileableType, labels: np.ndarray) -> Dict:
+    """
+    Lookup labels in chunks of the label index, a dict mapping
+    indexes of chunks on axis 0 to labels found in them is returned.
+    """
+    lookup_chunks = []
+    for c in label_index.chunks:
+        lookup_op = DataFrameLabelIndex(labels=labels, execution_stage="lookup")
+        lookup_chunks.append(lookup_op.new_chunk([c], index=c.index))
+    yield lookup_chunks + label_index.chunks
+
+    ctx = get_context()
+    results = ctx.get_chunks_result([c.key for c in lookup_chunks])
+    return {c.index[0]: found for c, found in zip(lookup_chunks, results)}
+
+
+def create_index(df_or_series, session=None, **kw):
+    """
+    Build an index of labels for every chunk and keep it in storage.
+
+    The DataFrame or Series is executed if not executed. Subsequent
+    lookups like ``df.loc[labels]`` only touch chunks containing the
+    labels instead of all chunks, which benefits repeated lookups on
+    an unsorted index. The index is released when the DataFrame or
+    Series is deleted.
+
+    Parameters
+    ----------
+    session : Session
+        Session to execute the DataFrame or Series and the index.
+    **kw
+        Keyword arguments passed to ``execute``.
+
+    Returns
+    -------
+    DataFrame or Series
+        The DataFrame or Series itself.
+    """
+    df_or_series.execute(session=session, **kw)
+    # build on the fetched data, thus the index does not hold the data
+    label_index = DataFrameLabelIndex(execution_stage="build")(
+        build_fetch(df_or_series)
+    )
+    label_index.execute(session=session, **kw)
+    _data_to_label_index[df_or_series.data] = label_index
+    return df_or_series
@@ -33,6 +33,7 @@ from ..operands import DataFrameOperand, DataFrameOperandMixin
 from ..utils import is_index_value_identical, parse_index
 from .iloc import DataFrameIlocSetItem
 from .index_lib import DataFrameLocIndexesHandler
+from .label_index import get_label_index
 
 cudf = lazy_import("cudf")
 
@@ -114,7 +115,14 @@ class DataFrameLoc:
             # use iloc instead
             return self._obj.iloc[tuple(new_indexes or indexes)]
 
-        op = DataFrameLocGetItem(indexes=indexes)
+        label_index = None
+        if not isinstance(indexes[0], (slice, ENTITY_TYPE)) and not (
+            isinstance(indexes[0], np.ndarray) and indexes[0].dtype == np.bool_
+        ):
+            # lookup labels by index created by `create_index`
+            label_index = get_label_index(self._obj)
+
+        op = DataFrameLocGetItem(indexes=indexes, label_index=label_index)
         return op(self._obj)
 
     def __setitem__(self, indexes, value):
@@ -242,10 +250,24 @@ class DataFrameLocGetItem(DataFrameOperand, DataFrameOperandMixin):
 
     _input = KeyField("input")
     _indexes = ListField("indexes")
+    _label_index = KeyField("label_index")
 
-    def __init__(self, indexes=None, gpu=None, sparse=False, output_types=None, **kw):
+    def __init__(
+        self,
+        indexes=None,
+        label_index=None,
+        gpu=None,
+        sparse=False,
+        output_types=None,
+        **kw,
+    ):
         super().__init__(
-            _indexes=indexes, gpu=gpu, sparse=sparse, _output_types=output_types, **kw
+            _indexes=indexes,
+            _label_index=label_index,
+            gpu=gpu,
+            sparse=sparse,
+            _output_types=output_types,
+            **kw,
         )
 
     @property
@@ -256,6 +278,10 @@ class DataFrameLocGetItem(DataFrameOperand, DataFrameOperandMixin):
     def indexes(self):
         return self._indexes
 
+    @property
+    def label_index(self):
+        return self._label_index
+
     @property
     def can_index_miss(self):
         return False
@@ -271,6 +297,9 @@ class DataFrameLocGetItem(DataFrameOperand, DataFrameOperandMixin):
             else:
                 indexes.append(index)
         self._indexes = list(indexes)
+        if self._label_index is not None:
+            # label index is only an input of tileables, not chunks
+            self._label_index = next(inputs_iter, None)
 
     @classmethod
     def _calc_slice_param(
@@ -418,6 +447,8 @@ class DataFrameLocGetItem(DataFrameOperand, DataFrameOperandMixin):
 
     def __call__(self, inp):
         inputs = [inp] + filter_inputs(self._indexes)
+        if self._label_index is not None:
+            inputs.append(self._label_index)
 
         shape = []
         sizes = []
@@ -32,10 +32,13 @@ except ImportError:  # pragma: no cover
 from .... import dataframe as md
 from .... import execute, fetch
 from .... import tensor as mt
+from ....core.operand import OperandStage
+from ....tests.core import mock
 from ....utils import pd_release_version
 from ...datasource.read_csv import DataFrameReadCSV
 from ...datasource.read_parquet import DataFrameReadParquet
 from ...datasource.read_sql import DataFrameReadSQL
+from ..loc import DataFrameLocGetItem
 
 _allow_set_missing_list = pd_release_version[:2] >= (1, 1)
 
@@ -399,6 +402,51 @@ def test_loc_getitem(setup):
     pd.testing.assert_frame_equal(result, expected)
 
 
+def test_loc_getitem_by_label_index(setup):
+    rs = np.random.RandomState(0)
+    raw = pd.DataFrame(
+        {"a": rs.rand(100), "b": rs.randint(10, size=100)},
+        index=rs.permutation(100) * 2,
+    )
+    df = md.DataFrame(raw, chunk_size=10)
+    assert df.create_index() is df
+
+    executed_chunks = []
+    raw_execute = DataFrameLocGetItem.execute
+
+    def _execute(ctx, op):
+        if op.stage == OperandStage.map:
+            executed_chunks.append(op.outputs[0])
+        return raw_execute(ctx, op)
+
+    with mock.patch.object(DataFrameLocGetItem, "execute", new=_execute):
+        labels = [raw.index[3], raw.index[57], raw.index[3]]
+        result = df.loc[labels].execute().fetch()
+        pd.testing.assert_frame_equal(result, raw.loc[labels])
+        # only chunks containing labels are touched
+        assert len(executed_chunks) == 2
+
+        executed_chunks.clear()
+        result = df.loc[raw.index[42], "b"].execute().fetch()
+        assert result == raw.loc[raw.index[42], "b"]
+        assert len(executed_chunks) == 1
+
+    with pytest.raises(KeyError):
+        df.loc[[1, 3]].execute()
+
+    # series with labels of strings
+    raw_series = pd.Series(rs.rand(30), index=[f"k{i}" for i in rs.permutation(30)])
+    series = md.Series(raw_series, chunk_size=7).create_index()
+    result = series.loc[["k3", "k12"]].execute().fetch()
+    pd.testing.assert_series_equal(result, raw_series.loc[["k3", "k12"]])
+
+    # labels not comparable with each other
+    raw_series = pd.Series(np.arange(4), index=["a", 1, 2.5, "b"])
+    series = md.Series(raw_series, chunk_size=2).create_index()
+    result = series.loc[["b", "a"]].execute().fetch()
+    pd.testing.assert_series_equal(result, raw_series.loc[["b", "a"]])
+
+
 @pytest.mark.pd_compat
 def test_dataframe_getitem(setup):
     data = pd.DataFrame(np.random.rand(10, 5), columns=["c1", "c2", "c3", "c4", "c5"])
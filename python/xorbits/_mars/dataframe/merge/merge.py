@@ -23,6 +23,7 @@ import numpy as np
 import pandas as pd
 
 from ... import opcodes as OperandDef
+from ...config import options
 from ...core import OutputType, TileStatus, recursive_tile
 from ...core.context import get_context
 from ...core.operand import MapReduceOperand, OperandStage
@@ -32,6 +33,8 @@ from ...serialization.serializables import (
     DictField,
     Int32Field,
     KeyField,
+    Float64Field,
+    Int64Field,
     NamedTupleField,
     StringField,
     TupleField,
@@ -42,10 +45,13 @@ from ..base.bloom_filter import filter_by_bloom_filter
 from ..core import DataFrame, DataFrameChunk, Series
 from ..operands import DataFrameOperand, DataFrameOperandMixin, DataFrameShuffleProxy
 from ..utils import (
+    adapt_shuffle_size,
     auto_merge_chunks,
     build_concatenated_rows_frame,
     build_df,
+    get_shuffle_partition_size,
     hash_dataframe_on,
+    hash_labels_on,
     infer_index_value,
     is_cudf,
     parse_index,
@@ -63,6 +69,12 @@ BLOOM_FILTER_OPTIONS = [
 ]
 BLOOM_FILTER_ON_OPTIONS = ["large", "small", "both"]
 DEFAULT_BLOOM_FILTER_ON = "large"
+# split rows of hot keys when joining skewed DataFrames with shuffle
+SKEW_JOIN_OPTIONS = ["threshold", "max_hot_keys", "sample_size"]
+# ratio of the largest reducer size to the average to treat data as skewed
+DEFAULT_SKEW_THRESHOLD = 2.0
+DEFAULT_MAX_HOT_KEYS = 64
+DEFAULT_SKEW_SAMPLE_SIZE = 10000
 
 cudf = lazy_import("cudf")
 
@@ -76,6 +88,11 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
     input = KeyField("input")
     # for mapper
     mapper_id = Int32Field("mapper_id", default=0)
+    # hashes of hot keys and the number of reducers for each key
+    hot_keys = AnyField("hot_keys", default=None)
+    hot_key_splits = AnyField("hot_key_splits", default=None)
+    # rows of hot keys are split into reducers if True, else replicated
+    split_hot_keys = BoolField("split_hot_keys", default=False)
 
     def __init__(self, output_types=None, **kw):
         super().__init__(_output_types=output_types, **kw)
@@ -90,26 +107,49 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
     def output_limit(self) -> int:
         return len(self.output_types)
 
+    @classmethod
+    def _hash_hot_keys(cls, op: "DataFrameMergeAlign", df, mapper_index: int):
+        """
+        Hash rows into reducers, rows of hot keys on the split side are
+        assigned to several reducers in turn, and those on the other side
+        are replicated to all these reducers.
+        """
+        size = op.index_shuffle_size
+        hashed = hash_labels_on(df, op.shuffle_on).to_numpy()
+        reducers = (hashed % np.uint64(size)).astype(np.int64)
+        rows = np.arange(len(df))
+
+        splits = np.asarray(op.hot_key_splits, dtype=np.int64)
+        key_pos = pd.Index(np.asarray(op.hot_keys, dtype=np.uint64)).get_indexer(hashed)
+        hot_rows = np.flatnonzero(key_pos >= 0)
+        hot_pos = key_pos[hot_rows]
+        if op.split_hot_keys:
+            # start from different reducers for different mappers
+            offsets = pd.Series(hot_pos).groupby(hot_pos).cumcount().to_numpy()
+            offsets = (offsets + mapper_index) % splits[hot_pos]
+            reducers[hot_rows] = (reducers[hot_rows] + offsets) % size
+        else:
+            rows_list, reducers_list = [rows], [reducers]
+            for i in range(1, splits.max(initial=1)):
+                replicated = hot_rows[splits[hot_pos] > i]
+                rows_list.append(replicated)
+                reducers_list.append((reducers[replicated] + i) % size)
+            rows = np.concatenate(rows_list)
+            reducers = np.concatenate(reducers_list)
+
+        order = np.argsort(reducers, kind="stable")
+        bounds = np.searchsorted(reducers[order], np.arange(size + 1))
+        return [rows[order[bounds[i] : bounds[i + 1]]] for i in range(size)]
+
     @classmethod
     def execute_map(cls, ctx, op):
         chunk = op.outputs[0]
-        df = ctx[op.inputs[0].key]
-        shuffle_on = op.shuffle_on
-
-        if shuffle_on is not None:
-            # shuffle on field may be resident in index
-            to_reset_index_names = []
-            if not isinstance(shuffle_on, (list, tuple)):
-                if shuffle_on not in df.dtypes:
-                    to_reset_index_names.append(shuffle_on)
-            else:
-                for son in shuffle_on:
-                    if son not in df.dtypes:
-                        to_reset_index_names.append(shuffle_on)
-            if len(to_reset_index_names) > 0:
-                df = df.reset_index(to_reset_index_names)
+        df = _reset_shuffle_on_index(ctx[op.inputs[0].key], op.shuffle_on)
 
-        filters = hash_dataframe_on(df, shuffle_on, op.index_shuffle_size)
+        if op.hot_keys is not None:
+            filters = cls._hash_hot_keys(op, df, chunk.index[0])
+        else:
+            filters = hash_dataframe_on(df, op.shuffle_on, op.index_shuffle_size)
 
         # shuffle on index
         for index_idx, index_filter in enumerate(filters):
@@ -154,7 +194,47 @@ class DataFrameMergeAlign(MapReduceOperand, DataFrameOperandMixin):
             cls.execute_reduce(ctx, op)
 
 
+class DataFrameMergeSkewSample(DataFrameOperand, DataFrameOperandMixin):
+    """
+    Sample keys of a chunk to shuffle on, and count rows of every reducer
+    as well as the most frequent keys, which are used to detect skew.
+    """
+
+    _op_type_ = OperandDef.DATAFRAME_MERGE_SKEW_SAMPLE
+
+    shuffle_on = AnyField("shuffle_on")
+    n_reducers = Int32Field("n_reducers")
+    sample_size = Int64Field("sample_size")
+    max_hot_keys = Int32Field("max_hot_keys")
+
+    def __init__(self, output_types=None, **kw):
+        super().__init__(_output_types=output_types or [OutputType.object], **kw)
+
+    @classmethod
+    def execute(cls, ctx, op: "DataFrameMergeSkewSample"):
+        df = _reset_shuffle_on_index(ctx[op.inputs[0].key], op.shuffle_on)
+        n_rows = len(df)
+        if n_rows > op.sample_size:
+            rs = np.random.RandomState(0)
+            df = df.iloc[rs.randint(n_rows, size=op.sample_size)]
+        scale = n_rows / max(len(df), 1)
+
+        hashed = hash_labels_on(df, op.shuffle_on)
+        reducer_sizes = np.bincount(
+            (hashed.to_numpy() % np.uint64(op.n_reducers)).astype(np.int64),
+            minlength=op.n_reducers,
+        )
+        key_counts = hashed.value_counts().iloc[: op.max_hot_keys]
+        ctx[op.outputs[0].key] = (
+            reducer_sizes * scale,
+            key_counts.index.to_numpy(dtype=np.uint64),
+            key_counts.to_numpy() * scale,
+        )
+
+
 MergeSplitInfo = namedtuple("MergeSplitInfo", "split_side, split_index, nsplits")
+# hot keys whose rows on the split side are assigned to multiple reducers
+MergeSkewInfo = namedtuple("MergeSkewInfo", "split_side, hot_keys, hot_key_splits")
 
 
 class MergeMethod(Enum):
@@ -182,6 +262,14 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
     auto_merge_threshold = Int32Field("auto_merge_threshold")
     bloom_filter = AnyField("bloom_filter")
     bloom_filter_options = DictField("bloom_filter_options")
+    skew_join = AnyField("skew_join", default="auto")
+    skew_join_options = DictField("skew_join_options", default=None)
+    # max size in bytes of the side to broadcast when method is auto
+    broadcast_threshold = Int64Field("broadcast_threshold", default=None)
+    # max ratio of the broadcast side to available memory of workers
+    broadcast_memory_ratio = Float64Field("broadcast_memory_ratio", default=None)
+    # size of every partition of shuffle, None if adaptive shuffle is disabled
+    shuffle_partition_size = Int64Field("shuffle_partition_size", default=None)
 
     # only for broadcast merge
     split_info = NamedTupleField("split_info")
@@ -242,6 +330,7 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         shuffle_on: Union[List, str],
         out_size: int,
         mapper_id: int = 0,
+        skew_info: MergeSkewInfo = None,
     ):
         map_op = DataFrameMergeAlign(
             stage=OperandStage.map,
@@ -250,6 +339,10 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             mapper_id=mapper_id,
             index_shuffle_size=out_size,
         )
+        if skew_info is not None:
+            map_op.hot_keys = skew_info.hot_keys
+            map_op.hot_key_splits = skew_info.hot_key_splits
+            map_op.split_hot_keys = skew_info.split_side == mapper_id
         return map_op.new_chunk(
             [chunk],
             shape=(np.nan, np.nan),
@@ -311,16 +404,21 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         right_shuffle_on: Union[List, str],
         left: Union[DataFrame, Series],
         right: Union[DataFrame, Series],
+        skew_info: MergeSkewInfo = None,
     ):
         # gen map chunks
         # for left dataframe, use 0 as mapper_id
         left_map_chunks = [
-            cls._gen_map_chunk(chunk, left_shuffle_on, out_shape[0], mapper_id=0)
+            cls._gen_map_chunk(
+                chunk, left_shuffle_on, out_shape[0], mapper_id=0, skew_info=skew_info
+            )
             for chunk in left.chunks
         ]
         # for right dataframe, use 1 as mapper_id
         right_map_chunks = [
-            cls._gen_map_chunk(chunk, right_shuffle_on, out_shape[0], mapper_id=1)
+            cls._gen_map_chunk(
+                chunk, right_shuffle_on, out_shape[0], mapper_id=1, skew_info=skew_info
+            )
             for chunk in right.chunks
         ]
         map_chunks = left_map_chunks + right_map_chunks
@@ -488,11 +586,13 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         op: "DataFrameMerge",
         left: Union[DataFrame, Series],
         right: Union[DataFrame, Series],
+        skew_info: MergeSkewInfo = None,
+        n_reducers: int = None,
     ):
         df = op.outputs[0]
-        left_row_chunk_size = left.chunk_shape[0]
-        right_row_chunk_size = right.chunk_shape[0]
-        out_row_chunk_size = max(left_row_chunk_size, right_row_chunk_size)
+        if n_reducers is None:
+            n_reducers = max(left.chunk_shape[0], right.chunk_shape[0])
+        out_row_chunk_size = n_reducers
 
         out_chunk_shape = (out_row_chunk_size, 1)
         nsplits = [[np.nan for _ in range(out_row_chunk_size)], [df.shape[1]]]
@@ -502,7 +602,7 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
 
         # do shuffle
         left_chunks, right_chunks = cls._gen_both_shuffle_chunks(
-            out_chunk_shape, left_on, right_on, left, right
+            out_chunk_shape, left_on, right_on, left, right, skew_info=skew_info
         )
 
         out_chunks = []
@@ -537,12 +637,15 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         op: "DataFrameMerge",
         left: Union[DataFrame, Series],
         right: Union[DataFrame, Series],
+        broadcast_left: bool = None,
     ):
         from .concat import DataFrameConcat
 
         out_df = op.outputs[0]
         out_chunks = []
-        if left.chunk_shape[0] < right.chunk_shape[0]:
+        if broadcast_left is None:
+            broadcast_left = left.chunk_shape[0] < right.chunk_shape[0]
+        if broadcast_left:
             # broadcast left
             if op.how == "inner":
                 left_chunks = left.chunks
@@ -644,6 +747,99 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             columns_value=out_df.columns_value,
         )
 
+    @classmethod
+    def _detect_skew(
+        cls,
+        op: "DataFrameMerge",
+        left: Union[DataFrame, Series],
+        right: Union[DataFrame, Series],
+        n_reducers: int,
+    ):
+        """
+        Detect hot keys from samples of both sides. Rows of hot keys on the
+        side with more rows of them are split into several reducers, hence
+        only inner joins and outer joins of the side are supported.
+        """
+        if op.how == "inner":
+            split_sides = [0, 1]
+        elif op.how in ("left", "right"):
+            split_sides = [0] if op.how == "left" else [1]
+        else:
+            return None
+        if n_reducers < 2:
+            return None
+
+        skew_join_options = op.skew_join_options or dict()
+        threshold = skew_join_options.get("threshold", DEFAULT_SKEW_THRESHOLD)
+        max_hot_keys = skew_join_options.get("max_hot_keys", DEFAULT_MAX_HOT_KEYS)
+        sample_size = skew_join_options.get("sample_size", DEFAULT_SKEW_SAMPLE_SIZE)
+
+        sample_chunks = [[], []]
+        for side, inp, use_index, side_on in [
+            (0, left, op.left_index, op.left_on),
+            (1, right, op.right_index, op.right_on),
+        ]:
+            shuffle_on = _prepare_shuffle_on(use_index, side_on, op.on)
+            for c in inp.chunks:
+                sample_op = DataFrameMergeSkewSample(
+                    shuffle_on=shuffle_on,
+                    n_reducers=n_reducers,
+                    sample_size=sample_size,
+                    max_hot_keys=max_hot_keys,
+                )
+                sample_chunks[side].append(sample_op.new_chunk([c], index=c.index))
+        yield TileStatus(
+            sample_chunks[0] + sample_chunks[1] + left.chunks + right.chunks,
+            progress=0.4,
+        )
+
+        ctx = get_context()
+        reducer_sizes = np.zeros(n_reducers)
+        side_rows = [0.0, 0.0]
+        side_key_counts = [None, None]
+        for side in (0, 1):
+            results = ctx.get_chunks_result([c.key for c in sample_chunks[side]])
+            key_counts = []
+            for sizes, keys, counts in results:
+                reducer_sizes += sizes
+                side_rows[side] += sizes.sum()
+                key_counts.append(pd.Series(counts, index=keys))
+            side_key_counts[side] = (
+                pd.concat(key_counts).groupby(level=0).sum().nlargest(max_hot_keys)
+            )
+
+        skew_ratio = reducer_sizes.max() / max(reducer_sizes.mean(), 1)
+        if op.skew_join == "auto" and skew_ratio < threshold:
+            return None
+        # split the side holding most rows of its hottest key
+        split_side = max(
+            split_sides,
+            key=lambda side: side_key_counts[side].max()
+            if len(side_key_counts[side])
+            else 0,
+        )
+        # a key is hot if it has more rows than an average reducer
+        avg_size = max(side_rows[split_side] / n_reducers, 1)
+        key_counts = side_key_counts[split_side]
+        key_counts = key_counts[key_counts > avg_size]
+        if len(key_counts) == 0:
+            return None
+        hot_key_splits = np.minimum(
+            np.ceil(key_counts.to_numpy() / avg_size), n_reducers
+        ).astype(np.int64)
+        logger.info(
+            "Split %d hot keys of %s side into at most %d reducers for %s, "
+            "ratio of the largest reducer to the average is %.2f.",
+            len(key_counts),
+            "left" if split_side == 0 else "right",
+            hot_key_splits.max(),
+            op,
+            skew_ratio,
+        )
+        return MergeSkewInfo(
+            split_side, key_counts.index.to_numpy(dtype=np.uint64), hot_key_splits
+        )
+
     @classmethod
     def _can_merge_with_one_chunk(
         cls, left: TileableType, right: TileableType, how: str
@@ -670,6 +866,66 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             assert auto_merge == "after"
             return False, True
 
+    @classmethod
+    def _get_data_size(cls, ctx, tileable: TileableType) -> Optional[int]:
+        metas = ctx.get_chunks_meta(
+            [c.key for c in tileable.chunks], fields=["memory_size"], error="ignore"
+        )
+        sizes = [meta.get("memory_size") if meta else None for meta in metas]
+        if any(size is None for size in sizes):
+            return None
+        return sum(sizes)
+
+    @classmethod
+    def _choose_merge_method_by_size(
+        cls,
+        op: "DataFrameMerge",
+        left: TileableType,
+        right: TileableType,
+        left_size: int,
+        right_size: int,
+        bands_memory_avail: Dict = None,
+    ) -> Tuple[MergeMethod, Optional[bool]]:
+        """
+        Choose merge method by sizes of inputs in bytes. The smaller side
+        is broadcast if it does not exceed the threshold as well as the ratio
+        of the least available memory of workers, and copying it to workers
+        costs no more than shuffling both sides, otherwise shuffle is used.
+        Returns the method and if left side is the one to broadcast.
+        """
+        if len(left.chunks) == 1 and len(right.chunks) == 1:
+            return MergeMethod.one_chunk, None
+
+        candidates = []
+        if op.how in ["right", "inner"]:
+            candidates.append((left_size, True))
+        if op.how in ["left", "inner"]:
+            candidates.append((right_size, False))
+        if not candidates:
+            return MergeMethod.shuffle, None
+        small_size, broadcast_left = min(candidates)
+        big = right if broadcast_left else left
+
+        size_limit = op.broadcast_threshold
+        if size_limit is None:
+            size_limit = options.optimize.broadcast_join_threshold
+        memory_ratio = op.broadcast_memory_ratio
+        if memory_ratio is None:
+            memory_ratio = options.optimize.broadcast_join_memory_ratio
+        n_workers = 1
+        if bands_memory_avail:
+            size_limit = min(
+                size_limit, memory_ratio * min(bands_memory_avail.values())
+            )
+            n_workers = len({band[0] for band in bands_memory_avail})
+        n_copies = min(n_workers, len(big.chunks))
+        if small_size > size_limit or small_size * n_copies > left_size + right_size:
+            return MergeMethod.shuffle, None
+        small = left if broadcast_left else right
+        if len(small.chunks) == 1:
+            return MergeMethod.one_chunk, broadcast_left
+        return MergeMethod.broadcast, broadcast_left
+
     @classmethod
     def _choose_merge_method(
         cls, op: "DataFrameMerge", left: TileableType, right: TileableType
@@ -745,11 +1001,15 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         auto_merge_threshold = op.auto_merge_threshold
         auto_merge_before, auto_merge_after = cls._get_auto_merge_options(op.auto_merge)
 
+        # sizes of inputs in bytes, which are known after inputs are executed
+        left_size = right_size = None
         if (
             auto_merge_before
             and len(left.chunks) + len(right.chunks) > auto_merge_threshold
         ):
             yield TileStatus([left, right] + left.chunks + right.chunks, progress=0.2)
+            left_size = cls._get_data_size(ctx, left)
+            right_size = cls._get_data_size(ctx, right)
             left_chunk_size = len(left.chunks)
             right_chunk_size = len(right.chunks)
             left = auto_merge_chunks(ctx, left)
@@ -776,7 +1036,31 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
                 len(right.chunks),
             )
 
-        method = cls._choose_merge_method(op, left, right)
+        broadcast_left = None
+        if (
+            op.method == "auto"
+            and ctx is not None
+            and len(left.chunks) + len(right.chunks) > 2
+            and (left_size is None or right_size is None)
+        ):
+            # execute inputs to decide merge method by their sizes
+            yield TileStatus([left, right] + left.chunks + right.chunks, progress=0.2)
+            left_size = cls._get_data_size(ctx, left)
+            right_size = cls._get_data_size(ctx, right)
+        if op.method == "auto" and left_size is not None and right_size is not None:
+            method, broadcast_left = cls._choose_merge_method_by_size(
+                op, left, right, left_size, right_size, ctx.get_bands_memory_avail()
+            )
+            logger.info(
+                "Choose %s method for merge operand %s by sizes, "
+                "left data size: %s, right data size: %s.",
+                method,
+                op,
+                left_size,
+                right_size,
+            )
+        else:
+            method = cls._choose_merge_method(op, left, right)
         if cls._if_apply_bloom_filter(method, op, left, right):
             if has_unknown_shape(left, right):  # pragma: no cover
                 yield TileStatus(left.chunks + right.chunks, progress=0.3)
@@ -793,20 +1077,36 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
             )
             # auto merge after bloom filter
             yield TileStatus([left, right] + left.chunks + right.chunks, progress=0.5)
+            left_size = cls._get_data_size(ctx, left)
+            right_size = cls._get_data_size(ctx, right)
             left = auto_merge_chunks(ctx, left)
             right = auto_merge_chunks(ctx, right)
 
-            if op.method == "auto":
-                # if method is auto, select new method after auto merge
+            # if method is auto, select new method after auto merge
+            if op.method == "auto" and left_size is not None and right_size is not None:
+                method, broadcast_left = cls._choose_merge_method_by_size(
+                    op, left, right, left_size, right_size, ctx.get_bands_memory_avail()
+                )
+            elif op.method == "auto":
                 method = cls._choose_merge_method(op, left, right)
+                broadcast_left = None
         logger.info("Choose %s method for merge operand %s.", method, op)
         if method == MergeMethod.one_chunk:
             ret = cls._tile_one_chunk(op, left, right)
         elif method == MergeMethod.broadcast:
-            ret = cls._tile_broadcast(op, left, right)
+            ret = cls._tile_broadcast(op, left, right, broadcast_left)
         else:
             assert method == MergeMethod.shuffle
-            ret = cls._tile_shuffle(op, left, right)
+            n_reducers = max(left.chunk_shape[0], right.chunk_shape[0])
+            if left_size is not None and right_size is not None:
+                # coalesce or split partitions by sizes of inputs
+                n_reducers = adapt_shuffle_size(
+                    ctx, left_size + right_size, n_reducers, op.shuffle_partition_size
+                )
+            skew_info = None
+            if ctx is not None and op.skew_join is not False:
+                skew_info = yield from cls._detect_skew(op, left, right, n_reducers)
+            ret = cls._tile_shuffle(op, left, right, skew_info, n_reducers)
 
         if (
             op.how == "inner"
@@ -843,15 +1143,22 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
 
         if getattr(op, "split_info", None) is not None:
             split_info = op.split_info
+            # split on the same keys as the broadcast side is shuffled
             if split_info.split_side == "left":
-                index = hash_dataframe_on(left, on=op.on, size=split_info.nsplits)[
-                    split_info.split_index
-                ]
+                left_on = _prepare_shuffle_on(op.left_index, op.left_on, op.on)
+                index = hash_dataframe_on(
+                    _reset_shuffle_on_index(left, left_on),
+                    on=left_on,
+                    size=split_info.nsplits,
+                )[split_info.split_index]
                 left = left.iloc[index]
             else:
-                index = hash_dataframe_on(right, on=op.on, size=split_info.nsplits)[
-                    split_info.split_index
-                ]
+                right_on = _prepare_shuffle_on(op.right_index, op.right_on, op.on)
+                index = hash_dataframe_on(
+                    _reset_shuffle_on_index(right, right_on),
+                    on=right_on,
+                    size=split_info.nsplits,
+                )[split_info.split_index]
                 right = right.iloc[index]
 
         def execute_merge(x, y):
@@ -889,6 +1196,22 @@ class DataFrameMerge(DataFrameOperand, DataFrameOperandMixin):
         ctx[chunk.key] = r
 
 
+def _reset_shuffle_on_index(df, shuffle_on):
+    if shuffle_on is not None:
+        # shuffle on field may be resident in index
+        to_reset_index_names = []
+        if not isinstance(shuffle_on, (list, tuple)):
+            if shuffle_on not in df.dtypes:
+                to_reset_index_names.append(shuffle_on)
+        else:
+            for son in shuffle_on:
+                if son not in df.dtypes:
+                    to_reset_index_names.append(shuffle_on)
+        if len(to_reset_index_names) > 0:
+            df = df.reset_index(to_reset_index_names)
+    return df
+
+
 def _prepare_shuffle_on(use_index, side_on, on):
     # consistent with pandas: `left_index` precedes `left_on` and `right_index` precedes `right_on`
     if use_index:
@@ -919,6 +1242,8 @@ def merge(
     auto_merge_threshold: int = 8,
     bloom_filter: Union[bool, str] = "auto",
     bloom_filter_options: Dict[str, Any] = None,
+    skew_join: Union[bool, str] = "auto",
+    skew_join_options: Dict[str, Any] = None,
 ) -> DataFrame:
     """
     Merge DataFrame or named Series objects with a database-style join.
@@ -1021,6 +1346,17 @@ def merge(
           when chunk size of left and right is greater than this threshold, apply bloom filter
         * "filter": "large", "small", "both", default "large"
           decides to filter on large, small or both DataFrames.
+    skew_join: bool, str, default "auto"
+        Split rows of hot keys into multiple reducers when merging with shuffle,
+        rows of these keys on the other side are replicated to these reducers.
+        Only inner, left and right merges are supported. If "auto", hot keys
+        are split only when the largest reducer is much larger than the average.
+    skew_join_options: dict
+        * "threshold": ratio of the largest reducer size to the average size
+          to split hot keys when `skew_join` is "auto", default 2.0
+        * "max_hot_keys": max number of hot keys to split, default 64
+        * "sample_size": number of rows sampled from every chunk to detect
+          hot keys, default 10000
 
     Returns
     -------
@@ -1131,6 +1467,20 @@ def merge(
                 raise ValueError(
                     f"Invalid filter {k}, available: {BLOOM_FILTER_ON_OPTIONS}"
                 )
+    if skew_join not in [True, False, "auto"]:
+        raise ValueError(
+            f'skew_join can only be True, False, or "auto", got {skew_join}'
+        )
+    if skew_join_options:
+        if not isinstance(skew_join_options, dict):
+            raise TypeError(
+                f"skew_join_options must be a dict, got {type(skew_join_options)}"
+            )
+        for k in skew_join_options:
+            if k not in SKEW_JOIN_OPTIONS:
+                raise ValueError(
+                    f"Invalid skew join option {k}, available: {SKEW_JOIN_OPTIONS}"
+                )
     op = DataFrameMerge(
         how=how,
         on=on,
@@ -1148,6 +1498,11 @@ def merge(
         auto_merge_threshold=auto_merge_threshold,
         bloom_filter=bloom_filter,
         bloom_filter_options=bloom_filter_options,
+        skew_join=skew_join,
+        skew_join_options=skew_join_options,
+        broadcast_threshold=options.optimize.broadcast_join_threshold,
+        broadcast_memory_ratio=options.optimize.broadcast_join_memory_ratio,
+        shuffle_partition_size=get_shuffle_partition_size(),
         output_types=[OutputType.dataframe],
     )
     return op(df, right)
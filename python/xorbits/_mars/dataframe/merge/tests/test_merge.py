@@ -17,11 +17,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from ....config import option_context
 from ....core import tile
 from ....core.operand import OperandStage
 from ...core import IndexValue
 from ...datasource.dataframe import from_pandas
 from .. import DataFrameMerge, DataFrameMergeAlign, concat
+from ..merge import MergeMethod
 
 
 def test_merge():
@@ -236,6 +238,68 @@ def test_merge_one_chunk():
     assert tiled.chunks[1].inputs[1].key == tiled2.chunks[0].key
 
 
+def test_choose_merge_method_by_size():
+    df1 = pd.DataFrame({"key": np.arange(30), "value": np.random.rand(30)})
+    df2 = pd.DataFrame({"key": np.arange(200), "value": np.random.rand(200)})
+    mdf1 = from_pandas(df1, chunk_size=10)
+    mdf2 = from_pandas(df2, chunk_size=1)
+    df = mdf1.merge(mdf2, on="key")
+    assert df.op.broadcast_threshold == 64 * 1024**2
+    tiled1, tiled2 = tile(mdf1, mdf2)
+    choose = DataFrameMerge._choose_merge_method_by_size
+
+    # large table with few chunks is shuffled instead of broadcast
+    gb, mb = 1024**3, 1024**2
+    assert choose(df.op, tiled1, tiled2, 15 * gb, 200 * mb) == (
+        MergeMethod.shuffle,
+        None,
+    )
+    # small table with many chunks is broadcast
+    assert choose(df.op, tiled1, tiled2, 15 * gb, 50 * mb) == (
+        MergeMethod.broadcast,
+        False,
+    )
+    assert choose(df.op, tiled1, tiled2, 10 * mb, 15 * gb) == (
+        MergeMethod.broadcast,
+        True,
+    )
+    # limited by available memory of workers
+    bands_memory_avail = {("worker1", "numa-0"): 100 * mb}
+    assert choose(df.op, tiled1, tiled2, 15 * gb, 50 * mb, bands_memory_avail) == (
+        MergeMethod.shuffle,
+        None,
+    )
+    # copies to all workers cost more than shuffle
+    bands_memory_avail = {(f"worker{i}", "numa-0"): 10 * gb for i in range(10)}
+    assert choose(df.op, tiled1, tiled2, 100 * mb, 60 * mb, bands_memory_avail) == (
+        MergeMethod.shuffle,
+        None,
+    )
+
+    # only the side allowed by `how` can be broadcast
+    df = mdf1.merge(mdf2, on="key", how="left")
+    assert choose(df.op, tiled1, tiled2, 10 * mb, 15 * gb) == (
+        MergeMethod.shuffle,
+        None,
+    )
+
+    with option_context({"optimize.broadcast_join_threshold": 10 * gb}):
+        df = mdf1.merge(mdf2, on="key")
+    assert choose(df.op, tiled1, tiled2, 15 * gb, 1 * gb) == (
+        MergeMethod.broadcast,
+        False,
+    )
+
+    # one chunk of the small table
+    mdf3 = from_pandas(df2)
+    df = mdf1.merge(mdf3, on="key")
+    tiled3 = tile(mdf3)
+    assert choose(df.op, tiled1, tiled3, 15 * gb, 50 * mb) == (
+        MergeMethod.one_chunk,
+        False,
+    )
+
+
 def test_append():
     df1 = pd.DataFrame(np.random.rand(10, 4), columns=list("ABCD"))
     df2 = pd.DataFrame(np.random.rand(10, 4), columns=list("ABCD"))
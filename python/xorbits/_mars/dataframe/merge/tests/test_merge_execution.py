@@ -17,6 +17,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from ....config import option_context
 from ....core.graph.builder.utils import build_graph
 from ...datasource.dataframe import from_pandas
 from ...datasource.series import from_pandas as series_from_pandas
@@ -637,6 +638,119 @@ def test_merge_with_bloom_filter_options(setup, filter):
     )
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "right"])
+def test_merge_by_size(setup, how):
+    rs = np.random.RandomState(0)
+    raw_df1 = pd.DataFrame({"key": rs.randint(100, size=200), "col1": rs.rand(200)})
+    raw_df2 = pd.DataFrame({"key": np.arange(50), "col2": rs.rand(50)})
+    expected = raw_df1.merge(raw_df2, on="key", how=how)
+
+    df1 = from_pandas(raw_df1, chunk_size=100)
+    df2 = from_pandas(raw_df2, chunk_size=5)
+    # the table with more chunks is broadcast or shuffled by sizes
+    for threshold in [0, 64 * 1024**2]:
+        with option_context({"optimize.broadcast_join_threshold": threshold}):
+            m = df1.merge(df2, on="key", how=how, auto_merge="none")
+        result = m.execute().fetch()
+        pd.testing.assert_frame_equal(
+            expected.sort_values(by=["key", "col1"]).reset_index(drop=True),
+            result.sort_values(by=["key", "col1"]).reset_index(drop=True),
+        )
+
+
+@pytest.mark.skip_ray_dag  # _fetch_infos() is not supported by ray backend.
+def test_merge_adaptive_shuffle(setup):
+    rs = np.random.RandomState(0)
+    raw_df1 = pd.DataFrame({"key": rs.randint(100, size=400), "col1": rs.rand(400)})
+    raw_df2 = pd.DataFrame({"key": np.arange(100), "col2": rs.rand(100)})
+    expected = raw_df1.merge(raw_df2, on="key")
+    data_size = raw_df1.memory_usage().sum() + raw_df2.memory_usage().sum()
+
+    df1 = from_pandas(raw_df1, chunk_size=40)
+    df2 = from_pandas(raw_df2, chunk_size=10)
+    n_chunks = dict()
+    for adaptive, partition_size in [
+        (False, None),
+        (True, None),
+        (True, int(data_size / 30)),
+    ]:
+        with option_context(
+            {
+                "optimize.broadcast_join_threshold": 0,
+                "optimize.adaptive_shuffle": adaptive,
+                "optimize.shuffle_partition_size": partition_size,
+            }
+        ):
+            m = df1.merge(df2, on="key", auto_merge="none")
+            r = m.execute()
+        result = r.fetch()
+        pd.testing.assert_frame_equal(
+            expected.sort_values(by=["key", "col1"]).reset_index(drop=True),
+            result.sort_values(by=["key", "col1"]).reset_index(drop=True),
+        )
+        n_chunks[adaptive, partition_size] = len(r._fetch_infos()["memory_size"])
+    assert n_chunks[False, None] == 10
+    # small partitions are coalesced
+    assert n_chunks[True, None] < 10
+    # oversized partitions are split
+    assert n_chunks[True, int(data_size / 30)] > 10
+
+
+@pytest.mark.skip_ray_dag  # _fetch_infos() is not supported by ray backend.
+@pytest.mark.parametrize("how", ["inner", "left", "right"])
+def test_skew_merge(setup, how):
+    ns = np.random.RandomState(0)
+    # 40% of rows share one key
+    keys = np.concatenate([np.zeros(200, dtype=int), ns.randint(1, 20, size=300)])
+    ns.shuffle(keys)
+    raw_df1 = pd.DataFrame({"key": keys, "col1": ns.random(500)})
+    raw_df2 = pd.DataFrame({"key": np.repeat(np.arange(25), 3), "col2": ns.random(75)})
+    if how == "right":
+        raw_df1, raw_df2 = raw_df2, raw_df1
+
+    df1 = from_pandas(raw_df1, chunk_size=50 if how != "right" else 10)
+    df2 = from_pandas(raw_df2, chunk_size=10 if how != "right" else 50)
+    expected = raw_df1.merge(raw_df2, on="key", how=how)
+
+    max_chunk_sizes = dict()
+    for skew_join in ["auto", True, False]:
+        m = df1.merge(
+            df2,
+            on="key",
+            how=how,
+            method="shuffle",
+            auto_merge="none",
+            skew_join=skew_join,
+        )
+        r = m.execute()
+        result = r.fetch()
+        pd.testing.assert_frame_equal(
+            expected.sort_values(by=["key", "col1", "col2"]).reset_index(drop=True),
+            result.sort_values(by=["key", "col1", "col2"]).reset_index(drop=True),
+        )
+        max_chunk_sizes[skew_join] = max(r._fetch_infos()["memory_size"])
+    # rows of the hot key are split into several reducers
+    assert max_chunk_sizes["auto"] == max_chunk_sizes[True]
+    assert max_chunk_sizes[True] < max_chunk_sizes[False] / 2
+
+    # not skewed
+    m = df1.merge(
+        df2,
+        on="key",
+        how=how,
+        method="shuffle",
+        auto_merge="none",
+        skew_join_options={"threshold": 100},
+    )
+    r = m.execute()
+    assert max(r._fetch_infos()["memory_size"]) == max_chunk_sizes[False]
+
+    with pytest.raises(ValueError):
+        df1.merge(df2, skew_join="unknown")
+    with pytest.raises(ValueError):
+        df1.merge(df2, skew_join_options={"unknown": 1})
+
+
 @pytest.mark.parametrize("auto_merge", ["none", "both", "before", "after"])
 def test_merge_on_duplicate_columns(setup, auto_merge):
     raw1 = pd.DataFrame(
@@ -652,10 +766,12 @@ def test_merge_on_duplicate_columns(setup, auto_merge):
     df1 = from_pandas(raw1, chunk_size=2)
     df2 = from_pandas(raw2, chunk_size=3)
 
+    # index of the result is only identical to pandas when shuffled
     r = df1.merge(
         df2,
         left_on="lkey",
         right_on="rkey",
+        method="shuffle",
         auto_merge=auto_merge,
         auto_merge_threshold=0,
     )
@@ -28,6 +28,7 @@ from ...utils import Timer
 from ..core import IndexValue
 from ..initializer import DataFrame, Index, Series
 from ..utils import (
+    adapt_shuffle_size,
     auto_merge_chunks,
     build_concatenated_rows_frame,
     build_split_idx_to_origin_idx,
@@ -35,6 +36,7 @@ from ..utils import (
     decide_series_chunk_size,
     fetch_corner_data,
     filter_index_value,
+    get_shuffle_partition_size,
     infer_dtypes,
     infer_index_value,
     make_dtypes,
@@ -645,3 +647,30 @@ def test_auto_merge_chunks():
     assert isinstance(s2.chunks[1].op, DataFrameConcat)
     assert s2.chunks[1].name == "a"
     assert len(s2.chunks[1].op.inputs) == 2
+
+
+def test_adapt_shuffle_size():
+    class FakeContext:
+        def get_total_n_cpu(self) -> int:
+            return 4
+
+    ctx = FakeContext()
+    # small partitions are coalesced, but not fewer than the number of cpus
+    assert adapt_shuffle_size(ctx, 1000, 16, 100) == 10
+    assert adapt_shuffle_size(ctx, 100, 16, 100) == 4
+    assert adapt_shuffle_size(ctx, 100, 2, 100) == 2
+    # oversized partitions are split
+    assert adapt_shuffle_size(ctx, 1000, 2, 100) == 10
+
+    # size unknown or adaptive shuffle disabled
+    assert adapt_shuffle_size(ctx, None, 16, 100) == 16
+    assert adapt_shuffle_size(ctx, np.nan, 16, 100) == 16
+    assert adapt_shuffle_size(None, 1000, 16, 100) == 16
+    assert adapt_shuffle_size(ctx, 1000, 16, None) == 16
+
+    with option_context({"chunk_store_limit": 500}):
+        assert get_shuffle_partition_size() == 500
+    with option_context({"optimize.shuffle_partition_size": "1k"}):
+        assert get_shuffle_partition_size() == 1024
+    with option_context({"optimize.adaptive_shuffle": False}):
+        assert get_shuffle_partition_size() is None
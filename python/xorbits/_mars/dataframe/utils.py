@@ -19,7 +19,7 @@ import logging
 import operator
 from contextlib import contextmanager
 from numbers import Integral
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -70,7 +70,11 @@ def hash_index(index, size):
     return [idx_to_grouped.get(i, list()) for i in range(size)]
 
 
-def hash_dataframe_on(df, on, size, level=None):
+def hash_labels_on(df, on, level=None) -> pd.Series:
+    """
+    Hash labels to shuffle on into uint64 values, which are
+    the index, a callable on the index, or columns of the DataFrame.
+    """
     if on is None:
         idx = df.index
         if level is not None:
@@ -93,6 +97,11 @@ def hash_dataframe_on(df, on, size, level=None):
         else:
             data = df[on]
         hashed_label = pd.util.hash_pandas_object(data, index=False, categorize=False)
+    return hashed_label
+
+
+def hash_dataframe_on(df, on, size, level=None):
+    hashed_label = hash_labels_on(df, on, level=level)
     idx_to_grouped = pd.RangeIndex(0, len(hashed_label)).groupby(hashed_label % size)
     return [idx_to_grouped.get(i, pd.Index([])) for i in range(size)]
 
@@ -1442,6 +1451,56 @@ def auto_merge_chunks(
     return new_op.new_tileable(df_or_series.op.inputs, kws=[params])
 
 
+def get_shuffle_partition_size() -> Optional[int]:
+    """
+    Get size in bytes of every partition of adaptive shuffles from options,
+    None is returned if adaptive shuffle is disabled.
+    """
+    if not options.optimize.adaptive_shuffle:
+        return None
+    partition_size = options.optimize.shuffle_partition_size
+    if partition_size is None:
+        return int(options.chunk_store_limit)
+    elif isinstance(partition_size, str):
+        return int(parse_readable_size(partition_size)[0])
+    return int(partition_size)
+
+
+def adapt_shuffle_size(
+    ctx: Context,
+    data_size: Union[int, float, None],
+    shuffle_size: int,
+    partition_size: Optional[int],
+) -> int:
+    """
+    Decide the number of reducers of a shuffle by the size of data to shuffle
+    in bytes, which is known after inputs of mappers are executed. Small
+    partitions are coalesced, but not fewer than the number of cpus unless
+    the planned shuffle is smaller, and oversized partitions are split.
+    The planned number is kept if the size is unknown.
+    """
+    if (
+        ctx is None
+        or partition_size is None
+        or data_size is None
+        or np.isnan(data_size)
+    ):
+        return shuffle_size
+
+    n_cpu = int(ctx.get_total_n_cpu()) or 1
+    adapted_size = max(
+        int(np.ceil(data_size / partition_size)), min(shuffle_size, n_cpu), 1
+    )
+    if adapted_size != shuffle_size:
+        logger.debug(
+            "Adapt shuffle size from %s to %s by data size %s",
+            shuffle_size,
+            adapted_size,
+            data_size,
+        )
+    return adapted_size
+
+
 def concat_on_columns(objs: List) -> Any:
     xdf = get_xdf(objs[0])
     # In cudf, concat with axis=1 and ignore_index=False by default behaves opposite to pandas.
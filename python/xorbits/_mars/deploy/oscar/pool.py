@@ -21,7 +21,7 @@ from typing import Dict, List, Optional, Tuple
 
 from ... import oscar as mo
 from ...constants import MARS_LOG_PATH_KEY, MARS_LOG_PREFIX, MARS_TMP_DIR_PREFIX
-from ...resource import Resource, cuda_count
+from ...resource import Resource, cuda_count, numa_nodes
 
 logger = logging.getLogger(__name__)
 
@@ -194,6 +194,64 @@ async def create_supervisor_actor_pool(
     )
 
 
+def _split_by_weights(total: int, weights: List[float]) -> List[int]:
+    # split total into parts proportional to weights by largest remainders
+    weight_sum = sum(weights)
+    exact = [total * w / weight_sum for w in weights]
+    parts = [int(v) for v in exact]
+    remainders = sorted(
+        range(len(weights)), key=lambda idx: exact[idx] - parts[idx], reverse=True
+    )
+    for idx in remainders[: total - sum(parts)]:
+        parts[idx] += 1
+    return parts
+
+
+def _get_numa_node_cpu_counts(n_cpu: int, nodes: List) -> List[Tuple]:
+    cpu_counts = _split_by_weights(n_cpu, [len(node.cpus) for node in nodes])
+    return [(node, count) for node, count in zip(nodes, cpu_counts) if count > 0]
+
+
+def get_numa_band_to_resource(
+    n_cpu: int, mem_bytes: int, nodes: List = None
+) -> Dict[str, Resource]:
+    """
+    Split CPUs and memory of a worker into one band per NUMA node,
+    proportional to CPUs and memory of every node. A single band
+    ``numa-0`` is returned if NUMA topology is not available.
+    """
+    nodes = numa_nodes() if nodes is None else nodes
+    node_cpu_counts = _get_numa_node_cpu_counts(n_cpu, nodes)
+    if len(node_cpu_counts) <= 1:
+        return {"numa-0": Resource(num_cpus=n_cpu, mem_bytes=mem_bytes)}
+
+    if all(node.mem_total for node, _ in node_cpu_counts):
+        mem_weights = [node.mem_total for node, _ in node_cpu_counts]
+    else:  # pragma: no cover
+        mem_weights = [count for _, count in node_cpu_counts]
+    mem_sizes = _split_by_weights(mem_bytes, mem_weights)
+    return {
+        f"numa-{idx}": Resource(num_cpus=count, mem_bytes=mem_size)
+        for idx, ((_, count), mem_size) in enumerate(zip(node_cpu_counts, mem_sizes))
+    }
+
+
+def get_numa_band_cpus(
+    band_to_resource: Dict[str, Resource], nodes: List = None
+) -> Dict[str, List[int]]:
+    """
+    Get CPUs of NUMA nodes to pin sub pools of every band to, when bands
+    are split by :func:`get_numa_band_to_resource`.
+    """
+    nodes = numa_nodes() if nodes is None else nodes
+    numa_bands = [band for band in band_to_resource if band.startswith("numa")]
+    n_cpu = sum(int(band_to_resource[band].num_cpus) for band in numa_bands)
+    node_cpu_counts = _get_numa_node_cpu_counts(n_cpu, nodes)
+    if len(numa_bands) <= 1 or len(node_cpu_counts) != len(numa_bands):
+        return dict()
+    return {band: node.cpus for band, (node, _) in zip(numa_bands, node_cpu_counts)}
+
+
 async def create_worker_actor_pool(
     address: str,
     band_to_resource: Dict[str, Resource],
@@ -207,7 +265,6 @@ async def create_worker_actor_pool(
 ):
     logging_conf = _config_logging(**kwargs)
     kwargs["logging_conf"] = logging_conf
-    # TODO: support NUMA when ready
     n_process = sum(
         int(resource.num_cpus) or int(resource.num_gpus)
         for resource in band_to_resource.values()
@@ -219,6 +276,10 @@ async def create_worker_actor_pool(
     numa_config = oscar_config.get("numa", dict())
     numa_external_address_scheme = numa_config.get("external_addr_scheme")
     numa_enable_internal_address = numa_config.get("enable_internal_addr")
+    if numa_config.get("split_bands"):
+        band_to_cpus = get_numa_band_cpus(band_to_resource)
+    else:
+        band_to_cpus = dict()
     gpu_config = oscar_config.get("gpu", dict())
     gpu_external_address_scheme = gpu_config.get("external_addr_scheme")
     gpu_enable_internal_address = gpu_config.get("enable_internal_addr")
@@ -244,9 +305,15 @@ async def create_worker_actor_pool(
         else:
             assert band.startswith("numa")
             num_cpus = int(resource.num_cpus)
+            env = dict()
             if cuda_devices:
                 # if has cuda device, disable all cuda devices for numa processes
-                envs.extend([{"CUDA_VISIBLE_DEVICES": "-1"} for _ in range(num_cpus)])
+                env["CUDA_VISIBLE_DEVICES"] = "-1"
+            if band in band_to_cpus:
+                # pin processes of the band to CPUs of its NUMA node
+                env["MARS_CPU_AFFINITY"] = ",".join(str(c) for c in band_to_cpus[band])
+            if env:
+                envs.extend([env.copy() for _ in range(num_cpus)])
             labels.extend([band] * num_cpus)
             external_address_schemes.extend(
                 [numa_external_address_scheme for _ in range(num_cpus)]
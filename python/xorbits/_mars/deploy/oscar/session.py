@@ -56,6 +56,7 @@ from ...services.storage import StorageAPI
 from ...services.task import AbstractTaskAPI, TaskAPI, TaskResult
 from ...services.task.execution.api import Fetcher
 from ...services.web import OscarWebAPI
+from ...storage import StorageLevel
 from ...typing import BandType, ClientType
 from ...utils import (
     Timer,
@@ -266,6 +267,34 @@ class AbstractAsyncSession(AbstractSession, metaclass=ABCMeta):
         data
         """
 
+    @abstractmethod
+    async def persist(self, *tileables, level: str = "memory", priority: int = 1):
+        """
+        Keep data of executed tileables in storage across executions,
+        tileables with the same keys reuse the data instead of
+        being computed again.
+
+        Parameters
+        ----------
+        tileables
+            Tileables.
+        level : str
+            Storage level to keep data, 'memory' or 'disk'.
+        priority : int
+            Data with higher priority is spilled later.
+        """
+
+    @abstractmethod
+    async def unpersist(self, *tileables):
+        """
+        Stop keeping data of tileables.
+
+        Parameters
+        ----------
+        tileables
+            Tileables.
+        """
+
     @abstractmethod
     async def _get_ref_counts(self) -> Dict[str, int]:
         """
@@ -534,6 +563,34 @@ class AbstractSyncSession(AbstractSession, metaclass=ABCMeta):
             Tileables' keys
         """
 
+    @abstractmethod
+    def persist(self, *tileables, level: str = "memory", priority: int = 1):
+        """
+        Keep data of executed tileables in storage across executions,
+        tileables with the same keys reuse the data instead of
+        being computed again.
+
+        Parameters
+        ----------
+        tileables
+            Tileables.
+        level : str
+            Storage level to keep data, 'memory' or 'disk'.
+        priority : int
+            Data with higher priority is spilled later.
+        """
+
+    @abstractmethod
+    def unpersist(self, *tileables):
+        """
+        Stop keeping data of tileables.
+
+        Parameters
+        ----------
+        tileables
+            Tileables.
+        """
+
     @abstractmethod
     def _get_ref_counts(self) -> Dict[str, int]:
         """
@@ -676,7 +733,17 @@ def gen_submit_tileable_graph(
     session: "AbstractSession",
     result_tileables: List[TileableType],
     warn_duplicated_execution: bool = False,
+    cached_tileables: Dict[str, TileableType] = None,
 ) -> Tuple[TileableGraph, List[TileableType]]:
+    cached_tileables = cached_tileables or dict()
+
+    def is_executed(t: TileableType) -> bool:
+        # tileables with the same key as cached ones reuse their data
+        return session in t._executed_sessions or t.key in cached_tileables
+
+    def gen_fetch(t: TileableType) -> TileableType:
+        return build_fetch(cached_tileables.get(t.key, t)).data
+
     tileable_to_copied = dict()
     indexer = itertools.count()
     result_to_index = {t: i for t, i in zip(result_tileables, indexer)}
@@ -692,15 +759,18 @@ def gen_submit_tileable_graph(
         if tileable.cache and tileable not in result_to_index:
             result_to_index[tileable] = next(indexer)
         outputs = tileable.op.outputs
-        inputs = tileable.inputs if session not in tileable._executed_sessions else []
+        executed = session in tileable._executed_sessions or all(
+            out.key in cached_tileables for out in outputs
+        )
+        inputs = tileable.inputs if not executed else []
         new_inputs = []
         all_inputs_processed = True
         for inp in inputs:
             if inp in tileable_to_copied:
                 new_inputs.append(tileable_to_copied[inp])
-            elif session in inp._executed_sessions:
+            elif is_executed(inp):
                 # executed, gen fetch
-                fetch_input = build_fetch(inp).data
+                fetch_input = gen_fetch(inp)
                 tileable_to_copied[inp] = fetch_input
                 graph.add_node(fetch_input)
                 new_inputs.append(fetch_input)
@@ -714,10 +784,10 @@ def gen_submit_tileable_graph(
         if all_inputs_processed:
             if isinstance(tileable.op, Fetch):
                 new_outputs = [tileable]
-            elif session in tileable._executed_sessions:
+            elif executed:
                 new_outputs = []
                 for out in outputs:
-                    fetch_out = tileable_to_copied.get(out, build_fetch(out).data)
+                    fetch_out = tileable_to_copied.get(out, gen_fetch(out))
                     new_outputs.append(fetch_out)
             else:
                 new_outputs = [
@@ -780,6 +850,8 @@ class _IsolatedSession(AbstractAsyncSession):
         self._request_rewriter = request_rewriter
 
         self._tileable_to_fetch = WeakKeyDictionary()
+        # key -> persisted tileable, data of which is kept across executions
+        self._cached_tileables: Dict[str, TileableType] = dict()
         self._asyncio_task_timeout_detector_task = (
             register_asyncio_task_timeout_detector()
         )
@@ -963,6 +1035,16 @@ class _IsolatedSession(AbstractAsyncSession):
                 # update meta, e.g. unknown shape
                 tileable.params = fetch_tileable.params
 
+            # results reusing persisted data will be decref-ed when deleted
+            reused_keys = [
+                t.key
+                for t in tileables
+                if t.key in self._cached_tileables
+                and self not in t._executed_sessions
+            ]
+            if reused_keys:
+                await self._lifecycle_api.incref_tileables(reused_keys)
+
     async def execute(self, *tileables, **kwargs) -> ExecutionInfo:
         if self._closed:
             raise RuntimeError("Session closed already")
@@ -980,7 +1062,10 @@ class _IsolatedSession(AbstractAsyncSession):
         # build tileable graph
         with Timer() as timer:
             tileable_graph, to_execute_tileables = gen_submit_tileable_graph(
-                self, tileables, warn_duplicated_execution=warn_duplicated_execution
+                self,
+                tileables,
+                warn_duplicated_execution=warn_duplicated_execution,
+                cached_tileables=self._cached_tileables,
             )
 
         logger.info(
@@ -1255,6 +1340,53 @@ class _IsolatedSession(AbstractAsyncSession):
         }
         return chunk_to_bands, fetch_infos_list, None
 
+    async def _persist_chunks(
+        self,
+        tileables: List[TileableType],
+        level: Optional[StorageLevel],
+        priority: int,
+        error: str = "raise",
+    ):
+        chunk_to_bands, fetch_infos_list, _ = await self._query_meta_service(
+            tileables, {"bands"}, True
+        )
+        storage_api_to_keys = defaultdict(list)
+        for fetch_info in itertools.chain(*fetch_infos_list):
+            for band in chunk_to_bands[fetch_info.chunk]:
+                storage_api = await self._get_storage_api(band)
+                storage_api_to_keys[storage_api].append(fetch_info.chunk.key)
+        for storage_api, keys in storage_api_to_keys.items():
+            await storage_api.persist(keys, level, priority, error)
+
+    async def persist(self, *tileables, level: str = "memory", priority: int = 1):
+        try:
+            storage_level = StorageLevel[level.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown storage level: {level}") from None
+        with enter_mode(build=True):
+            tileables = [
+                tileable.data if hasattr(tileable, "data") else tileable
+                for tileable in tileables
+            ]
+            await self._persist_chunks(tileables, storage_level, priority)
+            for tileable in tileables:
+                self._cached_tileables[tileable.key] = tileable
+
+    async def unpersist(self, *tileables):
+        with enter_mode(build=True):
+            tileables = [
+                tileable.data if hasattr(tileable, "data") else tileable
+                for tileable in tileables
+            ]
+            tileables = [
+                self._cached_tileables.pop(t.key)
+                for t in tileables
+                if t.key in self._cached_tileables
+            ]
+            if tileables:
+                # reset priorities, data is released when tileables are deleted
+                await self._persist_chunks(tileables, None, 0, error="ignore")
+
     async def decref(self, *tileable_keys):
         logger.debug("Decref tileables on client: %s", tileable_keys)
         return await self._lifecycle_api.decref_tileables(list(tileable_keys))
@@ -1293,6 +1425,7 @@ class _IsolatedSession(AbstractAsyncSession):
         await super().destroy()
         await self._session_api.delete_session(self._session_id)
         self._tileable_to_fetch.clear()
+        self._cached_tileables.clear()
         if self._asyncio_task_timeout_detector_task:  # pragma: no cover
             self._asyncio_task_timeout_detector_task.cancel()
 
@@ -1469,6 +1602,16 @@ class AsyncSession(AbstractAsyncSession):
             asyncio.run_coroutine_threadsafe(coro, self._loop)
         )
 
+    @implements(AbstractAsyncSession.persist)
+    @_delegate_to_isolated_session
+    async def persist(self, *tileables, level: str = "memory", priority: int = 1):
+        pass  # pragma: no cover
+
+    @implements(AbstractAsyncSession.unpersist)
+    @_delegate_to_isolated_session
+    async def unpersist(self, *tileables):
+        pass  # pragma: no cover
+
     @implements(AbstractAsyncSession._get_ref_counts)
     @_delegate_to_isolated_session
     async def _get_ref_counts(self) -> Dict[str, int]:
@@ -1717,6 +1860,16 @@ class SyncSession(AbstractSyncSession):
     def decref(self, *tileables_keys):
         pass  # pragma: no cover
 
+    @implements(AbstractSyncSession.persist)
+    @_delegate_to_isolated_session
+    def persist(self, *tileables, level: str = "memory", priority: int = 1):
+        pass  # pragma: no cover
+
+    @implements(AbstractSyncSession.unpersist)
+    @_delegate_to_isolated_session
+    def unpersist(self, *tileables):
+        pass  # pragma: no cover
+
     @implements(AbstractSyncSession._get_ref_counts)
     @_delegate_to_isolated_session
     def _get_ref_counts(self) -> Dict[str, int]:
@@ -1944,6 +2097,43 @@ def fetch_infos(
     return session.fetch_infos(tileable, *tileables, fields=fields, **kwargs)
 
 
+def persist(
+    tileable: TileableType,
+    *tileables: Tuple[TileableType],
+    session: SyncSession = None,
+    level: str = "memory",
+    priority: int = 1,
+    **kwargs,
+):
+    if isinstance(tileable, (tuple, list)) and len(tileables) == 0:
+        tileable, tileables = tileable[0], tileable[1:]
+    if session is None:
+        session = get_default_or_create()
+    session = _ensure_sync(session)
+    tileables = (tileable,) + tuple(tileables)
+    to_execute = [
+        t for t in tileables if session._isolated_session not in t._executed_sessions
+    ]
+    if to_execute:
+        session.execute(*to_execute, **kwargs)
+    session.persist(*tileables, level=level, priority=priority)
+
+
+def unpersist(
+    tileable: TileableType,
+    *tileables: Tuple[TileableType],
+    session: SyncSession = None,
+):
+    if isinstance(tileable, (tuple, list)) and len(tileables) == 0:
+        tileable, tileables = tileable[0], tileable[1:]
+    if session is None:
+        session = get_default_session()
+        if session is None:  # pragma: no cover
+            raise ValueError("No session found")
+    session = _ensure_sync(session)
+    session.unpersist(tileable, *tileables)
+
+
 def fetch_log(*tileables: TileableType, session: SyncSession = None, **kwargs):
     if len(tileables) == 1 and isinstance(tileables[0], (list, tuple)):
         tileables = tileables[0]
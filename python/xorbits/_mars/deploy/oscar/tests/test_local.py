@@ -338,6 +338,30 @@ async def test_iterative_tiling(create_cluster):
                 )
 
 
+@pytest.mark.asyncio
+async def test_profiling_shuffle_bytes(create_cluster):
+    session = get_default_async_session()
+
+    raw = pd.DataFrame(
+        {"a": np.random.RandomState(0).randint(0, 10, 100), "b": np.arange(100)}
+    )
+    df = md.DataFrame(raw, chunk_size=20)
+    r = df.groupby("a").agg("sum", method="shuffle")
+
+    info = await session.execute(r, extra_config={"enable_profiling": True})
+    await info
+    general = info.profiling_result()["supervisor"]["general"]
+    assert general["shuffle_bytes"] > 0
+    pd.testing.assert_frame_equal(
+        (await session.fetch(r)).sort_index(), raw.groupby("a").sum()
+    )
+
+    r = df + 1
+    info = await session.execute(r, extra_config={"enable_profiling": True})
+    await info
+    assert "shuffle_bytes" not in info.profiling_result()["supervisor"]["general"]
+
+
 @pytest.mark.asyncio
 async def test_execute_describe(create_cluster):
     s = np.random.RandomState(0)
@@ -890,6 +914,48 @@ def test_decref(setup_session):
     _assert_storage_cleaned(session.session_id, worker_addr, StorageLevel.MEMORY)
 
 
+def test_persist(setup_session):
+    session = setup_session
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        file_path = os.path.join(tempdir, "test.parquet")
+        pdf = pd.DataFrame({"a": np.arange(100), "b": np.random.rand(100)})
+        pdf.to_parquet(file_path)
+
+        df = md.read_parquet(file_path, columns=["a"])
+        assert df.persist() is df
+        del df
+        gc.collect()
+        ref_counts = session._get_ref_counts()
+        assert len(ref_counts) == 1
+
+        # data of the same source is reused even if the source changes
+        pd.DataFrame({"a": np.arange(100) + 1, "b": pdf["b"]}).to_parquet(file_path)
+        df = md.read_parquet(file_path, columns=["a"])
+        result = (df * 2).sum().execute().fetch()
+        assert result["a"] == pdf["a"].sum() * 2
+        pd.testing.assert_frame_equal(df.execute().fetch(), pdf[["a"]])
+
+        del df
+        gc.collect()
+        ref_counts = session._get_ref_counts()
+        assert len(ref_counts) == 1
+
+        df = md.read_parquet(file_path, columns=["a"])
+        df.unpersist()
+        del df
+        gc.collect()
+        ref_counts = session._get_ref_counts()
+        assert len(ref_counts) == 0
+
+        df = md.read_parquet(file_path, columns=["a"])
+        result = df.sum().execute().fetch()
+        assert result["a"] == pdf["a"].sum() + 100
+
+        with pytest.raises(ValueError):
+            df.persist(level="unknown")
+
+
 def _assert_worker_pool_storage_cleaned(session):
     worker_addr = session._session.client._cluster._worker_pools[0].external_address
     _assert_storage_cleaned(session.session_id, worker_addr, StorageLevel.MEMORY)
@@ -24,6 +24,8 @@ from ..pool import (
     _config_logging,
     _get_root_logger_level_and_format,
     _parse_file_logging_config,
+    get_numa_band_cpus,
+    get_numa_band_to_resource,
 )
 
 
@@ -113,3 +115,31 @@ def test_pool_with_no_web_config(init):
     _config_logging(**kwargs)
     log_path = os.environ.get(MARS_LOG_PATH_KEY)
     assert log_path is None
+
+
+def test_numa_bands():
+    from ....resource import Resource, _numa_node_info
+
+    nodes = [
+        _numa_node_info(0, [0, 1, 2, 3], 1024),
+        _numa_node_info(1, [4, 5, 6, 7], 3072),
+    ]
+    band_to_resource = get_numa_band_to_resource(6, 4000, nodes)
+    assert band_to_resource == {
+        "numa-0": Resource(num_cpus=3, mem_bytes=1000),
+        "numa-1": Resource(num_cpus=3, mem_bytes=3000),
+    }
+    assert get_numa_band_cpus(band_to_resource, nodes) == {
+        "numa-0": [0, 1, 2, 3],
+        "numa-1": [4, 5, 6, 7],
+    }
+
+    # CPUs too few to be split
+    band_to_resource = get_numa_band_to_resource(1, 4000, nodes)
+    assert band_to_resource == {"numa-0": Resource(num_cpus=1, mem_bytes=4000)}
+    assert get_numa_band_cpus(band_to_resource, nodes) == {}
+
+    # no NUMA topology
+    band_to_resource = get_numa_band_to_resource(8, 4000, [])
+    assert band_to_resource == {"numa-0": Resource(num_cpus=8, mem_bytes=4000)}
+    assert get_numa_band_cpus(band_to_resource, []) == {}
@@ -20,7 +20,7 @@ from ...services import NodeRole
 from ...utils import get_next_port
 from .cmdline import OscarCommandRunner
 from .local import start_worker, stop_worker
-from .pool import create_worker_actor_pool
+from .pool import create_worker_actor_pool, get_numa_band_to_resource
 
 
 class WorkerCommandRunner(OscarCommandRunner):
@@ -75,8 +75,12 @@ class WorkerCommandRunner(OscarCommandRunner):
         else:  # pragma: no cover
             self.cuda_devices = [int(i) for i in args.cuda_devices.split(",")]
 
-        self.band_to_resource = band_to_resource = dict()
-        band_to_resource["numa-0"] = Resource(num_cpus=n_cpu, mem_bytes=mem_bytes)
+        numa_config = self.config.get("oscar", {}).get("numa", {})
+        if numa_config.get("split_bands"):
+            band_to_resource = get_numa_band_to_resource(n_cpu, mem_bytes)
+        else:
+            band_to_resource = {"numa-0": Resource(num_cpus=n_cpu, mem_bytes=mem_bytes)}
+        self.band_to_resource = band_to_resource
         for i in self.cuda_devices:  # pragma: no cover
             band_to_resource[f"gpu-{i}"] = Resource(num_gpus=1)
 
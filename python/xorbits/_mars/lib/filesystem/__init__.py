@@ -15,7 +15,14 @@
 
 from .azure import AzureBlobFileSystem
 from .base import FileSystem
-from .core import file_size, get_fs, glob, open_file, register_filesystem
+from .core import (
+    file_fingerprint,
+    file_size,
+    get_fs,
+    glob,
+    open_file,
+    register_filesystem,
+)
 from .fsmap import FSMap
 
 # noinspection PyUnresolvedReferences
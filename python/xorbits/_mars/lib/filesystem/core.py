@@ -15,7 +15,7 @@
 
 import glob as glob_
 import os
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
 from ..compression import compress
@@ -81,6 +81,34 @@ def file_size(path: path_type, storage_options: Dict = None) -> int:
     return fs.stat(path)["size"]
 
 
+# stat fields of file systems which change along with file contents
+_FINGERPRINT_STAT_FIELDS = (
+    "name",
+    "size",
+    "modified_time",
+    "mtime",
+    "LastModified",
+    "last_modified",
+    "ETag",
+    "etag",
+)
+
+
+def file_fingerprint(path: path_type, storage_options: Dict = None) -> Tuple:
+    """
+    Get fingerprint of a file from its stat like size, modification time
+    and etag. For directories, fingerprints of entries are included.
+    """
+    fs = get_fs(path, storage_options)
+    stats = [fs.stat(path)]
+    if stats[0].get("type") == "directory":
+        stats.extend(fs.stat(p) for p in sorted(fs.ls(path)))
+    return tuple(
+        tuple(str(stat.get(field)) for field in _FINGERPRINT_STAT_FIELDS)
+        for stat in stats
+    )
+
+
 def open_file(
     path: path_type,
     mode: str = "rb",
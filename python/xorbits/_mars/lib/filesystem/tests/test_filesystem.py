@@ -222,3 +222,20 @@ def test_get_fs():
         get_fs("unknown://")
     except ValueError as e:
         assert "Unknown file system type" in e.__str__()
+
+
+def test_file_fingerprint():
+    from .. import file_fingerprint
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "test_file")
+        with open(path, "wb") as f:
+            f.write(b"abc")
+        fingerprint = file_fingerprint(path)
+        dir_fingerprint = file_fingerprint(root)
+        assert file_fingerprint(path) == fingerprint
+
+        with open(path, "ab") as f:
+            f.write(b"def")
+        assert file_fingerprint(path) != fingerprint
+        assert file_fingerprint(root) != dir_fingerprint
@@ -50,6 +50,8 @@ class MKLVersion(ctypes.Structure):
 mkl_free_buffers = None
 mkl_get_version = None
 mkl_mem_stat = None
+mkl_get_max_threads = None
+mkl_set_num_threads = None
 
 mkl_rt = _load_mkl_rt("mkl_rt")
 if mkl_rt:
@@ -85,3 +87,18 @@ if mkl_rt:
 
     except AttributeError:  # pragma: no cover
         pass
+
+    try:
+        mkl_get_max_threads = mkl_rt.MKL_Get_Max_Threads
+        mkl_get_max_threads.argtypes = []
+        mkl_get_max_threads.restype = ctypes.c_int
+
+        _mkl_set_num_threads = mkl_rt.MKL_Set_Num_Threads
+        _mkl_set_num_threads.argtypes = [ctypes.c_int]
+        _mkl_set_num_threads.restype = None
+
+        def mkl_set_num_threads(num_threads: int):
+            _mkl_set_num_threads(num_threads)
+
+    except AttributeError:  # pragma: no cover
+        pass
@@ -0,0 +1,111 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Mergeable sketches used to estimate statistics of distributed data"""
+
+import numpy as np
+import pandas as pd
+
+_HASH_BITS = 64
+
+
+def hash_values(obj) -> np.ndarray:
+    """
+    Hash every row of a pandas object or every element of a 1-d array
+    into uint64 values.
+    """
+    if isinstance(obj, np.ndarray) and obj.dtype == np.uint64:
+        return obj
+    if isinstance(obj, np.ndarray):
+        obj = pd.Series(obj)
+    if isinstance(obj, pd.Index):
+        return pd.util.hash_pandas_object(obj).to_numpy()
+    return pd.util.hash_pandas_object(obj, index=False).to_numpy()
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    values = values.copy()
+    counts = np.zeros(len(values), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values <= np.uint64((1 << (_HASH_BITS - shift)) - 1)
+        counts[mask] += shift
+        values[mask] <<= np.uint64(shift)
+    return counts
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch to estimate the number of distinct values.
+
+    Sketches built on different chunks can be merged, and the estimation
+    of the merged sketch equals to the one built on the concatenated data.
+    The relative standard error is about ``1.04 / sqrt(2 ** precision)``.
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 12, registers: np.ndarray = None):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision should be in [4, 18], got {precision}")
+        self.precision = precision
+        if registers is None:
+            registers = np.zeros(1 << precision, dtype=np.uint8)
+        self.registers = registers
+
+    def __getstate__(self):
+        return self.precision, self.registers
+
+    def __setstate__(self, state):
+        self.precision, self.registers = state
+
+    @classmethod
+    def from_data(cls, obj, precision: int = 12) -> "HyperLogLog":
+        sketch = cls(precision)
+        sketch.update(obj)
+        return sketch
+
+    def update(self, obj):
+        hashes = hash_values(obj)
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        indices = (hashes >> np.uint64(_HASH_BITS - p)).astype(np.intp)
+        # the sentinel bit limits the rank to `_HASH_BITS - p + 1`
+        remaining = (hashes << np.uint64(p)) | np.uint64(1 << (p - 1))
+        ranks = _count_leading_zeros(remaining) + 1
+        np.maximum.at(self.registers, indices, ranks)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precisions")
+        self.registers = np.maximum(self.registers, other.registers)
+        return self
+
+    @classmethod
+    def merge_all(cls, sketches) -> "HyperLogLog":
+        sketches = list(sketches)
+        result = cls(sketches[0].precision, sketches[0].registers.copy())
+        for sketch in sketches[1:]:
+            result.merge(sketch)
+        return result
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            # small range correction via linear counting
+            return m * np.log(m / zeros)
+        return float(raw)
@@ -18,10 +18,12 @@ import sys
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from ...tests.core import assert_groupby_equal
 from ...utils import calc_data_size, estimate_pandas_size
 from ..groupby_wrapper import wrapped_groupby
+from ..sketches import HyperLogLog
 from ..tbcode import dump_traceback_code, load_traceback_code
 
 
@@ -132,3 +134,27 @@ def test_traceback_code():
     code_lines = target_dict[__file__][2]
     assert "raise" in code_lines[tb.tb_lineno - 1]
     assert len([line for line in code_lines if line]) == 5
+
+
+def test_hyper_log_log():
+    rs = np.random.RandomState(0)
+    for n in (10, 1000, 100000):
+        data = rs.randint(n, size=2 * n)
+        expected = len(np.unique(data))
+        sketches = [HyperLogLog.from_data(d) for d in np.array_split(data, 7)]
+        merged = pickle.loads(pickle.dumps(HyperLogLog.merge_all(sketches)))
+        assert abs(merged.estimate() - expected) / expected < 0.05
+        np.testing.assert_array_equal(
+            merged.registers, HyperLogLog.from_data(data).registers
+        )
+
+    index = pd.MultiIndex.from_tuples([(1, "a"), (2, "b"), (1, "a")])
+    assert round(HyperLogLog.from_data(index).estimate()) == 2
+    df = pd.DataFrame({"a": ["x", "y", "x"], "b": [1, 2, 1]})
+    assert round(HyperLogLog.from_data(df).estimate()) == 2
+    assert HyperLogLog.from_data(pd.Series([], dtype=float)).estimate() == 0
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
@@ -406,10 +406,12 @@ DATAFRAME_ILOC_GETITEM = 2021
 DATAFRAME_ILOC_SETITEM = 2022
 DATAFRAME_LOC_GETITEM = 2023
 DATAFRAME_LOC_SETITEM = 2024
+DATAFRAME_LABEL_INDEX = 2025
 
 # merge
 DATAFRAME_MERGE = 2010
 DATAFRAME_SHUFFLE_MERGE_ALIGN = 2011
+DATAFRAME_MERGE_SKEW_SAMPLE = 2012
 
 # bloom filter
 DATAFRAME_BLOOM_FILTER = 2014
@@ -459,6 +461,7 @@ READ_SQL = 2105
 TO_SQL = 2108
 READ_RAYDATASET = 2109
 READ_MLDATASET = 2106
+GEN_TPCH = 2111
 
 TO_CSV_STAT = 2102
 
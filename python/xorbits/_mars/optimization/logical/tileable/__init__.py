@@ -20,3 +20,4 @@ from .column_pruning import ColumnPruningRule
 from .arithmetic_query import SeriesArithmeticToEval
 from .core import optimize
 from .head import HeadPushDown
+from .join_reorder import JoinReorderRule
@@ -0,0 +1,348 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from ....config import options
+from ....core import OutputType, TileableType
+from ....dataframe.base.eval import DataFrameEval
+from ....dataframe.core import DATAFRAME_TYPE
+from ....dataframe.indexing.getitem import DataFrameIndex
+from ....dataframe.merge.merge import DataFrameMerge
+from ....lib.filesystem import get_fs, glob
+from ....typing import OperandType
+from ....utils import calc_data_size, implements
+from ..core import OptimizationRecord, OptimizationRecordType
+from .core import OperandBasedOptimizationRule, register_operand_based_optimization_rule
+
+logger = logging.getLogger(__name__)
+
+
+class JoinStep(NamedTuple):
+    table: TileableType
+    left_on: List
+    right_on: List
+    method: str
+
+
+def _to_list(keys) -> List:
+    if keys is None:
+        return []
+    return list(keys) if isinstance(keys, (list, tuple)) else [keys]
+
+
+def _estimate_source_nbytes(op: OperandType) -> Optional[int]:
+    paths = getattr(op, "path", None)
+    if paths is None:
+        return None
+    storage_options = getattr(op, "storage_options", None)
+    if not isinstance(paths, (list, tuple)):
+        paths = [paths]
+    nbytes = 0
+    try:
+        for path in paths:
+            if not isinstance(path, str):
+                return None
+            fs = get_fs(path, storage_options)
+            for file_path in glob(path, storage_options):
+                stat = fs.stat(file_path)
+                if stat.get("type") == "directory":
+                    nbytes += sum(fs.stat(p)["size"] for p in fs.ls(file_path))
+                else:
+                    nbytes += stat["size"]
+    except (OSError, KeyError, ValueError):  # pragma: no cover
+        return None
+    return nbytes
+
+
+def estimate_nbytes(tileable: TileableType) -> Optional[float]:
+    """
+    Estimate size of a DataFrame before execution. Sizes are calculated
+    from shapes and dtypes if known, or sizes of files for data sources.
+    For filters and projections, sizes of inputs are scaled by the number
+    of columns as an upper bound. None is returned if unable to estimate.
+    """
+    if not np.isnan(tileable.shape[0]):
+        return calc_data_size(tileable)
+
+    op = tileable.op
+    if not op.inputs:
+        return _estimate_source_nbytes(op)
+    if isinstance(op, (DataFrameIndex, DataFrameEval)) and isinstance(
+        op.inputs[0], DATAFRAME_TYPE
+    ):
+        input_nbytes = estimate_nbytes(op.inputs[0])
+        if input_nbytes is None:
+            return None
+        n_input_cols = max(len(op.inputs[0].dtypes), 1)
+        return input_nbytes * min(len(tileable.dtypes) / n_input_cols, 1.0)
+    return None
+
+
+@register_operand_based_optimization_rule([DataFrameMerge])
+class JoinReorderRule(OperandBasedOptimizationRule):
+    """
+    Reorder consecutive inner joins by estimated sizes of tables.
+
+    Joins are flattened into tables and pairs of equal columns. Joins are
+    rebuilt starting from the largest table, and the smallest table
+    connected with joined tables is joined next, thus small dimension
+    tables can be broadcast instead of shuffling the large table.
+    Columns are selected at last to keep the order of the original join.
+    """
+
+    @staticmethod
+    def _is_inner_join(op: OperandType) -> bool:
+        if not isinstance(op, DataFrameMerge) or op.gpu:
+            return False
+        if (
+            op.how != "inner"
+            or op.left_index
+            or op.right_index
+            or op.sort
+            or op.indicator
+            or op.validate is not None
+        ):
+            return False
+        if not all(
+            isinstance(inp, DATAFRAME_TYPE)
+            and inp.dtypes is not None
+            and inp.dtypes.index.is_unique
+            for inp in op.inputs
+        ):
+            return False
+        if op.on is not None:
+            left_on = right_on = _to_list(op.on)
+        else:
+            left_on, right_on = _to_list(op.left_on), _to_list(op.right_on)
+        left, right = op.inputs
+        return (
+            len(left_on) == len(right_on) > 0
+            and all(isinstance(k, str) and k in left.dtypes for k in left_on)
+            and all(isinstance(k, str) and k in right.dtypes for k in right_on)
+        )
+
+    def _is_collapsable_join(self, node: TileableType) -> bool:
+        return (
+            self._is_inner_join(node.op)
+            and node not in self._graph.results
+            and len(self._graph.successors(node)) == 1
+        )
+
+    @implements(OperandBasedOptimizationRule.match_operand)
+    def match_operand(self, op: OperandType) -> bool:
+        if not options.optimize.join_reorder or not self._is_inner_join(op):
+            return False
+        node = op.outputs[0]
+        if self._is_collapsable_join(node) and self._is_inner_join(
+            self._graph.successors(node)[0].op
+        ):
+            # joined later by another join
+            return False
+        return self._plan_joins(node) is not None
+
+    def _flatten_joins(
+        self, node: TileableType, tables: List, joins: List, pairs: List
+    ):
+        op = node.op
+        joins.append(node)
+        if op.on is not None:
+            left_on = right_on = _to_list(op.on)
+        else:
+            left_on, right_on = _to_list(op.left_on), _to_list(op.right_on)
+        for pair in zip(left_on, right_on):
+            if pair not in pairs:
+                pairs.append(pair)
+        for inp in op.inputs:
+            if self._is_collapsable_join(inp):
+                self._flatten_joins(inp, tables, joins, pairs)
+            else:
+                tables.append(inp)
+
+    @staticmethod
+    def _get_join_keys(
+        pairs: List[Tuple], owners: Dict[str, Set[int]], joined: Set[int], idx: int
+    ) -> Tuple[List, List]:
+        left_on, right_on = [], []
+        for left_key, right_key in pairs:
+            if left_key == right_key:
+                keys = (left_key, right_key)
+                if idx not in owners[left_key] or not (owners[left_key] & joined):
+                    continue
+            elif idx in owners[right_key] and owners[left_key] & joined:
+                keys = (left_key, right_key)
+            elif idx in owners[left_key] and owners[right_key] & joined:
+                keys = (right_key, left_key)
+            else:
+                continue
+            if keys not in zip(left_on, right_on):
+                left_on.append(keys[0])
+                right_on.append(keys[1])
+        return left_on, right_on
+
+    def _plan_joins(self, node: TileableType) -> Optional[List[JoinStep]]:
+        """
+        Plan the order of joins, None is returned if
+        the joins cannot or need not to be reordered.
+        """
+        tables, joins, pairs = [], [], []
+        self._flatten_joins(node, tables, joins, pairs)
+        if len(tables) < 3 or len({t.key for t in tables}) < len(tables):
+            # single join or self join
+            return None
+
+        # columns with identical names should be joined with each other
+        owners = defaultdict(set)
+        for i, table in enumerate(tables):
+            for col in table.dtypes.index:
+                owners[col].add(i)
+        for col, col_owners in owners.items():
+            if len(col_owners) > 1 and (
+                (col, col) not in pairs
+                or len({tables[i].dtypes[col] for i in col_owners}) > 1
+            ):
+                return None
+        if set(owners) != set(node.dtypes.index):  # pragma: no cover
+            return None
+
+        sizes = [estimate_nbytes(t) for t in tables]
+        if any(size is None for size in sizes):
+            return None
+        # merge methods specified by users are kept
+        table_methods = dict()
+        for join in joins:
+            for inp in join.inputs:
+                table_methods[inp.key] = join.op.method
+        broadcast_threshold = node.op.broadcast_threshold
+        if broadcast_threshold is None:
+            broadcast_threshold = options.optimize.broadcast_join_threshold
+
+        start = int(np.argmax(sizes))
+        joined = {start}
+        steps = [JoinStep(tables[start], [], [], None)]
+        while len(joined) < len(tables):
+            candidates = []
+            for i, table in enumerate(tables):
+                if i in joined:
+                    continue
+                left_on, right_on = self._get_join_keys(pairs, owners, joined, i)
+                if left_on:
+                    candidates.append((sizes[i], i, left_on, right_on))
+            if not candidates:
+                # cross join not supported
+                return None
+            size, idx, left_on, right_on = min(candidates, key=lambda t: t[:2])
+            method = table_methods.get(tables[idx].key, "auto")
+            if method == "auto" and size <= broadcast_threshold:
+                method = "broadcast"
+            steps.append(JoinStep(tables[idx], left_on, right_on, method))
+            joined.add(idx)
+
+        # check if the plan is identical to original joins
+        orig_plan, orig_node = [], node
+        while orig_node in joins:
+            orig_plan.append((orig_node.inputs[1].key, orig_node.op.method))
+            orig_node = orig_node.inputs[0]
+        orig_plan.append((orig_node.key, None))
+        plan = [(step.table.key, step.method) for step in steps]
+        if orig_plan[::-1] == plan:
+            return None
+        return steps
+
+    @implements(OperandBasedOptimizationRule.apply_to_operand)
+    def apply_to_operand(self, op: DataFrameMerge):
+        node = op.outputs[0]
+        steps = self._plan_joins(node)
+        tables, joins, pairs = [], [], []
+        self._flatten_joins(node, tables, joins, pairs)
+
+        new_nodes = []
+        joined = steps[0].table
+        for step in steps[1:]:
+            merge_op = DataFrameMerge(
+                how="inner",
+                on=None,
+                left_on=step.left_on,
+                right_on=step.right_on,
+                left_index=False,
+                right_index=False,
+                sort=False,
+                suffixes=op.suffixes,
+                copy=op.copy_,
+                indicator=False,
+                validate=None,
+                method=step.method,
+                auto_merge=op.auto_merge,
+                auto_merge_threshold=op.auto_merge_threshold,
+                bloom_filter=op.bloom_filter,
+                bloom_filter_options=op.bloom_filter_options,
+                skew_join=op.skew_join,
+                skew_join_options=op.skew_join_options,
+                broadcast_threshold=op.broadcast_threshold,
+                broadcast_memory_ratio=op.broadcast_memory_ratio,
+                shuffle_partition_size=op.shuffle_partition_size,
+                output_types=[OutputType.dataframe],
+            )
+            joined = merge_op(joined, step.table).data
+            new_nodes.append(joined)
+
+        # select columns in the order of the original join
+        col_names = node.dtypes.index.tolist()
+        if set(joined.dtypes.index) != set(col_names) or not (
+            joined.dtypes[col_names].equals(node.dtypes)
+        ):  # pragma: no cover
+            logger.debug("Dtypes of reordered joins mismatch, skip %s", node)
+            return
+        index_op = DataFrameIndex(
+            _key=op.key, col_names=col_names, output_types=[OutputType.dataframe]
+        )
+        new_node = index_op.new_tileable(
+            [joined], _key=node.key, _id=node.id, **node.params
+        ).data
+        new_nodes.append(new_node)
+        logger.debug(
+            "Reorder joins of %s, order of tables: %s, methods: %s",
+            node,
+            [step.table.key for step in steps],
+            [step.method for step in steps[1:]],
+        )
+
+        successors = self._graph.successors(node)
+        for join in joins:
+            self._graph.remove_node(join)
+        for new in new_nodes:
+            self._graph.add_node(new)
+            for inp in new.inputs:
+                self._graph.add_edge(inp, new)
+        for succ in successors:
+            self._graph.add_edge(new_node, succ)
+
+        for join in joins:
+            if join is not node:
+                self._records.append_record(
+                    OptimizationRecord(join, None, OptimizationRecordType.delete)
+                )
+        self._records.append_record(
+            OptimizationRecord(node, new_node, OptimizationRecordType.replace)
+        )
+        # check node if it's in result
+        try:
+            i = self._graph.results.index(node)
+            self._graph.results[i] = new_node
+        except ValueError:
+            pass
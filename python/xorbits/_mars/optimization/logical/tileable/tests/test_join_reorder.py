@@ -0,0 +1,172 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..... import dataframe as md
+from .....config import option_context
+from .....core import TileableGraph, TileableGraphBuilder, enter_mode
+from .....dataframe.indexing.getitem import DataFrameIndex
+from .....dataframe.merge.merge import DataFrameMerge
+from .. import optimize
+from ..join_reorder import estimate_nbytes
+
+
+@pytest.fixture(scope="module")
+def prepare_data():
+    rs = np.random.RandomState(0)
+    fact = pd.DataFrame(
+        {
+            "f_id": np.arange(1000),
+            "f_d1": rs.randint(10, size=1000),
+            "f_d2": rs.randint(20, size=1000),
+            "f_val": rs.rand(1000),
+        }
+    )
+    dim1 = pd.DataFrame({"d1_id": np.arange(10), "d1_name": list("abcdefghij")})
+    dim2 = pd.DataFrame(
+        {
+            "d2_id": np.arange(20),
+            "d2_d1": rs.randint(10, size=20),
+            "d2_val": rs.rand(20),
+        }
+    )
+    return fact, dim1, dim2
+
+
+def _build_graph(*tileables) -> TileableGraph:
+    graph = TileableGraph([t.data for t in tileables])
+    next(TileableGraphBuilder(graph).build())
+    return graph
+
+
+@enter_mode(build=True)
+def test_reorder_joins(prepare_data, setup):
+    pfact, pdim1, pdim2 = prepare_data
+    fact = md.DataFrame(pfact, chunk_size=200)
+    dim1 = md.DataFrame(pdim1, chunk_size=5)
+    dim2 = md.DataFrame(pdim2, chunk_size=5)
+
+    assert estimate_nbytes(fact.data) > estimate_nbytes(dim2.data)
+    filtered = dim2[dim2["d2_val"] > 0.5]
+    assert estimate_nbytes(filtered.data) == estimate_nbytes(dim2.data)
+
+    # joins from the smallest table as users may write
+    jn1 = dim1.merge(dim2, left_on="d1_id", right_on="d2_d1")
+    jn2 = jn1.merge(fact, left_on="d2_id", right_on="f_d2")
+    graph = _build_graph(jn2)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn1.data) is None
+    opt_jn2 = records.get_optimization_result(jn2.data)
+    assert isinstance(opt_jn2.op, DataFrameIndex)
+    assert opt_jn2.key == jn2.key
+    assert opt_jn2 in graph.results
+    assert opt_jn2.op.col_names == jn2.dtypes.index.tolist()
+    pd.testing.assert_series_equal(opt_jn2.dtypes, jn2.dtypes)
+
+    # fact table is joined first, and small tables are broadcast
+    opt_join2 = opt_jn2.inputs[0]
+    assert isinstance(opt_join2.op, DataFrameMerge)
+    assert opt_join2.op.method == "broadcast"
+    assert opt_join2.inputs[1] is dim1.data
+    assert opt_join2.op.left_on == ["d2_d1"]
+    assert opt_join2.op.right_on == ["d1_id"]
+    opt_join1 = opt_join2.inputs[0]
+    assert opt_join1.inputs[0] is fact.data
+    assert opt_join1.inputs[1] is dim2.data
+    assert opt_join1.op.left_on == ["f_d2"]
+    assert opt_join1.op.right_on == ["d2_id"]
+    assert len(graph) == 6
+
+    result = jn2.execute().fetch()
+    expected = pdim1.merge(pdim2, left_on="d1_id", right_on="d2_d1").merge(
+        pfact, left_on="d2_id", right_on="f_d2"
+    )
+    pd.testing.assert_frame_equal(
+        result.sort_values("f_id").reset_index(drop=True),
+        expected.sort_values("f_id").reset_index(drop=True),
+    )
+
+    # joins with identical column names and multiple keys
+    pdim3 = pdim2.rename(columns={"d2_id": "f_d2"})
+    dim3 = md.DataFrame(pdim3, chunk_size=5)
+    jn1 = dim3.merge(dim1, left_on="d2_d1", right_on="d1_id")
+    jn2 = jn1.merge(fact, on="f_d2")
+    graph = _build_graph(jn2)
+    records = optimize(graph)
+    opt_jn2 = records.get_optimization_result(jn2.data)
+    assert opt_jn2.inputs[0].inputs[0].inputs[0] is fact.data
+
+    result = jn2.execute().fetch()
+    expected = pdim3.merge(pdim1, left_on="d2_d1", right_on="d1_id").merge(
+        pfact, on="f_d2"
+    )
+    pd.testing.assert_frame_equal(
+        result.sort_values("f_id").reset_index(drop=True),
+        expected.sort_values("f_id").reset_index(drop=True),
+    )
+
+
+@enter_mode(build=True)
+def test_skip_reorder_joins(prepare_data, setup):
+    pfact, pdim1, pdim2 = prepare_data
+    fact = md.DataFrame(pfact, chunk_size=200)
+    dim1 = md.DataFrame(pdim1, chunk_size=5)
+    dim2 = md.DataFrame(pdim2, chunk_size=5)
+
+    # joined in the planned order already
+    jn1 = fact.merge(dim2, left_on="f_d2", right_on="d2_id", method="broadcast")
+    jn2 = jn1.merge(dim1, left_on="d2_d1", right_on="d1_id", method="broadcast")
+    graph = _build_graph(jn2)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn2.data) is None
+
+    # single join
+    jn = dim1.merge(fact, left_on="d1_id", right_on="f_d1")
+    graph = _build_graph(jn)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn.data) is None
+
+    # intermediate results are fetched
+    jn1 = dim1.merge(dim2, left_on="d1_id", right_on="d2_d1")
+    jn2 = jn1.merge(fact, left_on="d2_id", right_on="f_d2")
+    graph = _build_graph(jn1, jn2)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn2.data) is None
+
+    # non-inner joins
+    jn1 = dim1.merge(dim2, left_on="d1_id", right_on="d2_d1", how="left")
+    jn2 = jn1.merge(fact, left_on="d2_id", right_on="f_d2")
+    graph = _build_graph(jn2)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn2.data) is None
+
+    # overlapped columns are suffixed
+    pdim3 = pdim2.rename(columns={"d2_val": "f_val"})
+    dim3 = md.DataFrame(pdim3, chunk_size=5)
+    jn1 = dim1.merge(dim3, left_on="d1_id", right_on="d2_d1")
+    jn2 = jn1.merge(fact, left_on="d2_id", right_on="f_d2")
+    graph = _build_graph(jn2)
+    records = optimize(graph)
+    assert records.get_optimization_result(jn2.data) is None
+
+    # disabled by option
+    jn1 = dim1.merge(dim2, left_on="d1_id", right_on="d2_d1")
+    jn2 = jn1.merge(fact, left_on="d2_id", right_on="f_d2")
+    with option_context({"optimize.join_reorder": False}):
+        graph = _build_graph(jn2)
+        records = optimize(graph)
+        assert records.get_optimization_result(jn2.data) is None
@@ -21,6 +21,7 @@ from typing import List, Set
 import numpy as np
 
 from ...core import ChunkGraph, ChunkType
+from ...dataframe.arithmetic.numexpr import DataFrameNeFuseChunk, can_fuse_series
 from ...tensor import arithmetic, reduction
 from ...tensor.fuse import TensorNeFuseChunk
 from ...tensor.fuse.numexpr import NUMEXPR_INSTALLED
@@ -178,16 +179,27 @@ class NumexprRuntimeOptimizer(RuntimeOptimizer):
         return NUMEXPR_INSTALLED
 
     def optimize(self):
+        for node in self._graph:
+            if node.op.gpu or node.op.sparse:
+                # break
+                return [], []
+
+        # tensor element-wise operands are fused first, then arithmetic,
+        # comparison and boolean operands on Series of the same index
+        fuses, fused_nodes = self._optimize(_can_fuse, TensorNeFuseChunk)
+        series_fuses, series_fused_nodes = self._optimize(
+            can_fuse_series, DataFrameNeFuseChunk
+        )
+        return fuses + series_fuses, fused_nodes + series_fused_nodes
+
+    def _optimize(self, can_fuse_func, fuse_cls):
         fuses = []
         explored = set()
-        cached_can_fuse = functools.lru_cache(maxsize=None)(_can_fuse)
+        cached_can_fuse = functools.lru_cache(maxsize=None)(can_fuse_func)
 
         graph = self._graph
         graph_results = set(graph.results)
         for node in graph.topological_iter():
-            if node.op.gpu or node.op.sparse:
-                # break
-                return [], []
             if node in explored or node in graph_results:
                 continue
             can_fuse = cached_can_fuse(node)
@@ -202,7 +214,7 @@ class NumexprRuntimeOptimizer(RuntimeOptimizer):
                             "Refused fusing for numexpr because the tail node count > 1."
                         )
 
-        return self._fuse_nodes(fuses, TensorNeFuseChunk)
+        return self._fuse_nodes(fuses, fuse_cls)
 
     def _fuse_nodes(self, fuses: List[_Fuse], fuse_cls):
         graph = self._graph
@@ -218,12 +230,15 @@ class NumexprRuntimeOptimizer(RuntimeOptimizer):
 
             tail_chunk = tail_nodes[0]
             tail_chunk_op = tail_chunk.op
+            op_kw = dict()
+            if fuse_cls is TensorNeFuseChunk:
+                op_kw["dtype"] = tail_chunk.dtype
             fuse_op = fuse_cls(
                 sparse=tail_chunk_op.sparse,
                 gpu=tail_chunk_op.gpu,
                 _key=tail_chunk_op.key,
                 fuse_graph=fuse_graph,
-                dtype=tail_chunk.dtype,
+                **op_kw,
             )
             fused_chunk = fuse_op.new_chunk(
                 inputs,
@@ -14,7 +14,20 @@
 # limitations under the License.
 import operator
 
-from ....core import ChunkGraph
+import numpy as np
+import pandas as pd
+
+from .... import dataframe as md
+from ....core import (
+    ChunkGraph,
+    ChunkGraphBuilder,
+    TileableGraph,
+    TileableGraphBuilder,
+    TileContext,
+    enter_mode,
+)
+from ....core.operand import execute
+from ....dataframe.arithmetic.numexpr import DataFrameNeFuseChunk
 from ....tensor.arithmetic import TensorTreeAdd
 from ....tensor.indexing import TensorSlice
 from ....tensor.reduction import TensorSum
@@ -382,3 +395,65 @@ def test_numexpr():
     assert fused_nodes[0].composed == [chunks[2], chunk_reductions[1]]
     assert set(fused_nodes[1].composed) == {chunks[0], chunks[1], chunk_reductions[0]}
     assert len(graph) == 6
+
+
+@enter_mode(build=True)
+def test_numexpr_series():
+    raw = pd.DataFrame(
+        {
+            "a": np.random.rand(10),
+            "b": np.random.rand(10),
+            "c": np.random.randint(10, size=10),
+            "d": np.random.rand(10) > 0.5,
+            "e": np.random.rand(10).astype(np.float32),
+        }
+    )
+    df = md.DataFrame(raw, chunk_size=5)
+    exprs = [
+        (df.a * (1 - df.b) * (1 + df.c), raw.a * (1 - raw.b) * (1 + raw.c)),
+        (((df.a > 0.5) & df.d) | ~(df.c < 3), ((raw.a > 0.5) & raw.d) | ~(raw.c < 3)),
+        (np.sqrt(df.a) * df.c - df.b, np.sqrt(raw.a) * raw.c - raw.b),
+        (-df.e * 1.5 + 1, -raw.e * 1.5 + 1),
+    ]
+    for s, expected in exprs:
+        graph = TileableGraph([s.data])
+        next(TileableGraphBuilder(graph).build())
+        chunk_graph = next(
+            ChunkGraphBuilder(
+                graph, fuse_enabled=False, tile_context=TileContext()
+            ).build()
+        )
+
+        _, fused_nodes = NumexprRuntimeOptimizer(chunk_graph).optimize()
+        assert len(fused_nodes) == 2
+        assert all(isinstance(n.op, DataFrameNeFuseChunk) for n in fused_nodes)
+        assert chunk_graph.results == fused_nodes
+
+        results = dict()
+        for chunk in chunk_graph.topological_iter():
+            execute(results, chunk.op)
+        result = pd.concat([results[c.key] for c in chunk_graph.results])
+        pd.testing.assert_series_equal(result, expected)
+
+    # fall back when indexes of inputs are not aligned
+    s = df.a + df.b
+    graph = TileableGraph([s.data])
+    next(TileableGraphBuilder(graph).build())
+    chunk_graph = next(
+        ChunkGraphBuilder(graph, fuse_enabled=False, tile_context=TileContext()).build()
+    )
+    _, fused_nodes = NumexprRuntimeOptimizer(chunk_graph).optimize()
+    assert len(fused_nodes) == 0
+
+    add_chunk = chunk_graph.results[0]
+    fuse_graph = ChunkGraph([add_chunk])
+    fuse_graph.add_node(add_chunk)
+    fused_chunk = DataFrameNeFuseChunk(
+        fuse_graph=fuse_graph, _key=add_chunk.op.key
+    ).new_chunk(
+        add_chunk.inputs, kws=[add_chunk.params], _key=add_chunk.key, _chunk=add_chunk
+    )
+    a, b = raw.a.iloc[:5], raw.b.iloc[:5]
+    results = {add_chunk.inputs[0].key: a, add_chunk.inputs[1].key: b[::-1]}
+    execute(results, fused_chunk.op)
+    pd.testing.assert_series_equal(results[add_chunk.key], a + b, check_names=False)
@@ -78,6 +78,11 @@ elif sys.version_info[:2] == (3, 6):  # pragma: no cover
 logger = logging.getLogger(__name__)
 _init_main_suspended_local = threading.local()
 
+# modules imported by the fork server before forking sub pools, thus heavy
+# modules are imported only once instead of once per sub pool. Modules
+# failed to import are skipped by multiprocessing.
+_forkserver_preload_modules = ["numpy", "pandas", "pyarrow", __name__]
+
 
 def _patch_spawn_get_preparation_data():
     try:
@@ -185,6 +190,9 @@ class MainActorPool(MainActorPoolBase):
     ):
         def start_pool_in_process():
             ctx = multiprocessing.get_context(method=start_method)
+            if ctx.get_start_method() == "forkserver":
+                # take effect only before the fork server starts
+                ctx.set_forkserver_preload(_forkserver_preload_modules)
             status_queue = ctx.Queue()
 
             with _suspend_init_main():
@@ -272,6 +280,9 @@ class MainActorPool(MainActorPoolBase):
             env = cur_pool_config["env"]
             if env:
                 os.environ.update(env)
+                cpu_affinity = env.get("MARS_CPU_AFFINITY")
+                if cpu_affinity and hasattr(os, "sched_setaffinity"):
+                    os.sched_setaffinity(0, [int(c) for c in cpu_affinity.split(",")])
             pool = await SubActorPool.create(
                 {"actor_pool_config": actor_config, "process_index": process_index}
             )
@@ -322,9 +333,13 @@ class MainActorPool(MainActorPoolBase):
     async def recover_sub_pool(self, address: str):
         process_index = self._config.get_process_index(address)
         # process dead, restart it
-        # remember always use spawn to recover sub pool
+        # remember always use spawn to recover sub pool, except forkserver
+        # whose sub pools are forked from a clean server process
+        start_method = (
+            "forkserver" if self._subprocess_start_method == "forkserver" else "spawn"
+        )
         task = asyncio.create_task(
-            self.start_sub_pool(self._config, process_index, "spawn")
+            self.start_sub_pool(self._config, process_index, start_method)
         )
         self.sub_processes[address] = (await self.wait_sub_pools_ready([task]))[0][0]
 
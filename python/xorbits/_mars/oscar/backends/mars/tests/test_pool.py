@@ -689,6 +689,45 @@ async def test_auto_recover(auto_recover):
                 await ctx.has_actor(actor_ref)
 
 
+class ParentProcessActor(Actor):
+    def get_parent_pid(self):
+        return os.getppid()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="skip under Windows")
+async def test_forkserver_recover():
+    pool = await create_actor_pool(
+        "127.0.0.1",
+        pool_cls=MainActorPool,
+        n_process=2,
+        subprocess_start_method="forkserver",
+        auto_recover="process",
+    )
+
+    async with pool:
+        ctx = get_context()
+        actor_ref = await ctx.create_actor(
+            ParentProcessActor,
+            address=pool.external_address,
+            allocate_strategy=ProcessIndex(1),
+        )
+        # sub pools are forked from the fork server with preloaded modules
+        server_pid = await actor_ref.get_parent_pid()
+        assert server_pid != os.getpid()
+
+        await ctx.kill_actor(actor_ref)
+        await ctx.wait_actor_pool_recovered(actor_ref.address, pool.external_address)
+
+        # recovered sub pool is forked from the same fork server
+        actor_ref = await ctx.create_actor(
+            ParentProcessActor,
+            address=pool.external_address,
+            allocate_strategy=ProcessIndex(1),
+        )
+        assert await actor_ref.get_parent_pid() == server_pid
+
+
 @pytest.mark.parametrize(
     "exception_config",
     [
@@ -54,6 +54,10 @@ class RemoteFunction(RemoteOperandMixin, Operand):
     resolve_tileable_input = BoolField("resolve_tileable_input", default=False)
     n_output = Int32Field("n_output", default=None)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, output_types=None, **kwargs):
         super().__init__(_output_types=output_types, **kwargs)
 
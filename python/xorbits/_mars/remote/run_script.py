@@ -44,6 +44,10 @@ class RunScript(MergeDictOperand):
     _world_size: int = Int32Field("world_size")
     _rank: int = Int32Field("rank")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(
         self,
         code=None,
@@ -204,6 +204,14 @@ def test_context(setup_cluster):
     r4 = spawn(f4, args=(data_key, bands[1]), expect_band=bands[1])
     r4.execute()
 
+    def get_bands_memory_avail():
+        ctx = get_context()
+        return ctx.get_bands_memory_avail()
+
+    bands_memory_avail = spawn(get_bands_memory_avail).execute().fetch()
+    assert set(bands) <= set(bands_memory_avail)
+    assert all(memory_avail > 0 for memory_avail in bands_memory_avail.values())
+
 
 def test_multi_output(setup):
     sentences = ["word1 word2", "word2 word3", "word3 word2 word1"]
@@ -38,6 +38,8 @@ CGROUP_V1_MEM_STAT_FILE = "/sys/fs/cgroup/memory/memory.stat"
 CGROUP_V2_CPU_STAT_FILE = "/sys/fs/cgroup/cpu.stat"
 CGROUP_V2_MEM_CURRENT_FILE = "/sys/fs/cgroup/memory.current"
 CGROUP_V2_MEM_MAX_FILE = "/sys/fs/cgroup/memory.max"
+NUMA_NODE_DIR = "/sys/devices/system/node"
+PROC_STATM_FILE = "/proc/self/statm"
 
 _is_cgroup_v2 = os.path.exists(CGROUP_V2_CPU_STAT_FILE)
 
@@ -172,6 +174,91 @@ def mem_total():
     return virtual_memory().total
 
 
+_page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def process_private_rss(statm_file: str = None) -> Optional[int]:
+    """
+    Get resident memory of current process excluding file mappings and
+    shared memory from ``/proc/self/statm``, which is cheap to be read
+    frequently. None is returned if not available.
+    """
+    try:
+        with open(statm_file or PROC_STATM_FILE, "rb") as statm:
+            fields = statm.read().split()
+        return (int(fields[1]) - int(fields[2])) * _page_size
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+_numa_node_info = namedtuple("numa_node_info", "node_id cpus mem_total")
+
+
+def _parse_cpu_list(cpu_list: str) -> List[int]:
+    # parse cpu lists like "0-3,8-11"
+    cpus = []
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def _read_numa_node_mem_total(node_dir: str) -> Optional[int]:
+    try:
+        with open(os.path.join(node_dir, "meminfo"), "r") as meminfo_file:
+            for line in meminfo_file:
+                # lines like "Node 0 MemTotal:       65789808 kB"
+                parts = line.split()
+                if len(parts) >= 4 and parts[2] == "MemTotal:":
+                    return int(parts[3]) * 1024
+    except OSError:  # pragma: no cover
+        pass
+    return None
+
+
+def numa_nodes(node_dir: str = None) -> List[_numa_node_info]:
+    """
+    Detect NUMA nodes with CPUs available to current process from
+    ``/sys/devices/system/node``. Nodes without available CPUs are
+    skipped, and an empty list is returned if NUMA topology is not
+    available.
+    """
+    node_dir = node_dir or NUMA_NODE_DIR
+    try:
+        node_names = os.listdir(node_dir)
+    except OSError:
+        return []
+    if hasattr(os, "sched_getaffinity"):
+        avail_cpus = os.sched_getaffinity(0)
+    else:  # pragma: no cover
+        avail_cpus = None
+
+    nodes = []
+    for node_name in node_names:
+        if not node_name.startswith("node") or not node_name[4:].isdigit():
+            continue
+        path = os.path.join(node_dir, node_name)
+        try:
+            with open(os.path.join(path, "cpulist"), "r") as cpu_list_file:
+                cpus = _parse_cpu_list(cpu_list_file.read())
+        except OSError:  # pragma: no cover
+            continue
+        if avail_cpus is not None:
+            cpus = [cpu for cpu in cpus if cpu in avail_cpus]
+        if cpus:
+            nodes.append(
+                _numa_node_info(
+                    int(node_name[4:]), cpus, _read_numa_node_mem_total(path)
+                )
+            )
+    return sorted(nodes)
+
+
 _last_cgroup_cpu_measure = None
 _last_proc_cpu_measure = None
 _last_psutil_measure = None
@@ -13,8 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from . import arrow, cuda, exception, mars_objects, numpy, ray, scipy
+from . import arrow, cuda, exception, mars_objects, numpy, pandas, ray, scipy
 from .aio import AioDeserializer, AioSerializer
 from .core import Serializer, deserialize, serialize, serialize_with_spawn
 
-del arrow, cuda, numpy, scipy, mars_objects, ray, exception
+del arrow, cuda, numpy, pandas, scipy, mars_objects, ray, exception
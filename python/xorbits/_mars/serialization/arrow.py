@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from .core import Serializer, buffered
 
@@ -26,29 +26,103 @@ except ImportError:  # pragma: no cover
     pa_types = Any
 
 
+def _is_flat_type(arrow_type) -> bool:
+    """
+    Check if arrays of the type have no child arrays, thus can be
+    rebuilt from their own buffers.
+    """
+    return arrow_type.num_fields == 0 and not isinstance(
+        arrow_type, (pa.DictionaryType, pa.ExtensionType)
+    )
+
+
+def _encode_array(arr: "pa.Array", buffers: List) -> Tuple:
+    # missing buffers, like validity bitmaps of arrays without nulls,
+    # are recorded as None in the header
+    buf_indices = []
+    for buf in arr.buffers():
+        if buf is None:
+            buf_indices.append(None)
+        else:
+            buf_indices.append(len(buffers))
+            buffers.append(buf)
+    return len(arr), arr.null_count, arr.offset, buf_indices
+
+
+def _decode_array(arrow_type, header: Tuple, subs: List) -> "pa.Array":
+    length, null_count, offset, buf_indices = header
+    buffers = [None if idx is None else pa.py_buffer(subs[idx]) for idx in buf_indices]
+    return pa.Array.from_buffers(arrow_type, length, buffers, null_count, offset)
+
+
 class ArrowBatchSerializer(Serializer):
-    @buffered
-    def serial(self, obj: pa_types, context: Dict):
+    """
+    Serializer for arrow tables and record batches. Buffers of columns
+    are passed out-of-band as they are, with the schema in IPC format
+    in the header, thus no copy of data is made when serializing, and
+    arrays are rebuilt over received buffers when deserializing.
+    Columns with nested types are written with the IPC stream format.
+    """
+
+    @staticmethod
+    def _serial_stream(obj: pa_types, batch_type: str):
         sink = pa.BufferOutputStream()
         writer = pa.RecordBatchStreamWriter(sink, obj.schema)
-        if isinstance(obj, pa.Table):
-            batch_type = "T"
+        if batch_type == "T":
             writer.write_table(obj)
         else:
-            batch_type = "B"
             writer.write_batch(obj)
         writer.close()
+        return (batch_type, None), [sink.getvalue()], True
+
+    @buffered
+    def serial(self, obj: pa_types, context: Dict):
+        batch_type = "T" if isinstance(obj, pa.Table) else "B"
+        if not all(_is_flat_type(field.type) for field in obj.schema):
+            return self._serial_stream(obj, batch_type)
+
+        buffers = []
+        col_headers = []
+        for column in obj.columns:
+            if batch_type == "T":
+                col_headers.append(
+                    [_encode_array(chunk, buffers) for chunk in column.chunks]
+                )
+            else:
+                col_headers.append(_encode_array(column, buffers))
+        schema = obj.schema.serialize().to_pybytes()
+        return (batch_type, schema, col_headers), buffers, True
 
-        buf = sink.getvalue()
-        buffers = [buf]
-        return (batch_type,), buffers, True
+    def deserial(self, serialized: Tuple, context: Dict, subs: List):
+        batch_type, schema = serialized[:2]
+        if schema is None:
+            reader = pa.RecordBatchStreamReader(pa.BufferReader(subs[0]))
+            if batch_type == "T":
+                return reader.read_all()
+            else:
+                return reader.read_next_batch()
 
-    def deserial(self, serialized: Dict, context: Dict, subs: List):
-        reader = pa.RecordBatchStreamReader(pa.BufferReader(subs[0]))
-        if serialized[0] == "T":
-            return reader.read_all()
+        schema = pa.ipc.read_schema(pa.py_buffer(schema))
+        col_headers = serialized[2]
+        if batch_type == "T":
+            columns = [
+                pa.chunked_array(
+                    [_decode_array(field.type, h, subs) for h in chunk_headers],
+                    type=field.type,
+                )
+                for field, chunk_headers in zip(schema, col_headers)
+            ]
+            if not columns:
+                return schema.empty_table()
+            return pa.Table.from_arrays(columns, schema=schema)
         else:
-            return reader.read_next_batch()
+            columns = [
+                _decode_array(field.type, h, subs)
+                for field, h in zip(schema, col_headers)
+            ]
+            if not columns:
+                return pa.RecordBatch.from_pydict({}, schema=schema)
+            return pa.RecordBatch.from_arrays(columns, schema=schema)
 
 
 if pa is not None:  # pragma: no branch
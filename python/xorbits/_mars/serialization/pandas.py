@@ -0,0 +1,237 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .core import Serializer, buffered, pickle_buffers, unpickle_buffers
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+try:
+    from pandas.core.internals import BlockManager
+    from pandas.core.internals.api import make_block
+except ImportError:  # pragma: no cover
+    BlockManager = make_block = None
+
+# kinds of encoded arrays
+_NUMPY = 0
+_STRING = 1
+_CATEGORICAL = 2
+_OBJECT = 3
+# kinds of encoded indexes
+_RANGE_INDEX = 0
+_INDEX = 1
+
+# missing values of encoded strings
+_NA_VALUES = [None, np.nan]
+
+
+def _get_na_value_id(values: np.ndarray, is_null: np.ndarray):
+    nulls = values[is_null]
+    for na_id, na_value in enumerate(_NA_VALUES):
+        if na_value is None:
+            if all(v is None for v in nulls):
+                return na_id
+        elif all(isinstance(v, float) for v in nulls):
+            return na_id
+    return None
+
+
+def _encode_strings(values: np.ndarray):
+    if pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return None
+    try:
+        arr = pa.array(values, type=pa.string(), from_pandas=True)
+    except pa.ArrowCapacityError:  # pragma: no cover
+        arr = pa.array(values, type=pa.large_string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):  # pragma: no cover
+        return None
+
+    na_id = None
+    if arr.null_count > 0:
+        is_null = arr.is_null().to_numpy(zero_copy_only=False)
+        na_id = _get_na_value_id(values, is_null)
+        if na_id is None:
+            # mixed missing values like pd.NA and None
+            return None
+    validity, offsets, data = arr.buffers()
+    subs = [np.frombuffer(offsets, dtype=np.uint8), np.frombuffer(data, dtype=np.uint8)]
+    if validity is not None:
+        subs.append(np.frombuffer(validity, dtype=np.uint8))
+    header = (_STRING, str(arr.type), len(arr), arr.null_count, arr.offset, na_id)
+    return header, subs
+
+
+def _decode_strings(header: Tuple, subs: List) -> np.ndarray:
+    _, type_name, length, null_count, offset, na_id = header
+    arrow_type = pa.large_string() if type_name == "large_string" else pa.string()
+    buffers = [pa.py_buffer(sub) for sub in subs]
+    validity = buffers[2] if len(buffers) > 2 else None
+    arr = pa.Array.from_buffers(
+        arrow_type, length, [validity, buffers[0], buffers[1]], null_count, offset
+    )
+    values = arr.to_numpy(zero_copy_only=False)
+    if null_count > 0 and _NA_VALUES[na_id] is not None:
+        values[arr.is_null().to_numpy(zero_copy_only=False)] = _NA_VALUES[na_id]
+    return values
+
+
+def _encode_array(values) -> Tuple[Tuple, List]:
+    """
+    Encode 1-d or 2-d array into a header and a list of subcomponents.
+    Numeric arrays are kept as they are to be serialized out-of-band,
+    strings are encoded as arrow buffers, and categoricals are encoded
+    as codes and categories.
+    """
+    if isinstance(values, np.ndarray):
+        if not values.dtype.hasobject:
+            return (_NUMPY,), [values]
+        if values.ndim == 1 and len(values) > 0:
+            encoded = _encode_strings(values)
+            if encoded is not None:
+                return encoded
+        elif values.ndim == 2:
+            # object block, encode every column
+            headers, subs = [], []
+            for row in values:
+                row_header, row_subs = _encode_array(row)
+                headers.append((row_header, len(row_subs)))
+                subs.extend(row_subs)
+            return (_OBJECT, headers), subs
+    elif isinstance(values, pd.Categorical):
+        cat_header, cat_subs = _encode_array(np.asarray(values.categories))
+        header = (_CATEGORICAL, values.ordered, values.categories.dtype, cat_header)
+        return header, [values.codes] + cat_subs
+    return (_OBJECT, None), [values]
+
+
+def _decode_array(header: Tuple, subs: List):
+    kind = header[0]
+    if kind == _NUMPY:
+        return subs[0]
+    elif kind == _STRING:
+        return _decode_strings(header, subs)
+    elif kind == _CATEGORICAL:
+        _, ordered, categories_dtype, cat_header = header
+        categories = pd.Index(
+            _decode_array(cat_header, subs[1:]), dtype=categories_dtype
+        )
+        return pd.Categorical.from_codes(subs[0], categories, ordered=ordered)
+    elif header[1] is None:
+        return subs[0]
+    else:
+        rows, pos = [], 0
+        for row_header, n_subs in header[1]:
+            rows.append(_decode_array(row_header, subs[pos : pos + n_subs]))
+            pos += n_subs
+        return np.vstack(rows)
+
+
+def _encode_index(index: pd.Index) -> Tuple[Tuple, List]:
+    if type(index) is pd.RangeIndex:
+        return (_RANGE_INDEX, index.start, index.stop, index.step, index.name), []
+    elif isinstance(index, pd.MultiIndex):
+        return (_OBJECT, None), [index]
+    values_header, subs = _encode_array(index._values)
+    return (_INDEX, index.dtype, index.name, values_header), subs
+
+
+def _decode_index(header: Tuple, subs: List) -> pd.Index:
+    kind = header[0]
+    if kind == _RANGE_INDEX:
+        _, start, stop, step, name = header
+        return pd.RangeIndex(start, stop, step, name=name)
+    elif kind == _INDEX:
+        _, dtype, name, values_header = header
+        values = _decode_array(values_header, subs)
+        return pd.Index(values, dtype=dtype, name=name, copy=False)
+    else:
+        return subs[0]
+
+
+class PandasSerializer(Serializer):
+    """
+    Serializer for pandas DataFrames and Series which serializes
+    numeric blocks out-of-band, encodes string columns as arrow
+    buffers and categorical columns as codes and categories.
+    """
+
+    @staticmethod
+    def _can_encode(obj) -> bool:
+        if type(obj) not in (pd.DataFrame, pd.Series) or obj.attrs:
+            return False
+        if isinstance(obj, pd.DataFrame):
+            return isinstance(obj._mgr, BlockManager)
+        return True
+
+    @buffered
+    def serial(self, obj: Any, context: Dict):
+        if not self._can_encode(obj):
+            return (None,), pickle_buffers(obj), True
+
+        parts = []
+        if isinstance(obj, pd.DataFrame):
+            obj_type = "DataFrame"
+            parts.append(_encode_index(obj.columns))
+            for block in obj._mgr.blocks:
+                locs_header = (_NUMPY,), [block.mgr_locs.as_array]
+                parts.extend([locs_header, _encode_array(block.values)])
+        else:
+            obj_type = "Series"
+            parts.append(_encode_array(obj._values))
+        parts.append(_encode_index(obj.index))
+
+        headers, subs = [], []
+        for part_header, part_subs in parts:
+            headers.append((part_header, len(part_subs)))
+            subs.extend(part_subs)
+        name = obj.name if obj_type == "Series" else None
+        return (obj_type, name, headers), subs, False
+
+    def deserial(self, serialized: Tuple, context: Dict, subs: List):
+        obj_type = serialized[0]
+        if obj_type is None:
+            return unpickle_buffers(subs)
+
+        _, name, headers = serialized
+        parts, pos = [], 0
+        for part_header, n_subs in headers:
+            parts.append((part_header, subs[pos : pos + n_subs]))
+            pos += n_subs
+        index = _decode_index(*parts[-1])
+        if obj_type == "Series":
+            values = _decode_array(*parts[0])
+            return pd.Series(values, index=index, name=name, copy=False)
+
+        columns = _decode_index(*parts[0])
+        blocks = []
+        for i in range(1, len(parts) - 1, 2):
+            locs = _decode_array(*parts[i])
+            values = _decode_array(*parts[i + 1])
+            blocks.append(make_block(values, placement=locs, ndim=2))
+        mgr = BlockManager(blocks, [columns, index])
+        if hasattr(pd.DataFrame, "_from_mgr"):  # pragma: no cover
+            return pd.DataFrame._from_mgr(mgr, mgr.axes)
+        return pd.DataFrame(mgr)
+
+
+if pa is not None and make_block is not None:  # pragma: no branch
+    PandasSerializer.register(pd.DataFrame)
+    PandasSerializer.register(pd.Series)
@@ -159,6 +159,47 @@ def test_pandas():
     pd.testing.assert_frame_equal(val, deserialize(*serialize(val)))
 
 
+@pytest.mark.skipif(pa is None, reason="need pyarrow to run the cases")
+def test_pandas_with_strings():
+    val = pd.DataFrame(
+        {
+            "a": np.random.rand(100),
+            "b": np.random.choice(["ab", "cde", None], size=(100,)),
+            "c": np.random.choice(["x", "yz", np.nan], size=(100,)).astype(object),
+            "d": pd.Categorical(np.random.choice(list("abcd"), size=(100,))),
+            "e": np.random.choice([1, "a", None], size=(100,)),
+            "f": pd.date_range("2020-01-01", periods=100, tz="UTC"),
+            "g": pd.array(np.random.randint(0, 10, size=(100,)), dtype="Int64"),
+        },
+        index=pd.Index([f"i{i}" for i in range(100)], name="idx"),
+    )
+    val.loc[val["c"] == "nan", "c"] = np.nan
+    for test_val in [
+        val,
+        val.iloc[10:20],
+        val.iloc[:0],
+        val[["b", "b"]],
+        val[["a", "b"]].T,
+        val.set_index(["b", "d"]),
+    ]:
+        deserialized = deserialize(*serialize(test_val))
+        pd.testing.assert_frame_equal(test_val, deserialized)
+    # missing values are kept as they are
+    deserialized = deserialize(*serialize(val))
+    assert deserialized["b"][val["b"].isna()].map(lambda x: x is None).all()
+    assert deserialized["c"][val["c"].isna()].map(lambda x: x is np.nan).all()
+
+    for test_val in [val["b"], val["d"], val["e"], val["b"].rename(("x", 1))]:
+        deserialized = deserialize(*serialize(test_val))
+        pd.testing.assert_series_equal(test_val, deserialized)
+
+    # objects with attrs fall back to pickle
+    val.attrs["k"] = "v"
+    deserialized = deserialize(*serialize(val))
+    pd.testing.assert_frame_equal(val, deserialized)
+    assert deserialized.attrs == {"k": "v"}
+
+
 @pytest.mark.skipif(pa is None, reason="need pyarrow to run the cases")
 def test_arrow():
     test_df = pd.DataFrame(
@@ -177,6 +218,39 @@ def test_arrow():
         assert type(val) is type(deserialized)
         np.testing.assert_equal(val, deserialized)
 
+    table = pa.table(
+        {
+            "a": pa.array([1.0, None, 3.0, 4.0]),
+            "b": pa.array(["x", None, "yz", ""]),
+            "c": pa.array([True, False, None, True]),
+            "d": pa.array([1, 2, 3, 4], type=pa.timestamp("ms")),
+            "e": pa.array([b"a", b"bc", None, b""], type=pa.large_binary()),
+        }
+    )
+    test_vals = [
+        table,
+        table.slice(1, 2),
+        pa.concat_tables([table, table.slice(2)]),
+        table.to_batches()[0].slice(1),
+        table.slice(0, 0),
+        pa.table({"a": pa.array([[1, 2], None, [3]]), "b": ["x", "y", None]}),
+    ]
+    for val in test_vals:
+        header, buffers = serialize(val)
+        deserialized = deserialize(header, buffers)
+        assert type(val) is type(deserialized)
+        assert val.schema == deserialized.schema
+        assert val.equals(deserialized)
+
+    # arrays are rebuilt over received buffers
+    header, buffers = serialize(table)
+    deserialized = deserialize(header, buffers)
+    assert any(
+        buf.address == deserialized.column("b").chunk(0).buffers()[2].address
+        for buf in buffers
+        if isinstance(buf, pa.Buffer)
+    )
+
 
 @pytest.mark.parametrize(
     "np_val",
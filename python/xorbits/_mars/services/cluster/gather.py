@@ -135,26 +135,34 @@ def gather_node_env():
 
 
 def gather_node_resource(band_to_resource: Dict[str, Resource] = None, use_gpu=True):
-    # todo numa can be supported by adding more bands
     res = dict()
     mem_info = mars_resource.virtual_memory()
-    num_cpu = (
-        mars_resource.cpu_count()
-        if band_to_resource is None
-        else band_to_resource.get("numa-0", ZeroResource).num_cpus
-    )
-    mem_bytes = (
-        mem_info.total
-        if band_to_resource is None
-        else band_to_resource.get("numa-0", ZeroResource).mem_bytes
-    )
-    if num_cpu:  # pragma: no branch
-        res["numa-0"] = {
-            "cpu_avail": mars_resource.cpu_count()
-            - mars_resource.cpu_percent() / 100.0,
+    if band_to_resource is None:
+        numa_band_to_resource = {
+            "numa-0": Resource(
+                num_cpus=mars_resource.cpu_count(), mem_bytes=mem_info.total
+            )
+        }
+    else:
+        numa_band_to_resource = {
+            band: resource
+            for band, resource in band_to_resource.items()
+            if band.startswith("numa")
+        }
+    cpu_avail = mars_resource.cpu_count() - mars_resource.cpu_percent() / 100.0
+    all_num_cpu = sum(resource.num_cpus for resource in numa_band_to_resource.values())
+    for band, resource in numa_band_to_resource.items():
+        num_cpu = resource.num_cpus
+        if not num_cpu:  # pragma: no cover
+            continue
+        # when split by NUMA nodes, available resources are shared
+        # by bands proportional to their CPUs
+        ratio = num_cpu / all_num_cpu
+        res[band] = {
+            "cpu_avail": cpu_avail * ratio,
             "cpu_total": num_cpu,
-            "memory_avail": mem_info.available,
-            "memory_total": min(mem_info.total, mem_bytes),
+            "memory_avail": mem_info.available * ratio,
+            "memory_total": min(mem_info.total, resource.mem_bytes),
         }
 
     if use_gpu:
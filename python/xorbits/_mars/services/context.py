@@ -124,6 +124,20 @@ class ThreadedServiceContext(Context):
                 n_cpu += resource.num_cpus
         return n_cpu
 
+    @implements(Context.get_bands_memory_avail)
+    def get_bands_memory_avail(self) -> Dict[BandType, float]:
+        nodes_info = self._call(
+            self._cluster_api.get_nodes_info(role=NodeRole.WORKER, resource=True)
+        )
+        band_to_memory_avail = dict()
+        for address, info in nodes_info.items():
+            for band_name, resource in (info["resource"] or dict()).items():
+                if "memory_avail" in resource:
+                    band_to_memory_avail[(address, band_name)] = resource[
+                        "memory_avail"
+                    ]
+        return band_to_memory_avail
+
     @implements(Context.get_slots)
     def get_slots(self) -> int:
         worker_bands = self._call(self._get_worker_bands())
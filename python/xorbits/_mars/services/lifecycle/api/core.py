@@ -18,6 +18,21 @@ from typing import Dict, List
 
 
 class AbstractLifecycleAPI(ABC):
+    @abstractmethod
+    async def incref_tileables(
+        self, tileable_keys: List[str], counts: List[int] = None
+    ):
+        """
+        Incref tileables.
+
+        Parameters
+        ----------
+        tileable_keys : list
+            List of tileable keys.
+        counts: list
+            List of ref count.
+        """
+
     @abstractmethod
     async def decref_tileables(
         self, tileable_keys: List[str], counts: List[int] = None
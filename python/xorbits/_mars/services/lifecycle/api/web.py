@@ -28,6 +28,16 @@ class LifecycleWebAPIHandler(MarsServiceWebAPIHandler):
 
         return await self._get_api_by_key(LifecycleAPI, session_id)
 
+    @web_api("", method="post", arg_filter={"action": "incref_tileables"})
+    async def incref_tileables(self, session_id: str):
+        tileable_keys = self.get_argument("tileable_keys").split(",")
+        counts = self.get_argument("counts", None)
+        if counts:
+            counts = [int(c) for c in counts.split(",")]
+
+        oscar_api = await self._get_oscar_lifecycle_api(session_id)
+        await oscar_api.incref_tileables(tileable_keys, counts=counts)
+
     @web_api("", method="post", arg_filter={"action": "decref_tileables"})
     async def decref_tileables(self, session_id: str):
         tileable_keys = self.get_argument("tileable_keys").split(",")
@@ -56,11 +66,11 @@ class WebLifecycleAPI(AbstractLifecycleAPI, MarsWebAPIClientMixin):
         self._address = address.rstrip("/")
         self.request_rewriter = request_rewriter
 
-    async def decref_tileables(
-        self, tileable_keys: List[str], counts: List[int] = None
+    async def _change_tileables_ref(
+        self, action: str, tileable_keys: List[str], counts: List[int] = None
     ):
         path = f"{self._address}/api/session/{self._session_id}/lifecycle"
-        params = dict(action="decref_tileables")
+        params = dict(action=action)
         counts = (
             f"&counts={','.join(str(c) for c in counts)}" if counts is not None else ""
         )
@@ -72,6 +82,16 @@ class WebLifecycleAPI(AbstractLifecycleAPI, MarsWebAPIClientMixin):
             data="tileable_keys=" + ",".join(tileable_keys) + counts,
         )
 
+    async def incref_tileables(
+        self, tileable_keys: List[str], counts: List[int] = None
+    ):
+        await self._change_tileables_ref("incref_tileables", tileable_keys, counts)
+
+    async def decref_tileables(
+        self, tileable_keys: List[str], counts: List[int] = None
+    ):
+        await self._change_tileables_ref("decref_tileables", tileable_keys, counts)
+
     async def get_all_chunk_ref_counts(self) -> Dict[str, int]:
         params = dict(action="get_all_chunk_ref_counts")
         path = f"{self._address}/api/session/{self._session_id}/lifecycle"
@@ -14,4 +14,5 @@
 # limitations under the License.
 
 from .base import AbstractMetaStore, get_meta_store
+from .columnar import ColumnarMetaStore
 from .dictionary import DictMetaStore
@@ -0,0 +1,534 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import operator
+from collections import Counter, defaultdict
+from dataclasses import fields as dataclass_fields
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from .... import oscar as mo
+from ....lib.ordered_set import OrderedSet
+from ....typing import BandType
+from ....utils import implements
+from ..core import _ChunkMeta, _CommonMeta
+from .base import AbstractMetaStore, register_meta_store
+
+# fields stored in integer columns directly, None is stored as -1
+_NUMERIC_FIELDS = ("memory_size", "store_size")
+# fields whose values are usually shared by many chunks, thus
+# stored as ids of interned values, other fields are stored
+# in object columns
+_INTERNED_FIELDS = (
+    "name",
+    "shape",
+    "dtype",
+    "dtypes_value",
+    "index_value",
+    "categories_value",
+    "order",
+    "bands",
+)
+_NULL = -1
+_INIT_CAPACITY = 1024
+
+
+@functools.lru_cache(100)
+def _get_meta_fields(meta_cls) -> Tuple[str, ...]:
+    return tuple(f.name for f in dataclass_fields(meta_cls))
+
+
+class _InternPool:
+    """
+    Pool of distinct values referred by integer ids. Equal values,
+    e.g. dtypes, index values and bands shared by many chunks,
+    are stored only once.
+    """
+
+    __slots__ = "_values", "_counts", "_intern_keys", "_key_to_id", "_free_ids"
+
+    def __init__(self):
+        self._values = []
+        self._counts = []
+        self._intern_keys = []
+        self._key_to_id = dict()
+        self._free_ids = []
+
+    def __len__(self):
+        return len(self._key_to_id)
+
+    @staticmethod
+    def _get_intern_key(value):
+        # serializable metas like IndexValue and DtypesValue
+        # are identified by their keys
+        key = getattr(value, "key", None)
+        if isinstance(key, str):
+            return type(value), key
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return type(value), value
+
+    def _add_new(self, value, intern_key) -> int:
+        if self._free_ids:
+            value_id = self._free_ids.pop()
+            self._values[value_id] = value
+            self._counts[value_id] = 1
+            self._intern_keys[value_id] = intern_key
+        else:
+            value_id = len(self._values)
+            self._values.append(value)
+            self._counts.append(1)
+            self._intern_keys.append(intern_key)
+        if intern_key is not None:
+            self._key_to_id[intern_key] = value_id
+        return value_id
+
+    def add(self, value) -> int:
+        intern_key = self._get_intern_key(value)
+        if intern_key is not None:
+            value_id = self._key_to_id.get(intern_key)
+            if value_id is not None:
+                self._counts[value_id] += 1
+                return value_id
+        return self._add_new(value, intern_key)
+
+    def add_all(self, values: List) -> List[int]:
+        # values are paired with their types to tell apart
+        # equal values of different types, e.g. 1 and True
+        keys = list(zip(map(type, values), values))
+        try:
+            key_counts = Counter(keys)
+        except TypeError:  # unhashable values
+            return [_NULL if v is None else self.add(v) for v in values]
+        key_to_id = dict()
+        for key, count in key_counts.items():
+            value = key[1]
+            if value is None:
+                key_to_id[key] = _NULL
+                continue
+            value_id = key_to_id[key] = self.add(value)
+            self._counts[value_id] += count - 1
+        return [key_to_id[key] for key in keys]
+
+    def get(self, value_id: int):
+        return self._values[value_id]
+
+    def get_all(self, value_ids: List[int]) -> List:
+        values = self._values
+        return [None if i == _NULL else values[i] for i in value_ids]
+
+    def release(self, value_id: int):
+        self._counts[value_id] -= 1
+        if self._counts[value_id] == 0:
+            intern_key = self._intern_keys[value_id]
+            if intern_key is not None:
+                del self._key_to_id[intern_key]
+            self._values[value_id] = None
+            self._intern_keys[value_id] = None
+            self._free_ids.append(value_id)
+
+
+@register_meta_store
+class ColumnarMetaStore(AbstractMetaStore):
+    """
+    Meta store which keeps metas in columns instead of one object per meta.
+
+    Numeric fields are stored in NumPy arrays, fields shared by many chunks
+    like dtypes and index values are stored as ids of interned values,
+    and every band records row ids of its chunks instead of chunk keys.
+    It takes much less memory and creates fewer objects for GC than
+    `DictMetaStore` when there are millions of chunks.
+    """
+
+    name = "columnar"
+
+    def __init__(self, session_id: str, **kw):
+        super().__init__(session_id)
+        if kw:  # pragma: no cover
+            raise TypeError(f"Keyword arguments {kw!r} cannot be recognized.")
+
+        self._object_id_to_row: Dict[str, int] = dict()
+        self._row_object_ids: List[Optional[str]] = []
+        self._free_rows: List[int] = []
+        self._capacity = _INIT_CAPACITY
+
+        self._meta_types: List[Type[_CommonMeta]] = []
+        self._meta_type_to_id: Dict[Type[_CommonMeta], int] = dict()
+        self._type_column = np.full(self._capacity, _NULL, dtype=np.int16)
+        self._numeric_columns: Dict[str, np.ndarray] = {
+            field: np.full(self._capacity, _NULL, dtype=np.int64)
+            for field in _NUMERIC_FIELDS
+        }
+        self._interned_columns: Dict[str, np.ndarray] = {
+            field: np.full(self._capacity, _NULL, dtype=np.int32)
+            for field in _INTERNED_FIELDS
+        }
+        self._pools: Dict[str, _InternPool] = {
+            field: _InternPool() for field in _INTERNED_FIELDS
+        }
+        self._object_columns: Dict[str, np.ndarray] = dict()
+
+        # For shuffle data, the first band of a chunk stores complete data,
+        # see `DictMetaStore` for more details. Rows of chunks are stored
+        # as keys of dicts to keep the order.
+        self._band_rows: Dict[BandType, Dict[int, None]] = defaultdict(dict)
+
+    @classmethod
+    @implements(AbstractMetaStore.create)
+    async def create(cls, config) -> Dict:
+        # Nothing needs to do for columnar meta store.
+        # no extra kwargs.
+        return dict()
+
+    def __len__(self):
+        return len(self._object_id_to_row)
+
+    def _grow(self, min_capacity: int):
+        capacity = self._capacity
+        while capacity < min_capacity:
+            capacity *= 2
+
+        def _resize(arr: np.ndarray) -> np.ndarray:
+            if arr.dtype == object:
+                new_arr = np.empty(capacity, dtype=object)
+            else:
+                new_arr = np.full(capacity, _NULL, dtype=arr.dtype)
+            new_arr[: len(arr)] = arr
+            return new_arr
+
+        self._type_column = _resize(self._type_column)
+        for columns in (
+            self._numeric_columns,
+            self._interned_columns,
+            self._object_columns,
+        ):
+            for field, column in columns.items():
+                columns[field] = _resize(column)
+        self._capacity = capacity
+
+    def _allocate_row(self, object_id: str) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._row_object_ids[row] = object_id
+        else:
+            row = len(self._row_object_ids)
+            if row >= self._capacity:
+                self._grow(row + 1)
+            self._row_object_ids.append(object_id)
+        self._object_id_to_row[object_id] = row
+        return row
+
+    def _get_field(self, row: int, field: str) -> Any:
+        if field == "object_id":
+            return self._row_object_ids[row]
+        elif field in self._numeric_columns:
+            value = self._numeric_columns[field][row]
+            return None if value == _NULL else int(value)
+        elif field in self._interned_columns:
+            value_id = self._interned_columns[field][row]
+            if value_id == _NULL:
+                return None
+            value = self._pools[field].get(value_id)
+            return list(value) if field == "bands" else value
+        else:
+            return self._object_columns[field][row]
+
+    def _set_field(self, row: int, field: str, value: Any):
+        if field == "object_id":
+            return
+        elif field in self._numeric_columns:
+            self._numeric_columns[field][row] = _NULL if value is None else value
+        elif field in self._interned_columns:
+            column = self._interned_columns[field]
+            pool = self._pools[field]
+            if column[row] != _NULL:
+                pool.release(column[row])
+            if value is None:
+                column[row] = _NULL
+            else:
+                if field == "bands":
+                    value = tuple(value)
+                column[row] = pool.add(value)
+        else:
+            try:
+                column = self._object_columns[field]
+            except KeyError:
+                column = self._object_columns[field] = np.empty(
+                    self._capacity, dtype=object
+                )
+            column[row] = value
+
+    def _clear_row(self, row: int):
+        self._type_column[row] = _NULL
+        for column in self._numeric_columns.values():
+            column[row] = _NULL
+        for field, column in self._interned_columns.items():
+            value_id = column[row]
+            if value_id != _NULL:
+                self._pools[field].release(value_id)
+                column[row] = _NULL
+        for column in self._object_columns.values():
+            column[row] = None
+
+    def _build_meta(self, row: int) -> _CommonMeta:
+        meta_type = self._meta_types[self._type_column[row]]
+        return meta_type(
+            **{
+                field: self._get_field(row, field)
+                for field in _get_meta_fields(meta_type)
+            }
+        )
+
+    def _get_type_id(self, meta_type: Type[_CommonMeta]) -> int:
+        try:
+            return self._meta_type_to_id[meta_type]
+        except KeyError:
+            type_id = self._meta_type_to_id[meta_type] = len(self._meta_types)
+            self._meta_types.append(meta_type)
+            return type_id
+
+    def _get_object_column(self, field: str) -> np.ndarray:
+        try:
+            return self._object_columns[field]
+        except KeyError:
+            column = self._object_columns[field] = np.empty(
+                self._capacity, dtype=object
+            )
+            return column
+
+    def _set_meta(self, object_id: str, meta: _CommonMeta):
+        row = self._object_id_to_row.get(object_id)
+        if row is None:
+            return self._set_new_metas([object_id], [meta])
+        meta = meta.merge_from(self._build_meta(row))
+        self._clear_row(row)
+
+        meta_type = type(meta)
+        self._type_column[row] = self._get_type_id(meta_type)
+        for field in _get_meta_fields(meta_type):
+            self._set_field(row, field, getattr(meta, field))
+
+        if isinstance(meta, _ChunkMeta):
+            for band in meta.bands or ():
+                self._band_rows[band][row] = None
+
+    def _allocate_rows(self, object_ids: List[str]) -> List[int]:
+        n_free = min(len(self._free_rows), len(object_ids))
+        rows = [self._allocate_row(object_id) for object_id in object_ids[:n_free]]
+        start = len(self._row_object_ids)
+        new_rows = list(range(start, start + len(object_ids) - n_free))
+        if new_rows:
+            if new_rows[-1] >= self._capacity:
+                self._grow(new_rows[-1] + 1)
+            self._row_object_ids.extend(object_ids[n_free:])
+            self._object_id_to_row.update(zip(object_ids[n_free:], new_rows))
+        return rows + new_rows
+
+    def _set_new_metas(self, object_ids: List[str], metas: List[_CommonMeta]):
+        # set metas of objects not in the store column by column
+        rows = self._allocate_rows(object_ids)
+        type_to_indices = defaultdict(list)
+        for i, meta in enumerate(metas):
+            type_to_indices[type(meta)].append(i)
+
+        for meta_type, indices in type_to_indices.items():
+            type_rows = [rows[i] for i in indices]
+            type_metas = [metas[i] for i in indices]
+            self._type_column[type_rows] = self._get_type_id(meta_type)
+            for field in _get_meta_fields(meta_type):
+                if field == "object_id":
+                    continue
+                values = list(map(operator.attrgetter(field), type_metas))
+                if field in self._numeric_columns:
+                    self._numeric_columns[field][type_rows] = [
+                        _NULL if v is None else v for v in values
+                    ]
+                elif field in self._interned_columns:
+                    if field == "bands":
+                        values = [None if v is None else tuple(v) for v in values]
+                    self._interned_columns[field][type_rows] = self._pools[
+                        field
+                    ].add_all(values)
+                else:
+                    column = self._get_object_column(field)
+                    for row, value in zip(type_rows, values):
+                        column[row] = value
+
+            if issubclass(meta_type, _ChunkMeta):
+                band_rows = self._band_rows
+                for row, meta in zip(type_rows, type_metas):
+                    for band in meta.bands or ():
+                        band_rows[band][row] = None
+
+    def _set_metas(self, object_ids: List[str], metas: List[_CommonMeta]):
+        new_object_ids, new_metas = [], []
+        existing = []
+        new_object_id_set = set()
+        for object_id, meta in zip(object_ids, metas):
+            if object_id in self._object_id_to_row or object_id in new_object_id_set:
+                existing.append((object_id, meta))
+            else:
+                new_object_id_set.add(object_id)
+                new_object_ids.append(object_id)
+                new_metas.append(meta)
+        if new_object_ids:
+            self._set_new_metas(new_object_ids, new_metas)
+        for object_id, meta in existing:
+            self._set_meta(object_id, meta)
+
+    @implements(AbstractMetaStore.set_meta)
+    @mo.extensible
+    async def set_meta(self, object_id: str, meta: _CommonMeta):
+        self._set_meta(object_id, meta)
+
+    @set_meta.batch
+    async def batch_set_meta(self, args_list, kwargs_list):
+        object_ids, metas = [], []
+        for args, kwargs in zip(args_list, kwargs_list):
+            object_id, meta = self._get_set_meta_args(*args, **kwargs)
+            object_ids.append(object_id)
+            metas.append(meta)
+        self._set_metas(object_ids, metas)
+
+    @staticmethod
+    def _get_set_meta_args(object_id: str, meta: _CommonMeta):
+        return object_id, meta
+
+    def _get_column_values(self, rows: List[int], field: str) -> List:
+        if field == "object_id":
+            row_object_ids = self._row_object_ids
+            return [row_object_ids[row] for row in rows]
+        elif field in self._numeric_columns:
+            values = self._numeric_columns[field][rows].tolist()
+            return [None if v == _NULL else v for v in values]
+        elif field in self._interned_columns:
+            values = self._pools[field].get_all(
+                self._interned_columns[field][rows].tolist()
+            )
+            if field == "bands":
+                values = [None if v is None else list(v) for v in values]
+            return values
+        else:
+            return self._object_columns[field][rows].tolist()
+
+    def _get_metas(self, args_list, kwargs_list) -> List[Dict]:
+        results = [None] * len(args_list)
+        fields_to_items = defaultdict(list)
+        for i, (args, kwargs) in enumerate(zip(args_list, kwargs_list)):
+            object_id, fields, error = self._get_get_meta_args(*args, **kwargs)
+            if error not in ("raise", "ignore"):  # pragma: no cover
+                raise ValueError("error must be raise or ignore")
+            try:
+                row = self._object_id_to_row[object_id]
+            except KeyError:
+                if error == "raise":
+                    raise
+                continue
+            if fields is None:
+                fields = _get_meta_fields(self._meta_types[self._type_column[row]])
+            fields_to_items[tuple(fields)].append((i, row))
+
+        for fields, items in fields_to_items.items():
+            rows = [row for _, row in items]
+            columns = [self._get_column_values(rows, field) for field in fields]
+            for (i, _), values in zip(items, zip(*columns)):
+                results[i] = dict(zip(fields, values))
+        return results
+
+    @staticmethod
+    def _get_get_meta_args(
+        object_id: str, fields: List[str] = None, error: str = "raise"
+    ):
+        return object_id, fields, error
+
+    @implements(AbstractMetaStore.get_meta)
+    @mo.extensible
+    async def get_meta(
+        self, object_id: str, fields: List[str] = None, error: str = "raise"
+    ) -> Dict:
+        return self._get_metas([(object_id, fields, error)], [dict()])[0]
+
+    @get_meta.batch
+    async def batch_get_meta(self, args_list, kwargs_list):
+        return self._get_metas(args_list, kwargs_list)
+
+    def _del_meta(self, object_id: str):
+        row = self._object_id_to_row[object_id]
+        if issubclass(self._meta_types[self._type_column[row]], _ChunkMeta):
+            for band in self._get_field(row, "bands") or ():
+                rows = self._band_rows[band]
+                del rows[row]
+                if len(rows) == 0:
+                    del self._band_rows[band]
+        self._clear_row(row)
+        del self._object_id_to_row[object_id]
+        self._row_object_ids[row] = None
+        self._free_rows.append(row)
+
+    @implements(AbstractMetaStore.del_meta)
+    @mo.extensible
+    async def del_meta(self, object_id: str):
+        self._del_meta(object_id)
+
+    @del_meta.batch
+    async def batch_del_meta(self, args_list, kwargs_list):
+        for args, kwargs in zip(args_list, kwargs_list):
+            self._del_meta(*args, **kwargs)
+
+    def _get_chunk_row(self, object_id: str) -> int:
+        row = self._object_id_to_row[object_id]
+        assert issubclass(self._meta_types[self._type_column[row]], _ChunkMeta)
+        return row
+
+    def _add_chunk_bands(self, object_id: str, bands: List[BandType]):
+        row = self._get_chunk_row(object_id)
+        prev_bands = self._get_field(row, "bands") or []
+        self._set_field(row, "bands", list(OrderedSet(prev_bands) | OrderedSet(bands)))
+        for band in bands:
+            self._band_rows[band][row] = None
+
+    @implements(AbstractMetaStore.add_chunk_bands)
+    @mo.extensible
+    async def add_chunk_bands(self, object_id: str, bands: List[BandType]):
+        self._add_chunk_bands(object_id, bands)
+
+    @add_chunk_bands.batch
+    async def batch_add_chunk_bands(self, args_list, kwargs_list):
+        for args, kwargs in zip(args_list, kwargs_list):
+            self._add_chunk_bands(*args, **kwargs)
+
+    def _remove_chunk_bands(self, object_id: str, bands: List[BandType]):
+        row = self._get_chunk_row(object_id)
+        prev_bands = self._get_field(row, "bands") or []
+        self._set_field(row, "bands", list(OrderedSet(prev_bands) - OrderedSet(bands)))
+        for band in bands:
+            del self._band_rows[band][row]
+
+    @implements(AbstractMetaStore.remove_chunk_bands)
+    @mo.extensible
+    async def remove_chunk_bands(self, object_id: str, bands: List[BandType]):
+        self._remove_chunk_bands(object_id, bands)
+
+    @remove_chunk_bands.batch
+    async def batch_remove_chunk_bands(self, args_list, kwargs_list):
+        for args, kwargs in zip(args_list, kwargs_list):
+            self._remove_chunk_bands(*args, **kwargs)
+
+    async def get_band_chunks(self, band: BandType) -> List[str]:
+        row_object_ids = self._row_object_ids
+        return [row_object_ids[row] for row in self._band_rows[band]]
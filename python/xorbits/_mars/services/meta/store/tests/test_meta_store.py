@@ -13,17 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from ..... import dataframe as md
 from ..... import tensor as mt
 from .....core import tile
-from ...metas import TensorMeta
+from ...metas import DataFrameChunkMeta, TensorMeta
 from ...store import get_meta_store
 
 
 @pytest.mark.asyncio
-async def test_mock_meta_store():
-    meta_store = get_meta_store("dict")("mock_session_id")
+@pytest.mark.parametrize("store_name", ["dict", "columnar"])
+async def test_mock_meta_store(store_name):
+    meta_store = get_meta_store(store_name)("mock_session_id")
 
     t = mt.random.rand(10, 10)
     t = tile(t)
@@ -53,3 +57,79 @@ async def test_mock_meta_store():
 
     with pytest.raises(KeyError):
         await meta_store.get_meta(t.key)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("store_name", ["dict", "columnar"])
+async def test_chunk_meta_bands(store_name):
+    meta_store = get_meta_store(store_name)("mock_session_id")
+
+    df = md.DataFrame(pd.DataFrame(np.random.rand(10, 3)), chunk_size=2)
+    df = tile(df)
+    band1, band2 = ("127.0.0.1:1", "numa-0"), ("127.0.0.1:2", "numa-0")
+
+    set_metas = []
+    for i, c in enumerate(df.chunks):
+        set_metas.append(
+            meta_store.set_meta.delay(
+                c.key,
+                DataFrameChunkMeta(
+                    object_id=c.key,
+                    shape=c.shape,
+                    dtypes_value=c.dtypes_value,
+                    index_value=c.index_value,
+                    index=c.index,
+                    memory_size=i * 10,
+                    bands=[band1] if i % 2 == 0 else [band2],
+                ),
+            )
+        )
+    await meta_store.set_meta.batch(*set_metas)
+
+    metas = await meta_store.get_meta.batch(
+        *[meta_store.get_meta.delay(c.key) for c in df.chunks]
+    )
+    for i, (c, meta) in enumerate(zip(df.chunks, metas)):
+        assert meta["object_id"] == c.key
+        assert meta["shape"] == c.shape
+        assert meta["index"] == c.index
+        assert meta["memory_size"] == i * 10
+        assert meta["store_size"] is None
+        assert meta["dtypes_value"].key == c.dtypes_value.key
+        assert meta["index_value"].key == c.index_value.key
+    assert (await meta_store.get_meta(df.chunks[0].key, fields=["bands"])) == {
+        "bands": [band1]
+    }
+    assert await meta_store.get_meta("non_exist", error="ignore") is None
+
+    keys = [c.key for c in df.chunks]
+    assert await meta_store.get_band_chunks(band1) == keys[::2]
+    assert await meta_store.get_band_chunks(band2) == keys[1::2]
+
+    # setting meta again merges bands
+    await meta_store.set_meta(
+        keys[0],
+        DataFrameChunkMeta(object_id=keys[0], index=(0, 0), bands=[band2]),
+    )
+    meta = await meta_store.get_meta(keys[0], fields=["bands", "memory_size"])
+    assert set(meta["bands"]) == {band1, band2}
+    assert meta["memory_size"] is None
+    assert keys[0] in await meta_store.get_band_chunks(band2)
+
+    await meta_store.remove_chunk_bands(keys[1], [band2])
+    assert (await meta_store.get_meta(keys[1], fields=["bands"]))["bands"] == []
+    assert keys[1] not in await meta_store.get_band_chunks(band2)
+    await meta_store.add_chunk_bands(keys[1], [band1])
+    assert keys[1] in await meta_store.get_band_chunks(band1)
+
+    await meta_store.del_meta.batch(*[meta_store.del_meta.delay(k) for k in keys])
+    assert await meta_store.get_band_chunks(band1) == []
+    with pytest.raises(KeyError):
+        await meta_store.get_meta(keys[0])
+
+    # rows are reused after deletion
+    await meta_store.set_meta(
+        keys[0], DataFrameChunkMeta(object_id=keys[0], shape=(2, 3), bands=[band1])
+    )
+    assert (await meta_store.get_meta(keys[0]))["shape"] == (2, 3)
+    assert await meta_store.get_band_chunks(band1) == [keys[0]]
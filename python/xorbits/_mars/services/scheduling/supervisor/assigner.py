@@ -46,6 +46,9 @@ class AssignerActor(mo.Actor):
         self._address_to_bands = dict()
         self._device_type_to_bands = dict()
         self._band_watch_task = None
+        # bands whose throughput are degraded, which are assigned
+        # only when no other bands are available
+        self._degraded_bands = set()
 
     async def __post_create__(self):
         from ...cluster.api import ClusterAPI
@@ -80,6 +83,14 @@ class AssignerActor(mo.Actor):
             k: [v[1] for v in tps] for k, tps in grouped_bands
         }
 
+    def set_degraded_bands(self, bands: List[BandType]):
+        self._degraded_bands = set(bands)
+
+    def _choose_band(self, bands: List[BandType]) -> BandType:
+        healthy_bands = [band for band in bands if band not in self._degraded_bands]
+        bands = healthy_bands or bands
+        return bands[np.random.choice(len(bands))]
+
     def _get_device_bands(self, is_gpu: bool):
         band_prefix = "numa" if not is_gpu else "gpu"
         filtered_bands = self._device_type_to_bands.get(band_prefix) or []
@@ -97,12 +108,12 @@ class AssignerActor(mo.Actor):
         if exclude_bands:
             avail_bands = [band for band in bands if band not in exclude_bands]
             if avail_bands:
-                return avail_bands[np.random.choice(len(avail_bands))]
+                return self._choose_band(avail_bands)
             elif not random_when_unavailable:
                 raise NoAvailableBand(
                     f"No bands available after excluding bands {exclude_bands}"
                 )
-        return bands[np.random.choice(len(bands))]
+        return self._choose_band(bands)
 
     async def assign_subtasks(
         self,
@@ -191,6 +202,32 @@ class AssignerActor(mo.Actor):
                                 is_gpu, exclude_bands, random_when_unavailable
                             )
                         band_sizes[band] += meta["store_size"]
+                if self._degraded_bands and band_sizes:
+                    # avoid bands with degraded throughput if possible
+                    healthy_band_sizes = {
+                        band: size
+                        for band, size in band_sizes.items()
+                        if band not in self._degraded_bands
+                    }
+                    if not healthy_band_sizes:
+                        band = self._get_random_band(
+                            is_gpu, exclude_bands, random_when_unavailable
+                        )
+                        if band not in self._degraded_bands:
+                            healthy_band_sizes = {band: 0}
+                    band_sizes = healthy_band_sizes or band_sizes
+                # prefer the worker holding most inputs to reduce transfers,
+                # and then the band, e.g. NUMA node, whose storage holds most
+                address_sizes = defaultdict(lambda: 0)
+                for band, size in band_sizes.items():
+                    address_sizes[band[0]] += size
+                if address_sizes:
+                    max_address_size = max(address_sizes.values())
+                    band_sizes = {
+                        band: size
+                        for band, size in band_sizes.items()
+                        if address_sizes[band[0]] == max_address_size
+                    }
                 bands = []
                 max_size = -1
                 for band, size in band_sizes.items():
@@ -62,6 +62,20 @@ class GlobalResourceManagerActor(mo.Actor):
     async def refresh_bands(self):
         self._band_total_resources = await self._cluster_api.get_all_bands()
 
+    @staticmethod
+    def _fit_band_resource(
+        subtask_resource: Resource, total_resource: Resource
+    ) -> Resource:
+        # subtasks requiring more cpus than the band owns
+        # are limited to all cpus of the band
+        if 0 < total_resource.num_cpus < subtask_resource.num_cpus:
+            return Resource(
+                num_cpus=total_resource.num_cpus,
+                num_gpus=subtask_resource.num_gpus,
+                mem_bytes=subtask_resource.mem_bytes,
+            )
+        return subtask_resource
+
     @mo.extensible
     async def apply_subtask_resources(
         self,
@@ -79,6 +93,9 @@ class GlobalResourceManagerActor(mo.Actor):
         if band in self._band_total_resources:
             total_resource = self._band_total_resources[band]
             for stid, subtask_resource in zip(subtask_ids, subtask_resources):
+                subtask_resource = self._fit_band_resource(
+                    subtask_resource, total_resource
+                )
                 band_used_resource = self._band_used_resources[band]
                 if band_used_resource + subtask_resource > total_resource:
                     break
@@ -119,8 +119,21 @@ class SubtaskManagerActor(mo.Actor):
         )
         from .speculation import SpeculativeScheduler
 
+        assigner_ref = meta_api = None
+        if self._speculation_config.get("enabled", False):
+            from ...meta import MetaAPI
+            from .assigner import AssignerActor
+
+            assigner_ref = await mo.actor_ref(
+                AssignerActor.gen_uid(self._session_id), address=self.address
+            )
+            meta_api = await MetaAPI.create(self._session_id, self.address)
         self._speculation_execution_scheduler = SpeculativeScheduler(
-            self._queueing_ref, self._global_resource_ref, self._speculation_config
+            self._queueing_ref,
+            self._global_resource_ref,
+            self._speculation_config,
+            assigner_ref=assigner_ref,
+            meta_api=meta_api,
         )
         await self._speculation_execution_scheduler.start()
 
@@ -283,6 +296,9 @@ class SubtaskManagerActor(mo.Actor):
                 ProfilingData.collect_subtask(
                     subtask_info.subtask, band, timer.duration
                 )
+                await self._speculation_execution_scheduler.record_subtask_throughput(
+                    subtask_info, band, result
+                )
                 task_api = await self._get_task_api()
                 logger.debug("Finished subtask %s with result %s.", subtask_id, result)
                 await task_api.set_subtask_result(result)
@@ -17,11 +17,14 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Optional
 
 import numpy as np
 
+from ....core.operand import Fetch, FetchShuffle
+from ....typing import BandType
 from ....utils import create_task_with_error_log, parse_readable_size
+from ...subtask import SubtaskResult, SubtaskStatus
 from ..errors import NoAvailableBand
 from .manager import SubtaskScheduleInfo
 
@@ -33,6 +36,10 @@ DEFAULT_SUBTASK_SPECULATION_INTERVAL = 5  # time unit: seconds
 DEFAULT_SUBTASK_SPECULATION_MIN_TASK_RUNTIME = 3
 DEFAULT_SUBTASK_SPECULATION_MULTIPLIER = 1.5
 DEFAULT_SUBTASK_MAX_CONCURRENT_RUN = 3
+# min number of finished subtasks in a group to estimate throughput
+_MIN_THROUGHPUT_SAMPLES = 3
+# weight of the latest relative throughput when updating that of a band
+_BAND_THROUGHPUT_DECAY = 0.3
 
 
 class SpeculativeScheduler:
@@ -42,14 +49,30 @@ class SpeculativeScheduler:
     _grouped_finished_subtasks: Dict[
         str, Dict[str, SubtaskScheduleInfo]
     ]  # key is subtask logic key
+    _grouped_throughputs: Dict[
+        str, Dict[str, float]
+    ]  # key is subtask logic key, value is input bytes per second of subtasks
+    _band_throughputs: Dict[
+        BandType, float
+    ]  # throughput of bands relative to peers, 1.0 at most
 
     def __init__(
-        self, queueing_ref, global_resource_ref, speculation_config: Dict[str, any]
+        self,
+        queueing_ref,
+        global_resource_ref,
+        speculation_config: Dict[str, any],
+        assigner_ref=None,
+        meta_api=None,
     ):
         self._grouped_unfinished_subtasks = defaultdict(dict)
         self._grouped_finished_subtasks = defaultdict(dict)
+        self._grouped_throughputs = defaultdict(dict)
+        self._band_throughputs = dict()
+        self._degraded_bands = set()
         self._queueing_ref = queueing_ref
         self._global_resource_ref = global_resource_ref
+        self._assigner_ref = assigner_ref
+        self._meta_api = meta_api
         self._speculation_config = speculation_config
         self._subtask_speculation_enabled = speculation_config.get("enabled", False)
         assert self._subtask_speculation_enabled in (True, False)
@@ -113,12 +136,111 @@ class SpeculativeScheduler:
         if len(grouped_finished_subtasks) == subtask.logic_parallelism:
             self._grouped_finished_subtasks.pop(subtask.logic_key)
             self._grouped_unfinished_subtasks.pop(subtask.logic_key, None)
+            self._grouped_throughputs.pop(subtask.logic_key, None)
             logger.info(
                 "Subtask group with logic key %s parallelism %s finished.",
                 subtask.logic_key,
                 subtask.logic_parallelism,
             )
 
+    async def record_subtask_throughput(
+        self, subtask_info: SubtaskScheduleInfo, band: BandType, result: SubtaskResult
+    ):
+        """
+        Record input bytes processed per second of a succeeded subtask, and
+        update throughput of the band relative to peers of the subtask. Bands
+        `multiplier` times slower than peers are marked as degraded, and the
+        assigner avoids them when possible.
+        """
+        if (
+            not self._subtask_speculation_enabled
+            or result.status != SubtaskStatus.succeeded
+        ):
+            return
+        input_size = result.input_data_size
+        if (
+            not input_size
+            or result.execution_start_time is None
+            or result.execution_end_time is None
+        ):
+            return
+        duration = result.execution_end_time - result.execution_start_time
+        if duration <= 0:  # pragma: no cover
+            return
+        throughput = input_size / duration
+        subtask = subtask_info.subtask
+        throughputs = self._grouped_throughputs[subtask.logic_key]
+        if len(throughputs) >= _MIN_THROUGHPUT_SAMPLES:
+            relative = min(throughput / np.median(list(throughputs.values())), 1.0)
+            band_throughput = self._band_throughputs.get(band, 1.0)
+            self._band_throughputs[band] = (
+                1 - _BAND_THROUGHPUT_DECAY
+            ) * band_throughput + _BAND_THROUGHPUT_DECAY * relative
+            await self._update_degraded_bands()
+        throughputs[subtask.subtask_id] = throughput
+
+    async def _update_degraded_bands(self):
+        degraded_bands = {
+            band
+            for band, throughput in self._band_throughputs.items()
+            if throughput * self._subtask_speculation_multiplier < 1
+        }
+        if degraded_bands == self._degraded_bands:
+            return
+        if degraded_bands - self._degraded_bands:
+            logger.warning(
+                "Throughput of bands %s is degraded, relative throughput is %s.",
+                degraded_bands - self._degraded_bands,
+                {band: self._band_throughputs[band] for band in degraded_bands},
+            )
+        self._degraded_bands = degraded_bands
+        if self._assigner_ref is not None:
+            await self._assigner_ref.set_degraded_bands(list(degraded_bands))
+
+    def get_degraded_bands(self) -> List[BandType]:
+        return list(self._degraded_bands)
+
+    async def _get_input_sizes(
+        self, subtask_infos: List[SubtaskScheduleInfo]
+    ) -> List[Optional[int]]:
+        """
+        Get sizes of input chunks of subtasks from meta, None if unknown.
+        """
+        sizes = [None] * len(subtask_infos)
+        if self._meta_api is None:
+            return sizes
+        info_keys = []
+        for info in subtask_infos:
+            keys = []
+            for chunk in info.subtask.chunk_graph.iter_indep():
+                if isinstance(chunk.op, FetchShuffle):
+                    # sizes of shuffle data are not recorded in meta
+                    keys = []
+                    break
+                elif isinstance(chunk.op, Fetch):
+                    keys.append(chunk.key)
+            info_keys.append(keys)
+        all_keys = list({key for keys in info_keys for key in keys})
+        if not all_keys:
+            return sizes
+        metas = await self._meta_api.get_chunk_meta.batch(
+            *(
+                self._meta_api.get_chunk_meta.delay(
+                    key, fields=["memory_size"], error="ignore"
+                )
+                for key in all_keys
+            )
+        )
+        key_to_size = {
+            key: meta["memory_size"]
+            for key, meta in zip(all_keys, metas)
+            if meta is not None
+        }
+        for i, keys in enumerate(info_keys):
+            if keys and all(key in key_to_size for key in keys):
+                sizes[i] = sum(key_to_size[key] for key in keys)
+        return sizes
+
     async def _speculative_execution_loop(self):
         while True:
             # check subtasks in the same group which has same logic key periodically, if some subtasks hasn't been
@@ -156,12 +278,37 @@ class SpeculativeScheduler:
                     self._subtask_speculation_min_task_runtime,
                 )
                 now = time.time()
-                # find subtasks whose duration is large enough so that can be took as slow/hang subtasks
                 unfinished_subtask_infos = [
                     info
                     for info in unfinished_subtask_infos
                     if info not in subtask_infos
-                    and now - info.start_time > duration_threshold
+                    and now - info.start_time
+                    > self._subtask_speculation_min_task_runtime
+                ]
+                # when input bytes processed per second of finished subtasks are known,
+                # normalize duration thresholds by input sizes, thus subtasks with large
+                # inputs won't be took as slow ones, while small ones on slow bands will.
+                throughputs = self._grouped_throughputs.get(logic_key) or dict()
+                input_sizes = [None] * len(unfinished_subtask_infos)
+                median_throughput = None
+                if len(throughputs) >= _MIN_THROUGHPUT_SAMPLES:
+                    median_throughput = np.median(list(throughputs.values()))
+                    input_sizes = await self._get_input_sizes(unfinished_subtask_infos)
+                # find subtasks whose duration is large enough so that can be took as slow/hang subtasks
+                unfinished_subtask_infos = [
+                    info
+                    for info, input_size in zip(unfinished_subtask_infos, input_sizes)
+                    if now - info.start_time
+                    > (
+                        max(
+                            input_size
+                            / median_throughput
+                            * self._subtask_speculation_multiplier,
+                            self._subtask_speculation_min_task_runtime,
+                        )
+                        if input_size
+                        else duration_threshold
+                    )
                 ]
                 if not unfinished_subtask_infos:  # pragma: no cover
                     continue
@@ -242,6 +242,51 @@ async def test_assign_broadcaster(actor_pool):
     assert result == ("address1", "numa-0")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("actor_pool", [False], indirect=True)
+async def test_assign_degraded_bands(actor_pool):
+    pool, session_id, assigner_ref, cluster_api, meta_api = actor_pool
+
+    input1 = TensorFetch(key="a", source_key="a", dtype=np.dtype(int)).new_chunk([])
+    input2 = TensorFetch(key="b", source_key="b", dtype=np.dtype(int)).new_chunk([])
+    result_chunk = TensorTreeAdd(args=[input1, input2]).new_chunk([input1, input2])
+
+    chunk_graph = ChunkGraph([result_chunk])
+    chunk_graph.add_node(input1)
+    chunk_graph.add_node(input2)
+    chunk_graph.add_node(result_chunk)
+    chunk_graph.add_edge(input1, result_chunk)
+    chunk_graph.add_edge(input2, result_chunk)
+
+    await meta_api.set_chunk_meta(
+        input1, memory_size=400, store_size=400, bands=[("address0", "numa-0")]
+    )
+    await meta_api.set_chunk_meta(
+        input2, memory_size=200, store_size=200, bands=[("address1", "numa-0")]
+    )
+
+    subtask = Subtask("test_task", session_id, chunk_graph=chunk_graph)
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result == ("address0", "numa-0")
+
+    # prefer healthy bands holding less inputs
+    await assigner_ref.set_degraded_bands([("address0", "numa-0")])
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result == ("address1", "numa-0")
+
+    # choose healthy bands when all bands holding inputs are degraded
+    await assigner_ref.set_degraded_bands(
+        [("address0", "numa-0"), ("address1", "numa-0")]
+    )
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result in (("address2", "numa-0"), ("address3", "numa-0"))
+
+    # keep locality when all bands are degraded
+    await assigner_ref.set_degraded_bands([(f"address{i}", "numa-0") for i in range(4)])
+    [result] = await assigner_ref.assign_subtasks([subtask])
+    assert result == ("address0", "numa-0")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("actor_pool", [True], indirect=True)
 async def test_assign_gpu_tasks(actor_pool):
@@ -81,3 +81,11 @@ async def test_global_resource(actor_pool):
     assert (await global_resource_ref.get_remaining_resources())[
         band
     ] == band_resource - Resource(num_cpus=1)
+    await global_resource_ref.release_subtask_resource(band, session_id, "subtask1")
+
+    # subtasks requiring more cpus than the band are limited to the band
+    assert ["subtask2"] == await global_resource_ref.apply_subtask_resources(
+        band, session_id, ["subtask2"], [band_resource + Resource(num_cpus=1)]
+    )
+    assert (await global_resource_ref.get_remaining_resources())[band].num_cpus == 0
+    await global_resource_ref.release_subtask_resource(band, session_id, "subtask2")
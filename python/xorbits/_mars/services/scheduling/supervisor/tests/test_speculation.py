@@ -14,13 +14,20 @@
 # limitations under the License.
 
 import asyncio
+import time
 from typing import List, Set, Tuple
 
+import numpy as np
 import pytest
 
 from ..... import oscar as mo
+from .....core import ChunkGraph
+from .....tensor.arithmetic import TensorTreeAdd
+from .....tensor.fetch import TensorFetch
 from ....cluster import MockClusterAPI
-from ....subtask import Subtask
+from ....meta import MockMetaAPI
+from ....session import MockSessionAPI
+from ....subtask import Subtask, SubtaskResult, SubtaskStatus
 from ...errors import NoAvailableBand
 from ...supervisor import GlobalResourceManagerActor
 from ..manager import SubtaskScheduleInfo
@@ -55,6 +62,17 @@ class MockSubtaskQueueingActor(mo.Actor):
         return self._exceptions
 
 
+class MockAssignerActor(mo.Actor):
+    def __init__(self):
+        self._degraded_bands = []
+
+    def set_degraded_bands(self, bands):
+        self._degraded_bands = bands
+
+    def get_degraded_bands(self):
+        return self._degraded_bands
+
+
 @pytest.fixture
 async def actor_pool():
     pool = await mo.create_actor_pool("127.0.0.1", n_process=0)
@@ -150,3 +168,107 @@ async def test_speculation(actor_pool):
     speculative_scheduler.finish_subtask(subtask_infos[-1])
     assert len(speculative_scheduler._grouped_unfinished_subtasks) == 0
     await speculative_scheduler.stop()
+
+
+def _gen_subtask_with_input(subtask_id: str, parallelism: int):
+    fetch_chunk = TensorFetch(
+        key=f"input_{subtask_id}", source_key=f"input_{subtask_id}", dtype=np.dtype(int)
+    ).new_chunk([])
+    result_chunk = TensorTreeAdd(args=[fetch_chunk]).new_chunk([fetch_chunk])
+    chunk_graph = ChunkGraph([result_chunk])
+    chunk_graph.add_node(fetch_chunk)
+    chunk_graph.add_node(result_chunk)
+    chunk_graph.add_edge(fetch_chunk, result_chunk)
+    subtask = Subtask(
+        subtask_id,
+        chunk_graph=chunk_graph,
+        logic_key="logic_key2",
+        logic_parallelism=parallelism,
+    )
+    return subtask, fetch_chunk
+
+
+@pytest.mark.asyncio
+async def test_throughput_speculation(actor_pool):
+    pool, cluster_api, session_id, slots_ref, queue_ref = actor_pool
+    await MockSessionAPI.create(pool.external_address, session_id=session_id)
+    meta_api = await MockMetaAPI.create(session_id, pool.external_address)
+    assigner_ref = await mo.create_actor(
+        MockAssignerActor, address=pool.external_address
+    )
+    speculation_conf = {
+        "enabled": True,
+        "interval": 1000,
+        "threshold": 0.2,
+        "min_task_runtime": 0.01,
+        "multiplier": 1.5,
+        "max_concurrent_run": 2,
+    }
+    speculative_scheduler = SpeculativeScheduler(
+        queue_ref,
+        slots_ref,
+        speculation_conf,
+        assigner_ref=assigner_ref,
+        meta_api=meta_api,
+    )
+    healthy_band, slow_band = ("addr0", "numa-0"), ("addr1", "numa-0")
+
+    # 4 finished subtasks processing 100 bytes per second,
+    # subtask 4 owns a large input while subtask 5 owns a small one
+    input_sizes = [100] * 4 + [10000, 10]
+    subtask_infos = []
+    now = time.time()
+    for i, input_size in enumerate(input_sizes):
+        subtask, fetch_chunk = _gen_subtask_with_input(str(i), len(input_sizes))
+        subtask.retryable = True
+        await meta_api.set_chunk_meta(
+            fetch_chunk,
+            memory_size=input_size,
+            store_size=input_size,
+            bands=[healthy_band],
+        )
+        subtask_info = SubtaskScheduleInfo(subtask, start_time=now - 2)
+        subtask_info.band_futures[healthy_band] = asyncio.ensure_future(
+            asyncio.sleep(1)
+        )
+        speculative_scheduler.add_subtask(subtask_info)
+        subtask_infos.append(subtask_info)
+
+    for subtask_info, input_size in zip(subtask_infos[:4], input_sizes):
+        result = SubtaskResult(
+            subtask_id=subtask_info.subtask.subtask_id,
+            status=SubtaskStatus.succeeded,
+            input_data_size=input_size,
+            execution_start_time=now - 2,
+            execution_end_time=now - 1,
+        )
+        await speculative_scheduler.record_subtask_throughput(
+            subtask_info, healthy_band, result
+        )
+        subtask_info.end_time = now - 1
+        speculative_scheduler.finish_subtask(subtask_info)
+    assert await assigner_ref.get_degraded_bands() == []
+
+    # subtasks of the group run 10 times slower on the slow band
+    for i in range(2):
+        subtask, _ = _gen_subtask_with_input(f"slow_{i}", len(input_sizes))
+        result = SubtaskResult(
+            subtask_id=subtask.subtask_id,
+            status=SubtaskStatus.succeeded,
+            input_data_size=100,
+            execution_start_time=now - 10,
+            execution_end_time=now,
+        )
+        await speculative_scheduler.record_subtask_throughput(
+            SubtaskScheduleInfo(subtask), slow_band, result
+        )
+    assert await assigner_ref.get_degraded_bands() == [slow_band]
+    assert speculative_scheduler.get_degraded_bands() == [slow_band]
+
+    # both subtasks run longer than 1.5 times of median duration, however,
+    # only the one with small input is slow considering its input size
+    await speculative_scheduler._speculative_execution()
+    submitted = await queue_ref.get_subtasks()
+    assert submitted == [subtask_infos[5].subtask]
+
+    await mo.destroy_actor(assigner_ref)
@@ -21,7 +21,7 @@ import pprint
 import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .... import oscar as mo
 from ...._utils import Timer
@@ -38,7 +38,7 @@ from ...meta import MetaAPI
 from ...storage import StorageAPI
 from ...subtask import Subtask, SubtaskAPI, SubtaskResult, SubtaskStatus
 from ...task.task_info_collector import TaskInfoCollector
-from .quota import QuotaActor
+from .quota import MemoryUsageRatios, QuotaActor
 from .workerslot import BandSlotManagerActor
 
 logger = logging.getLogger(__name__)
@@ -110,6 +110,22 @@ async def _retry_run(
                 raise ex
 
 
+def _get_subtask_op_types(subtask: Subtask) -> List[str]:
+    op_types = set()
+    for chunk in subtask.chunk_graph:
+        for c in getattr(chunk, "composed", None) or [chunk]:
+            if not isinstance(c.op, (Fetch, FetchShuffle)):
+                op_types.add(type(c.op).__name__)
+    return sorted(op_types)
+
+
+def _get_subtask_slot_num(subtask: Subtask) -> int:
+    resource = subtask.required_resource
+    if resource is None or not resource.num_cpus:
+        return 1
+    return max(int(resource.num_cpus), 1)
+
+
 def _fill_subtask_result_with_exception(
     subtask: Subtask, subtask_info: SubtaskExecutionInfo
 ):
@@ -157,6 +173,7 @@ class SubtaskExecutionActor(mo.StatelessActor):
         self._data_prepare_timeout = data_prepare_timeout
 
         self._subtask_info = dict()
+        self._memory_ratios = MemoryUsageRatios()
         self._submitted_subtask_count = Metrics.counter(
             "mars.band.submitted_subtask_count",
             "The count of submitted subtasks to the current band.",
@@ -183,6 +200,27 @@ class SubtaskExecutionActor(mo.StatelessActor):
     async def _get_band_quota_ref(self, band: str) -> mo.ActorRefType[QuotaActor]:
         return await mo.actor_ref(QuotaActor.gen_uid(band), address=self.address)
 
+    @alru_cache(cache_exceptions=False)
+    async def _get_band_quota_size(self, band: str) -> int:
+        quota_ref = await self._get_band_quota_ref(band)
+        return await quota_ref.get_quota_size()
+
+    async def _adjust_quota_size(
+        self, band: str, op_types: List[str], calc_size: int
+    ) -> int:
+        """
+        Scale estimated memory cost by observed ratios of operands,
+        which never exceeds the quota of the band.
+        """
+        ratio = self._memory_ratios.get_ratio(op_types)
+        if ratio == 1.0:
+            return calc_size
+        quota_size = await self._get_band_quota_size(band)
+        return int(max(min(calc_size * ratio, quota_size), min(calc_size, quota_size)))
+
+    def get_memory_usage_ratios(self) -> Dict[str, float]:
+        return self._memory_ratios.to_dict()
+
     async def _prepare_input_data(self, subtask: Subtask, band_name: str):
         queries = []
         shuffle_queries = []
@@ -385,13 +423,25 @@ class SubtaskExecutionActor(mo.StatelessActor):
             _store_size, calc_size = await asyncio.to_thread(
                 self._estimate_sizes, subtask, input_sizes
             )
+            op_types = _get_subtask_op_types(subtask)
+            quota_size = await self._adjust_quota_size(band_name, op_types, calc_size)
             self._check_cancelling(subtask_info)
 
-            batch_quota_req = {(subtask.session_id, subtask.subtask_id): calc_size}
-            logger.debug("Start actual running of subtask %s", subtask.subtask_id)
+            batch_quota_req = {(subtask.session_id, subtask.subtask_id): quota_size}
+            logger.debug(
+                "Start actual running of subtask %s, estimated memory %s, quota %s",
+                subtask.subtask_id,
+                calc_size,
+                quota_size,
+            )
             subtask_info.result = await self._retry_run_subtask(
                 subtask, band_name, subtask_api, batch_quota_req
             )
+            if subtask_info.result.status == SubtaskStatus.succeeded:
+                # feed observed memory back to adjust later quota requests
+                self._memory_ratios.record(
+                    op_types, calc_size, subtask_info.result.peak_memory_size
+                )
         except:  # noqa: E722  # pylint: disable=bare-except
             _fill_subtask_result_with_exception(subtask, subtask_info)
         finally:
@@ -423,7 +473,8 @@ class SubtaskExecutionActor(mo.StatelessActor):
                 self._check_cancelling(subtask_info)
 
                 slot_id = await slot_manager_ref.acquire_free_slot(
-                    (subtask.session_id, subtask.subtask_id)
+                    (subtask.session_id, subtask.subtask_id),
+                    n_slots=_get_subtask_slot_num(subtask),
                 )
                 subtask_info.slot_id = slot_id
                 self._check_cancelling(subtask_info)
@@ -19,7 +19,7 @@ import logging
 import time
 from collections import OrderedDict, namedtuple
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, Iterable, Optional, Tuple, Union
 
 from .... import oscar as mo
 from .... import resource as mars_resource
@@ -31,6 +31,49 @@ logger = logging.getLogger(__name__)
 QuotaDumpType = namedtuple("QuotaDumpType", "allocations requests hold_sizes")
 
 
+class MemoryUsageRatios:
+    """
+    Ratios of observed peak memory of subtasks to estimated sizes
+    per operand type, which adjust sizes of quota requests of later
+    subtasks, thus admission adapts to under- or over-estimations.
+    """
+
+    def __init__(
+        self,
+        decay: float = 0.3,
+        min_ratio: float = 0.25,
+        max_ratio: float = 10.0,
+        min_sample_size: int = 1024**2,
+    ):
+        self._decay = decay
+        self._min_ratio = min_ratio
+        self._max_ratio = max_ratio
+        self._min_sample_size = min_sample_size
+        self._ratios = dict()
+
+    def get_ratio(self, op_types: Iterable[str]) -> float:
+        # take the largest ratio among operands to avoid under-estimation
+        return max(
+            (self._ratios.get(op_type, 1.0) for op_type in op_types), default=1.0
+        )
+
+    def record(self, op_types: Iterable[str], estimated: int, observed: Optional[int]):
+        if observed is None or estimated < self._min_sample_size:
+            return
+        ratio = min(max(observed / estimated, self._min_ratio), self._max_ratio)
+        for op_type in op_types:
+            old_ratio = self._ratios.get(op_type)
+            if old_ratio is None:
+                self._ratios[op_type] = ratio
+            else:
+                self._ratios[op_type] = (
+                    1 - self._decay
+                ) * old_ratio + self._decay * ratio
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self._ratios)
+
+
 @dataclass
 class QuotaRequest:
     req_size: Tuple
@@ -209,6 +252,9 @@ class QuotaActor(mo.Actor):
         # get total allocated size, for debug purpose
         return self._total_allocated
 
+    def get_quota_size(self):
+        return self._quota_size
+
     async def alter_allocations(
         self,
         keys: Tuple,
@@ -99,12 +99,14 @@ class MockQuotaActor(QuotaActor, CancelDetectActorMixin):
 
 
 class MockBandSlotManagerActor(BandSlotManagerActor, CancelDetectActorMixin):
-    async def acquire_free_slot(self, session_stid: Tuple[str, str], block=True):
+    async def acquire_free_slot(
+        self, session_stid: Tuple[str, str], block=True, n_slots: int = 1
+    ):
         if getattr(self, "_delay_function", None) != "acquire_free_slot":
-            return super().acquire_free_slot(session_stid, block)
+            return super().acquire_free_slot(session_stid, block, n_slots)
         else:
             async with self._delay_method():
-                return super().acquire_free_slot(session_stid, block)
+                return super().acquire_free_slot(session_stid, block, n_slots)
 
     async def upload_slot_usages(self, periodical: bool = False):
         if (
@@ -294,6 +296,8 @@ async def test_execute_tensor(actor_pool):
     # check if results are correct
     result = await storage_api.get(result_chunk.key)
     np.testing.assert_array_equal(data1 + data2, result)
+    if os.path.exists("/proc/self/statm"):
+        assert subtask_result.peak_memory_size is not None
 
     # check if quota computations are correct
     quota_ref = await mo.actor_ref(
@@ -468,14 +472,10 @@ def test_estimate_size():
 
     index_value = parse_index(pd.Index([10, 20, 30], dtype=np.int64))
 
-    input1 = DataFrameFetch(
-        output_types=[OutputType.series],
-    ).new_chunk(
+    input1 = DataFrameFetch(output_types=[OutputType.series],).new_chunk(
         [], _key="INPUT1", shape=(np.nan,), dtype=np.dtype("O"), index_value=index_value
     )
-    input2 = DataFrameFetch(
-        output_types=[OutputType.series],
-    ).new_chunk(
+    input2 = DataFrameFetch(output_types=[OutputType.series],).new_chunk(
         [], _key="INPUT2", shape=(np.nan,), dtype=np.dtype("O"), index_value=index_value
     )
     result_chunk = DataFrameAdd(
@@ -24,6 +24,7 @@ from ..... import oscar as mo
 from .....tests.core import mock
 from .....utils import get_next_port
 from ...worker import BandSlotManagerActor, MemQuotaActor, QuotaActor
+from ..quota import MemoryUsageRatios
 
 
 class MockBandSlotManagerActor(mo.Actor):
@@ -182,3 +183,28 @@ async def test_mem_quota_allocation(actor_pool, enable_kill_slot):
             bool(await mock_band_slot_manager_ref.get_restart_record())
             == enable_kill_slot
         )
+
+
+def test_memory_usage_ratios():
+    ratios = MemoryUsageRatios(decay=0.5, min_sample_size=100)
+    assert ratios.get_ratio(["OpA"]) == 1.0
+    assert ratios.get_ratio([]) == 1.0
+
+    # small or unknown samples are ignored
+    ratios.record(["OpA"], 10, 1000)
+    ratios.record(["OpA"], 1000, None)
+    assert ratios.to_dict() == {}
+
+    ratios.record(["OpA", "OpB"], 1000, 3000)
+    assert ratios.get_ratio(["OpA"]) == 3.0
+    ratios.record(["OpA"], 1000, 1000)
+    assert ratios.get_ratio(["OpA"]) == 2.0
+    # take the largest ratio of operands
+    assert ratios.get_ratio(["OpA", "OpB"]) == 3.0
+    assert ratios.get_ratio(["OpA", "OpC"]) == 2.0
+
+    # ratios are clipped
+    ratios.record(["OpC"], 1000, 1)
+    assert ratios.get_ratio(["OpC"]) == 0.25
+    ratios.record(["OpD"], 1000, 10**6)
+    assert ratios.get_ratio(["OpD"]) == 10.0
@@ -175,6 +175,76 @@ async def test_slot_assign(actor_pool: ActorPoolType):
     assert log_series.iloc[group_size:].min() > delay / 4
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("actor_pool", [0], indirect=True)
+async def test_multi_slot_assign(actor_pool: ActorPoolType):
+    pool, slot_manager_ref = actor_pool
+
+    call_logs = dict()
+    group_size = 4
+    delay = 1
+    await asyncio.gather(
+        *(
+            mo.create_actor(
+                TaskActor,
+                call_logs,
+                slot_id=slot_id,
+                uid=TaskActor.gen_uid(slot_id),
+                address=pool.external_address,
+            )
+            for slot_id in range(group_size)
+        )
+    )
+    assert len((await slot_manager_ref.dump_data()).free_slots) == group_size
+
+    session_stid = ("session_id", "subtask_id")
+    slot_id = await slot_manager_ref.acquire_free_slot(session_stid, n_slots=3)
+    with pytest.raises(NoFreeSlot):
+        await slot_manager_ref.acquire_free_slot(
+            ("session_id", "subtask_id_nonblock"), block=False, n_slots=2
+        )
+    await slot_manager_ref.release_free_slot(slot_id, session_stid)
+
+    async def task_fun(idx, n_slots):
+        session_stid = ("session_id", f"subtask_id{idx}")
+        slot_id = await slot_manager_ref.acquire_free_slot(
+            session_stid, n_slots=n_slots
+        )
+        assert slot_id == await slot_manager_ref.get_subtask_slot(session_stid)
+        ref = await mo.actor_ref(
+            uid=TaskActor.gen_uid(slot_id), address=pool.external_address
+        )
+        await ref.queued_call(idx, session_stid, delay)
+
+    # subtask 0 and 1 reserve 3 of 4 slots, thus subtask 2
+    # requiring 2 slots waits until subtask 0 finishes
+    start_time = time.time()
+    tasks = [asyncio.create_task(task_fun(0, 2))]
+    await asyncio.sleep(0.1)
+    tasks.append(asyncio.create_task(task_fun(1, 1)))
+    await asyncio.sleep(0.1)
+    tasks.append(asyncio.create_task(task_fun(2, 2)))
+    await asyncio.sleep(0.1)
+    assert len((await slot_manager_ref.dump_data()).free_slots) == 1
+    await asyncio.gather(*tasks)
+
+    log_series = pd.Series(call_logs).sort_index() - start_time
+    assert len(log_series) == 3
+    assert log_series.iloc[:2].max() < delay / 2
+    assert log_series.iloc[2] > delay
+
+    # all slots are released
+    assert len((await slot_manager_ref.dump_data()).free_slots) == group_size
+    # slots to acquire are limited by slots of the band
+    session_stid = ("session_id", "subtask_id_all")
+    slot_id = await slot_manager_ref.acquire_free_slot(
+        session_stid, n_slots=group_size * 2
+    )
+    assert len((await slot_manager_ref.dump_data()).free_slots) == 0
+    await slot_manager_ref.release_free_slot(slot_id, session_stid)
+    assert len((await slot_manager_ref.dump_data()).free_slots) == group_size
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("actor_pool", [1], indirect=True)
 async def test_slot_kill(actor_pool: ActorPoolType):
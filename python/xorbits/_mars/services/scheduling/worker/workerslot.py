@@ -85,6 +85,9 @@ class BandSlotManagerActor(mo.Actor):
         self._n_slots = n_slots
 
         self._semaphore = asyncio.Semaphore(0)
+        # serializes acquisitions of multiple slots to avoid deadlocks
+        # between subtasks each holding a part of slots they need
+        self._multi_slot_lock = asyncio.Lock()
         self._slot_control_refs = dict()
         self._free_slots = set()
         self._fresh_slots = set()
@@ -95,6 +98,9 @@ class BandSlotManagerActor(mo.Actor):
 
         self._session_stid_to_slot = dict()
         self._slot_to_session_stid = dict()
+        # extra slots reserved by subtasks requiring multiple cpus,
+        # subtasks only run in the slot returned on acquisition
+        self._session_stid_to_extra_slots = dict()
         self._last_report_time = time.time()
 
         self._slot_to_proc = dict()
@@ -144,18 +150,52 @@ class BandSlotManagerActor(mo.Actor):
     def get_subtask_slot(self, session_stid: Tuple[str, str]):
         return self._session_stid_to_slot.get(session_stid)
 
-    async def acquire_free_slot(self, session_stid: Tuple[str, str], block=True):
-        if not block and self._semaphore.locked():
+    async def _acquire_semaphore(self, n_slots: int):
+        if n_slots == 1:
+            await self._semaphore.acquire()
+            return
+
+        async with self._multi_slot_lock:
+            n_acquired = 0
+            try:
+                for _ in range(n_slots):
+                    await self._semaphore.acquire()
+                    n_acquired += 1
+            except asyncio.CancelledError:
+                for _ in range(n_acquired):
+                    self._semaphore.release()
+                raise
+
+    async def acquire_free_slot(
+        self, session_stid: Tuple[str, str], block=True, n_slots: int = 1
+    ):
+        """
+        Acquire free slots for a subtask. When `n_slots` is more than 1,
+        slots are reserved atomically for the subtask running with
+        multiple threads, and the id of the slot to run the subtask
+        is returned.
+        """
+        n_total_slots = max(self._n_slots, len(self._slot_to_proc))
+        n_slots = max(min(n_slots, n_total_slots), 1)
+        if not block and (self._semaphore.locked() or len(self._free_slots) < n_slots):
             raise NoFreeSlot(f"No free slot for {session_stid}")
-        yield self._semaphore.acquire()
+        yield self._acquire_semaphore(n_slots)
         if self._restarting:
             yield self._restart_done_event.wait()
 
         slot_id = self._free_slots.pop()
-        self._fresh_slots.difference_update([slot_id])
+        extra_slot_ids = [self._free_slots.pop() for _ in range(n_slots - 1)]
+        self._fresh_slots.difference_update([slot_id] + extra_slot_ids)
         self._slot_to_session_stid[slot_id] = session_stid
         self._session_stid_to_slot[session_stid] = slot_id
-        logger.debug("Slot %d acquired for subtask %r", slot_id, session_stid)
+        if extra_slot_ids:
+            self._session_stid_to_extra_slots[session_stid] = extra_slot_ids
+        logger.debug(
+            "Slot %d acquired for subtask %r with %d extra slots",
+            slot_id,
+            session_stid,
+            len(extra_slot_ids),
+        )
         raise mo.Return(slot_id)
 
     def release_free_slot(self, slot_id: int, session_stid: Tuple[str, str]):
@@ -175,9 +215,11 @@ class BandSlotManagerActor(mo.Actor):
 
         logger.debug("Slot %d released", slot_id)
 
-        if slot_id not in self._free_slots:
-            self._free_slots.add(slot_id)
-            self._semaphore.release()
+        extra_slot_ids = self._session_stid_to_extra_slots.pop(session_stid, [])
+        for released_slot_id in [slot_id] + extra_slot_ids:
+            if released_slot_id not in self._free_slots:
+                self._free_slots.add(released_slot_id)
+                self._semaphore.release()
 
     def register_slot(self, slot_id: int, pid: int):
         try:
@@ -261,7 +303,9 @@ class BandSlotManagerActor(mo.Actor):
         for slot_id, proc in self._slot_to_proc.items():
             if slot_id not in self._slot_to_session_stid:
                 continue
-            session_id, subtask_id = self._slot_to_session_stid[slot_id]
+            session_stid = self._slot_to_session_stid[slot_id]
+            session_id, subtask_id = session_stid
+            n_slots = 1 + len(self._session_stid_to_extra_slots.get(session_stid, ()))
             cpu_usage, gpu_usage, processor_usage = 0, 0, 0
             if self._band_name.startswith("gpu"):
                 processor_usage = gpu_usage = 1
@@ -293,7 +337,8 @@ class BandSlotManagerActor(mo.Actor):
                         session_id,
                         subtask_id,
                         Resource(
-                            num_cpus=max(1.0, cpu_usage), num_gpus=max(1.0, gpu_usage)
+                            num_cpus=max(float(n_slots), cpu_usage),
+                            num_gpus=max(1.0, gpu_usage),
                         ),
                     )
                 )
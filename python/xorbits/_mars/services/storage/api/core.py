@@ -14,7 +14,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
 from ....storage.base import StorageLevel
 from ..core import DataInfo
@@ -80,3 +80,28 @@ class AbstractStorageAPI(ABC):
         out
             List of information for specified key
         """
+
+    @abstractmethod
+    async def persist(
+        self,
+        data_keys: List[str],
+        level: Optional[StorageLevel] = StorageLevel.MEMORY,
+        priority: int = 1,
+        error: str = "raise",
+    ):
+        """
+        Keep data in the storage level, data with higher priority
+        is spilled later than others.
+
+        Parameters
+        ----------
+        data_keys: list
+            data keys to persist
+        level: StorageLevel
+            the storage level to keep data, data is moved if it
+            is stored in a higher level, None to keep it where it is
+        priority: int
+            priority when spilling, 0 is the priority of normal data
+        error: str
+            raise or ignore
+        """
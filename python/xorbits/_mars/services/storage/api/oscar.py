@@ -14,7 +14,7 @@
 # limitations under the License.
 
 import sys
-from typing import Any, List, Tuple, Type, TypeVar, Union
+from typing import Any, List, Optional, Tuple, Type, TypeVar, Union
 
 from .... import oscar as mo
 from ....lib.aio import alru_cache
@@ -237,6 +237,17 @@ class StorageAPI(AbstractStorageAPI):
             )
         return await self._storage_handler_ref.unpin.batch(*unpins)
 
+    async def persist(
+        self,
+        data_keys: List[str],
+        level: Optional[StorageLevel] = StorageLevel.MEMORY,
+        priority: int = 1,
+        error: str = "raise",
+    ):
+        await self._storage_handler_ref.persist(
+            self._session_id, data_keys, level, priority, error
+        )
+
     async def open_reader(self, data_key: str) -> StorageFileObject:
         """
         Return a file-like object for reading.
@@ -14,7 +14,7 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Optional
 
 from .... import oscar as mo
 from ....storage import StorageLevel
@@ -66,6 +66,16 @@ class StorageWebAPIHandler(MarsServiceWebAPIHandler):
         res_data = serialize_serializable(results)
         self.write(res_data)
 
+    @web_api("batch/persist", method="post")
+    async def persist_batch_data(self, session_id: str):
+        data_keys, level, priority, error = deserialize_serializable(self.request.body)
+        storage_api_to_keys = defaultdict(list)
+        for data_key in data_keys:
+            oscar_api = await self._get_storage_api_by_object_id(session_id, data_key)
+            storage_api_to_keys[oscar_api].append(data_key)
+        for api, keys in storage_api_to_keys.items():
+            await api.persist(keys, level, priority, error)
+
     @web_api("(?P<data_key>[^/]+)", method="post")
     async def get_data_by_post(self, session_id: str, data_key: str):
         body_args = (
@@ -169,3 +179,17 @@ class WebStorageAPI(AbstractStorageAPI, MarsWebAPIClientMixin):
             params=params,
         )
         return deserialize_serializable(res.body)
+
+    async def persist(
+        self,
+        data_keys: List[str],
+        level: Optional[StorageLevel] = StorageLevel.MEMORY,
+        priority: int = 1,
+        error: str = "raise",
+    ):
+        path = f"{self._address}/api/session/{self._session_id}/storage/batch/persist"
+        await self._request_url(
+            path=path,
+            method="POST",
+            data=serialize_serializable([data_keys, level, priority, error]),
+        )
@@ -213,6 +213,8 @@ class DataManagerActor(mo.Actor):
         # it records offset and size.
         self._sub_key_to_sub_info = dict()
         self._store_key_to_sub_infos = dict()
+        # priorities of data when spilling, kept across levels
+        self._data_priorities = dict()
         for level in StorageLevel.__members__.values():
             for band_name in bands:
                 self._data_info_list[level, band_name] = dict()
@@ -288,9 +290,12 @@ class DataManagerActor(mo.Actor):
         self._data_info_list[data_info.level, data_info.band][
             (session_id, data_key)
         ] = object_info
-        self._spill_strategy[data_info.level, data_info.band].record_put_info(
-            (session_id, data_key), data_info.store_size
-        )
+        spill_strategy = self._spill_strategy[data_info.level, data_info.band]
+        spill_strategy.record_put_info((session_id, data_key), data_info.store_size)
+        if (session_id, data_key) in self._data_priorities:
+            spill_strategy.set_priority(
+                (session_id, data_key), self._data_priorities[session_id, data_key]
+            )
         if sub_key_infos:
             for key, (offset, size) in sub_key_infos.items():
                 self._sub_key_to_sub_info[(session_id, key)] = SubInfo(
@@ -317,6 +322,7 @@ class DataManagerActor(mo.Actor):
             rest = [info for info in infos if info.data_info.level != level]
             if len(rest) == 0:
                 del self._data_key_to_infos[(session_id, data_key)]
+                self._data_priorities.pop((session_id, data_key), None)
             else:  # pragma: no cover
                 self._data_key_to_infos[(session_id, data_key)] = rest
 
@@ -367,6 +373,27 @@ class DataManagerActor(mo.Actor):
                 levels.add(level)
         return list(levels)
 
+    def set_priority(
+        self,
+        session_id: str,
+        data_keys: List[str],
+        band_name: str,
+        priority: int,
+        error: str = "raise",
+    ):
+        for data_key in data_keys:
+            infos = self.get_data_infos(session_id, data_key, band_name, error)
+            if not infos:
+                continue
+            if priority:
+                self._data_priorities[session_id, data_key] = priority
+            else:
+                self._data_priorities.pop((session_id, data_key), None)
+            for info in infos:
+                self._spill_strategy[info.level, info.band].set_priority(
+                    (session_id, data_key), priority
+                )
+
     def get_spillable_size(self, level: StorageLevel, band_name: str):
         return self._spill_strategy[level, band_name].get_spillable_size()
 
@@ -390,6 +417,7 @@ class StorageManagerActor(mo.StatelessActor):
         self._handler_cls = kwargs.pop("storage_handler_cls", StorageHandlerActor)
         self._storage_configs = storage_configs
         self._all_bands = None
+        self._band_to_resource = None
         self._cluster_api = None
         self._upload_task = None
 
@@ -411,9 +439,13 @@ class StorageManagerActor(mo.StatelessActor):
             self._cluster_api = cluster_api = await ClusterAPI.create(self.address)
             band_to_resource = await cluster_api.get_bands()
             self._all_bands = [band[1] for band in band_to_resource]
+            self._band_to_resource = {
+                band[1]: resource for band, resource in band_to_resource.items()
+            }
         except mo.ActorNotExist:
             # in some test cases, cluster service is not available
             self._all_bands = ["numa-0"]
+            self._band_to_resource = dict()
 
         # stores the mapping from data key to storage info
         self._data_manager = await mo.create_actor(
@@ -461,6 +493,7 @@ class StorageManagerActor(mo.StatelessActor):
         self._quotas = quotas = defaultdict(dict)
         self._spill_managers = spill_managers = defaultdict(dict)
         for backend, setup_params in self._storage_configs.items():
+            band_sizes = dict()
             if backend == "cuda":  # pragma: no cover
                 cuda_infos = await asyncio.to_thread(cuda_card_stats)
                 storage_bands = [s for s in self._all_bands if s.startswith("gpu-")]
@@ -471,11 +504,16 @@ class StorageManagerActor(mo.StatelessActor):
                     params = dict(size=size, **setup_params)
                     clients.append(await self._setup_storage(gpu_band, backend, params))
             else:
-                storage_bands = ["numa-0"]
-                clients = [
-                    await self._setup_storage(band_name, backend, setup_params)
-                    for band_name in storage_bands
-                ]
+                storage_bands = self._get_numa_storage_bands()
+                client = await self._setup_storage("numa-0", backend, setup_params)
+                clients = [client] * len(storage_bands)
+                # when workers are split into bands by NUMA nodes, the storage
+                # is shared and its quota is split by memory of bands
+                band_sizes = self._split_numa_storage_size(client.size, storage_bands)
+                for band_name in storage_bands[1:]:
+                    self._init_params[band_name][backend] = self._init_params["numa-0"][
+                        backend
+                    ]
 
             for level in StorageLevel.__members__.values():
                 for client, storage_band in zip(clients, storage_bands):
@@ -489,7 +527,7 @@ class StorageManagerActor(mo.StatelessActor):
                             StorageQuotaActor,
                             self._data_manager,
                             level,
-                            client.size,
+                            band_sizes.get(storage_band, client.size),
                             uid=StorageQuotaActor.gen_uid(storage_band, level),
                             address=self.address,
                         )
@@ -500,6 +538,29 @@ class StorageManagerActor(mo.StatelessActor):
                             address=self.address,
                         )
 
+    def _get_numa_storage_bands(self) -> List[str]:
+        numa_bands = [band for band in self._all_bands if band.startswith("numa-")]
+        if "numa-0" not in numa_bands:
+            return ["numa-0"]
+        return sorted(numa_bands, key=lambda band: int(band[5:]))
+
+    def _split_numa_storage_size(
+        self, size: Optional[int], storage_bands: List[str]
+    ) -> Dict[str, Optional[int]]:
+        if size is None or len(storage_bands) <= 1:
+            return dict()
+        mem_sizes = [
+            getattr(self._band_to_resource.get(band), "mem_bytes", 0) or 0
+            for band in storage_bands
+        ]
+        if not all(mem_sizes):  # pragma: no cover
+            mem_sizes = [1] * len(storage_bands)
+        total_mem = sum(mem_sizes)
+        return {
+            band: int(size * mem_size / total_mem)
+            for band, mem_size in zip(storage_bands, mem_sizes)
+        }
+
     async def _create_storage_handler_actors(self):
         from .handler import StorageHandlerActor
         from .transfer import ReceiverManagerActor, SenderManagerActor
@@ -593,13 +654,13 @@ class StorageManagerActor(mo.StatelessActor):
         return init_params
 
     def _get_band_quota_refs(self, band_name):
-        band_quotas = self._quotas[band_name].copy()
-        band_quotas.update(self._quotas["numa-0"])
+        band_quotas = self._quotas["numa-0"].copy()
+        band_quotas.update(self._quotas[band_name])
         return band_quotas
 
     def _get_band_spill_managers(self, band_name):
-        band_spill_managers = self._spill_managers[band_name].copy()
-        band_spill_managers.update(self._spill_managers["numa-0"])
+        band_spill_managers = self._spill_managers["numa-0"].copy()
+        band_spill_managers.update(self._spill_managers[band_name])
         return band_spill_managers
 
     async def _setup_storage(
@@ -16,7 +16,7 @@
 import asyncio
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from ... import oscar as mo
 from ...serialization import AioDeserializer
@@ -41,6 +41,13 @@ cudf = lazy_import("cudf")
 logger = logging.getLogger(__name__)
 
 
+def _is_same_storage_band(band_name: str, other_band_name: str) -> bool:
+    # NUMA bands of a worker share the same storage and transfer actors
+    return band_name == other_band_name or (
+        band_name.startswith("numa-") and other_band_name.startswith("numa-")
+    )
+
+
 class StorageHandlerActor(mo.Actor):
     """
     Storage handler actor, provide methods like `get`, `put`, etc.
@@ -510,8 +517,11 @@ class StorageHandlerActor(mo.Actor):
         from .transfer import SenderManagerActor
 
         logger.debug("Begin to fetch %s from band %s", data_keys, remote_band)
+        remote_band_name = remote_band[1]
+        if remote_band_name.startswith("numa-"):
+            remote_band_name = "numa-0"
         sender_ref: mo.ActorRefType[SenderManagerActor] = await mo.actor_ref(
-            address=remote_band[0], uid=SenderManagerActor.gen_uid(remote_band[1])
+            address=remote_band[0], uid=SenderManagerActor.gen_uid(remote_band_name)
         )
         await sender_ref.send_batch_data(
             session_id,
@@ -551,7 +561,7 @@ class StorageHandlerActor(mo.Actor):
         for data_key, info in zip(data_keys, data_infos):
             # for gpu bands, need transfer between gpu cards
             if info is not None:
-                if band_name and band_name != info.band:
+                if band_name and not _is_same_storage_band(band_name, info.band):
                     missing_keys.append(data_key)
                 else:
                     pin_delays.append(
@@ -688,6 +698,45 @@ class StorageHandlerActor(mo.Actor):
             for level in levels:
                 await self.notify_spillable_space(level)
 
+    async def persist(
+        self,
+        session_id: str,
+        data_keys: List[str],
+        level: Optional[StorageLevel],
+        priority: int = 1,
+        error: str = "raise",
+    ):
+        from .spill import move_data
+
+        if level is None:
+            # only change priorities
+            await self._data_manager_ref.set_priority(
+                session_id, data_keys, self._band_name, priority, error
+            )
+            return
+        if level not in self._clients:
+            raise ValueError(f"No storage backend is configured for {level}")
+        infos_list = await self._data_manager_ref.get_data_infos.batch(
+            *[
+                self._data_manager_ref.get_data_infos.delay(
+                    session_id, data_key, self._band_name, error
+                )
+                for data_key in data_keys
+            ]
+        )
+        for data_key, infos in zip(data_keys, infos_list):
+            if not infos or any(info.level == level for info in infos):
+                continue
+            info = sorted(infos, key=lambda x: x.level)[0]
+            if info.level < level:
+                # move data to the lower level like disk to release memory
+                await move_data(
+                    session_id, data_key, info.store_size, info.level, level, self
+                )
+        await self._data_manager_ref.set_priority(
+            session_id, data_keys, self._band_name, priority, error
+        )
+
     async def get_storage_level_info(self, level: StorageLevel) -> StorageInfo:
         quota_ref = self._quota_refs[level]
         total_size, used_size = await quota_ref.get_quota()
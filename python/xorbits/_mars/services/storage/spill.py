@@ -56,15 +56,24 @@ class FIFOStrategy(SpillStrategy):
         self._data_sizes = dict()
         self._pinned_keys = defaultdict(int)
         self._spilling_keys = set()
+        # keys with lower priorities are spilled first
+        self._priorities = dict()
 
     def record_put_info(self, key, data_size: int):
         self._data_sizes[key] = data_size
 
     def record_delete_info(self, key):
         self._data_sizes.pop(key, None)
+        self._priorities.pop(key, None)
         if key in self._spilling_keys:
             self._spilling_keys.remove(key)
 
+    def set_priority(self, key, priority: int):
+        if priority:
+            self._priorities[key] = priority
+        else:
+            self._priorities.pop(key, None)
+
     def pin_data(self, key):
         self._pinned_keys[key] += 1
 
@@ -89,7 +98,11 @@ class FIFOStrategy(SpillStrategy):
         spill_sizes = []
         spill_keys = []
         spill_size = 0
-        for data_key, data_size in self._data_sizes.items():
+        items = self._data_sizes.items()
+        if self._priorities:
+            # sort is stable, thus keys with same priority are still FIFO
+            items = sorted(items, key=lambda it: self._priorities.get(it[0], 0))
+        for data_key, data_size in items:
             if spill_size >= size:
                 break
             if data_key in self._pinned_keys:
@@ -162,6 +175,42 @@ class SpillManagerActor(mo.StatelessActor):
             return size
 
 
+async def move_data(
+    session_id: str,
+    data_key,
+    size: int,
+    level: StorageLevel,
+    target_level: StorageLevel,
+    storage_handler: mo.ActorRefType[StorageHandlerActor],
+    block_size=None,
+):
+    """
+    Copy data into target level block by block, then delete it from level.
+    """
+    block_size = block_size or DEFAULT_SPILL_BLOCK_SIZE
+    reader = await storage_handler.open_reader(session_id, data_key)
+    writer = await storage_handler.open_writer(
+        session_id, data_key, size, target_level
+    )
+    async with reader:
+        async with writer:
+            while True:
+                block_data = await reader.read(block_size)
+                if not block_data:
+                    break
+                else:
+                    await writer.write(block_data)
+    try:
+        await storage_handler.delete_object(
+            session_id, data_key, size, reader.object_id, level
+        )
+    except KeyError:  # pragma: no cover
+        # workaround for the case that the object
+        # has been deleted during spill
+        logger.debug("Data %s %s is deleted during spill", session_id, data_key)
+        await storage_handler.delete(session_id, data_key, error="ignore")
+
+
 async def spill(
     request_size: int,
     level: StorageLevel,
@@ -188,23 +237,7 @@ async def spill(
     )
 
     for (session_id, key), size in zip(spill_keys, spill_sizes):
-        reader = await storage_handler.open_reader(session_id, key)
-        writer = await storage_handler.open_writer(session_id, key, size, spill_level)
-        async with reader:
-            async with writer:
-                while True:
-                    block_data = await reader.read(block_size)
-                    if not block_data:
-                        break
-                    else:
-                        await writer.write(block_data)
-        try:
-            await storage_handler.delete_object(
-                session_id, key, size, reader.object_id, level
-            )
-        except KeyError:  # pragma: no cover
-            # workaround for the case that the object
-            # has been deleted during spill
-            logger.debug("Data %s %s is deleted during spill", session_id, key)
-            await storage_handler.delete(session_id, key, error="ignore")
+        await move_data(
+            session_id, key, size, level, spill_level, storage_handler, block_size
+        )
     logger.debug("Spill finishes, release %s bytes of %s", sum(spill_sizes), level)
@@ -141,6 +141,45 @@ async def test_spill(create_actors):
     assert len(plasma_list) == len(memory_object_list)
 
 
+@pytest.mark.asyncio
+async def test_persist(create_actors):
+    worker_address, _, _ = create_actors
+    storage_handler = await mo.actor_ref(
+        uid=StorageHandlerActor.gen_uid("numa-0"), address=worker_address
+    )
+
+    session_id = "mock_session"
+    data_list = []
+    key_list = []
+    for i in range(10):
+        data = np.random.randint(0, 10000, (8000,), np.int16)
+        key = f"mock_key_{i}"
+        await storage_handler.put(session_id, key, data, StorageLevel.MEMORY)
+        data_list.append(data)
+        key_list.append(key)
+        if i == 0:
+            # persisted data is spilled after other data
+            await storage_handler.persist(session_id, [key], StorageLevel.MEMORY)
+        elif i == 1:
+            # move data to disk
+            await storage_handler.persist(session_id, [key], StorageLevel.DISK)
+            assert (session_id, key) in await storage_handler.list(StorageLevel.DISK)
+            assert (session_id, key) not in await storage_handler.list(
+                StorageLevel.MEMORY
+            )
+
+    memory_object_list = await storage_handler.list(StorageLevel.MEMORY)
+    assert (session_id, key_list[0]) in memory_object_list
+    assert (session_id, key_list[1]) not in memory_object_list
+
+    for key, data in zip(key_list, data_list):
+        get_data = await storage_handler.get(session_id, key)
+        np.testing.assert_array_equal(data, get_data)
+
+    with pytest.raises(ValueError):
+        await storage_handler.persist(session_id, [key_list[0]], StorageLevel.GPU)
+
+
 @pytest.mark.asyncio
 async def test_disk_info(create_actors):
     worker_address, _, _ = create_actors
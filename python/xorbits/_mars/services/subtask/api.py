@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Dict, Optional
+
 from ... import oscar as mo
 from ...lib.aio import alru_cache
 from ...oscar.backends.context import ProfilingContext
@@ -90,6 +92,26 @@ class SubtaskAPI:
         ref = await self._get_subtask_processor_ref(session_id, slot_address)
         await ref.set_running_op_progress(op_key, progress)
 
+    async def get_result_cache_stats(self) -> Optional[Dict]:
+        """
+        Get statistics of result cache in current worker, including
+        hits, misses and hit rate.
+
+        Returns
+        -------
+        stats : dict or None
+            statistics of result cache, None if result cache not enabled
+        """
+        from .worker.cache import ResultCacheActor
+
+        try:
+            ref = await mo.actor_ref(
+                ResultCacheActor.default_uid(), address=self._address
+            )
+        except mo.ActorNotExist:
+            return None
+        return await ref.get_stats()
+
 
 class MockSubtaskAPI(SubtaskAPI):
     @classmethod
@@ -179,6 +179,10 @@ class SubtaskResult(Serializable):
     status: SubtaskStatus = ReferenceField("status", SubtaskStatus)
     progress: float = Float64Field("progress", default=0.0)
     data_size: int = Int64Field("data_size", default=None)
+    input_data_size: int = Int64Field("input_data_size", default=None)
+    # peak increment of process memory when loading inputs and executing
+    peak_memory_size: int = Int64Field("peak_memory_size", default=None)
+    shuffle_data_size: int = Int64Field("shuffle_data_size", default=None)
     bands: List[BandType] = ListField("band", FieldTypes.tuple, default=None)
     error = AnyField("error", default=None)
     traceback = AnyField("traceback", default=None)
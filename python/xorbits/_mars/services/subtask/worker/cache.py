@@ -0,0 +1,272 @@
+# Copyright 2022-2023 XProbe Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from .... import oscar as mo
+from ....core import ChunkGraph
+from ....core.operand import Fetch, FetchShuffle
+from ....lib.filesystem import file_fingerprint
+from ....metrics import Metrics
+from ....resource import virtual_memory
+from ....utils import dataslots, parse_readable_size, tokenize
+from ...storage import StorageAPI
+from ..core import Subtask
+
+logger = logging.getLogger(__name__)
+
+# cached results are stored in a session of their own,
+# thus they survive when the session of the task is closed
+RESULT_CACHE_SESSION_ID = "__result_cache__"
+
+DEFAULT_RESULT_CACHE_CAPACITY = "10%"
+DEFAULT_RESULT_CACHE_MAX_TOKENS = 100000
+
+
+@dataslots
+@dataclass
+class ResultCacheEntry:
+    # keys of result chunks
+    chunk_keys: List[str]
+    # keys of cached data in RESULT_CACHE_SESSION_ID
+    data_keys: List[str]
+    band_name: str
+    store_size: int
+
+
+def _iter_ops(chunk_graph: ChunkGraph):
+    for chunk in chunk_graph:
+        yield chunk.op
+        for composed_chunk in getattr(chunk, "composed", None) or ():
+            yield composed_chunk.op
+
+
+def _get_source_fingerprint(op) -> Optional[Tuple]:
+    if getattr(op, "path", None) is not None:
+        paths, storage_options = op.path, getattr(op, "storage_options", None)
+    elif getattr(op, "filename", None) is not None:
+        paths, storage_options = op.filename, None
+    else:
+        return None
+    if not isinstance(paths, (list, tuple)):
+        paths = [paths]
+    return tuple(file_fingerprint(path, storage_options) for path in paths)
+
+
+def is_subtask_cacheable(subtask: Subtask, chunk_graph: ChunkGraph) -> bool:
+    """
+    Check if results of the subtask can be reused by later tasks.
+    Subtasks with side effects, like writing files or recording
+    states in remote objects, are excluded.
+    """
+    if subtask.virtual:
+        return False
+    return all(
+        op.cacheable
+        for op in _iter_ops(chunk_graph)
+        if not isinstance(op, (Fetch, FetchShuffle))
+    )
+
+
+def get_input_chunk_keys(chunk_graph: ChunkGraph) -> List[str]:
+    keys = []
+    for chunk in chunk_graph.iter_indep():
+        if isinstance(chunk.op, Fetch):
+            keys.append(chunk.key)
+        elif isinstance(chunk.op, FetchShuffle):
+            keys.extend(chunk.op.source_keys)
+    return keys
+
+
+def gen_result_cache_key(
+    subtask: Subtask, chunk_graph: ChunkGraph, input_tokens: List[str]
+) -> str:
+    """
+    Generate the key of subtask results. Besides the logic key of the
+    subtask and keys of result chunks, fingerprints of files read by
+    the subtask and cache keys of input subtasks are tokenized, thus
+    the key changes once any of the sources is modified.
+    """
+    fingerprints = []
+    for op in _iter_ops(chunk_graph):
+        if not op.inputs:
+            fingerprint = _get_source_fingerprint(op)
+            if fingerprint is not None:
+                fingerprints.append(fingerprint)
+    return tokenize(
+        subtask.logic_key,
+        [c.key for c in chunk_graph.result_chunks],
+        input_tokens,
+        fingerprints,
+    )
+
+
+class ResultCacheActor(mo.Actor):
+    """
+    Actor on workers recording results of subtasks which are stored
+    in the storage service, thus identical subtasks submitted by later
+    tasks can reuse them instead of executing again. Cached data are
+    spilled as others in the storage, and least recently used entries
+    are deleted when the total size exceeds the capacity.
+    """
+
+    _entries: Dict[str, ResultCacheEntry]
+    _chunk_key_to_token: Dict[str, str]
+
+    def __init__(
+        self,
+        capacity: Union[int, str] = DEFAULT_RESULT_CACHE_CAPACITY,
+        max_tokens: int = DEFAULT_RESULT_CACHE_MAX_TOKENS,
+    ):
+        capacity, is_percent = parse_readable_size(capacity)
+        if is_percent:
+            capacity = capacity * virtual_memory().total
+        self._capacity = int(capacity)
+        self._max_tokens = max_tokens
+
+        self._entries = OrderedDict()
+        self._size = 0
+        # chunk key -> cache key of the subtask producing the chunk,
+        # which is used as the token of inputs for successors
+        self._chunk_key_to_token = OrderedDict()
+        self._band_storage_apis = dict()
+
+        self._hits = 0
+        self._misses = 0
+        self._hit_count = Metrics.counter(
+            "mars.subtask.result_cache_hit_count",
+            "The count of subtasks whose results are reused from cache.",
+        )
+        self._miss_count = Metrics.counter(
+            "mars.subtask.result_cache_miss_count",
+            "The count of cacheable subtasks not found in cache.",
+        )
+        self._hit_rate = Metrics.gauge(
+            "mars.subtask.result_cache_hit_rate",
+            "The rate of cacheable subtasks whose results are reused from cache.",
+        )
+
+    async def _get_storage_api(self, band_name: str) -> StorageAPI:
+        if band_name not in self._band_storage_apis:
+            self._band_storage_apis[band_name] = await StorageAPI.create(
+                RESULT_CACHE_SESSION_ID, self.address, band_name
+            )
+        return self._band_storage_apis[band_name]
+
+    def _record_hit(self, hit: bool):
+        if hit:
+            self._hits += 1
+            self._hit_count.record(1)
+        else:
+            self._misses += 1
+            self._miss_count.record(1)
+        total = self._hits + self._misses
+        if total > 0:
+            self._hit_rate.record(self._hits / total)
+
+    def get_input_tokens(self, chunk_keys: List[str]) -> Optional[List[str]]:
+        """
+        Get tokens of input chunks, None will be returned if any
+        of the chunks is not produced by subtasks on this worker.
+        """
+        tokens = []
+        for key in chunk_keys:
+            token = self._chunk_key_to_token.get(key)
+            if token is None:
+                return None
+            tokens.append(token)
+        return tokens
+
+    def lookup(self, cache_key: str) -> Optional[ResultCacheEntry]:
+        entry = self._entries.get(cache_key)
+        self._record_hit(entry is not None)
+        if entry is not None:
+            self._entries.move_to_end(cache_key)
+        return entry
+
+    async def invalidate(self, cache_key: str):
+        """
+        Remove the entry whose data is lost, the lookup
+        is counted as a miss instead.
+        """
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:  # pragma: no cover
+            return
+        self._hits -= 1
+        self._record_hit(False)
+        self._size -= entry.store_size
+        await self._delete_data([entry])
+
+    async def put(
+        self,
+        cache_key: str,
+        chunk_keys: List[str],
+        entry: ResultCacheEntry = None,
+    ):
+        """
+        Record the cache key as the token of result chunks, and the entry
+        of cached data if the results are stored in cache.
+        """
+        for chunk_key in chunk_keys:
+            self._chunk_key_to_token[chunk_key] = cache_key
+            self._chunk_key_to_token.move_to_end(chunk_key)
+        while len(self._chunk_key_to_token) > self._max_tokens:
+            self._chunk_key_to_token.popitem(last=False)
+
+        if entry is None:
+            return
+        if cache_key in self._entries or entry.store_size > self._capacity:
+            # stored by another subtask concurrently, or too large to cache
+            await self._delete_data([entry])
+            return
+        self._entries[cache_key] = entry
+        self._size += entry.store_size
+        await self._evict()
+
+    async def _evict(self):
+        evicted = []
+        while self._size > self._capacity and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.store_size
+            evicted.append(entry)
+        if evicted:
+            logger.debug("Evict %d entries from result cache", len(evicted))
+            await self._delete_data(evicted)
+
+    async def _delete_data(self, entries: List[ResultCacheEntry]):
+        for entry in entries:
+            storage_api = await self._get_storage_api(entry.band_name)
+            await storage_api.delete.batch(
+                *(
+                    storage_api.delete.delay(data_key, error="ignore")
+                    for data_key in entry.data_keys
+                )
+            )
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    def get_stats(self) -> Dict:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "entries": len(self._entries),
+            "store_size": self._size,
+            "capacity": self._capacity,
+        }
@@ -15,6 +15,7 @@
 
 import asyncio
 import logging
+import os
 import sys
 import time
 from collections import defaultdict
@@ -25,8 +26,10 @@ from ....core import ChunkGraph, ExecutionError, OperandType, enter_mode
 from ....core.context import get_context
 from ....core.operand import Fetch, FetchShuffle, execute
 from ....lib.aio import alru_cache
+from ....lib.mkl_interface import mkl_set_num_threads
 from ....metrics import Metrics
 from ....optimization.physical import optimize
+from ....resource import process_private_rss
 from ....serialization import AioSerializer
 from ....typing import BandType, ChunkType
 from ....utils import Timer, calc_data_size, get_chunk_key_to_data_keys
@@ -38,9 +41,53 @@ from ...task import TaskAPI, task_options
 from ...task.task_info_collector import TaskInfoCollector
 from ..core import Subtask, SubtaskResult, SubtaskStatus
 from ..utils import get_mapper_data_keys, iter_input_data_keys, iter_output_data
+from .cache import (
+    RESULT_CACHE_SESSION_ID,
+    ResultCacheActor,
+    ResultCacheEntry,
+    gen_result_cache_key,
+    get_input_chunk_keys,
+    is_subtask_cacheable,
+)
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover
+    ne = None
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover
+    threadpool_limits = None
 
 logger = logging.getLogger(__name__)
 
+# number of threads currently used by kernels in the process
+_num_threads = None
+
+
+def set_num_threads(num_threads: int):
+    """
+    Set sizes of thread pools used by GIL-free kernels in current process,
+    including BLAS and OpenMP, numexpr and arrow compute, to match cpus
+    reserved for the subtask.
+    """
+    global _num_threads
+    if num_threads == _num_threads:
+        return
+    if threadpool_limits is not None:
+        threadpool_limits(limits=num_threads)
+    elif mkl_set_num_threads is not None:  # pragma: no cover
+        mkl_set_num_threads(num_threads)
+    if ne is not None:
+        ne.set_num_threads(num_threads)
+    if pa is not None:
+        pa.set_cpu_count(num_threads)
+    _num_threads = num_threads
+
 
 class ProcessorContext(dict):
     def __init__(self, *args, **kwargs):
@@ -60,6 +107,46 @@ class ProcessorContext(dict):
         return self._current_chunk
 
 
+class PeakMemorySampler:
+    """
+    Sample private resident memory of current process periodically
+    while operands are executed in threads, to get the peak increment
+    of memory during execution of a subtask.
+    """
+
+    def __init__(self, interval: float = 0.02):
+        self._interval = interval
+        self._base_rss = self._peak_rss = None
+        self._sample_task = None
+
+    def _sample(self):
+        rss = process_private_rss()
+        if rss is not None and rss > self._peak_rss:
+            self._peak_rss = rss
+
+    async def _sample_loop(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            self._sample()
+
+    def start(self):
+        self._base_rss = self._peak_rss = process_private_rss()
+        if self._base_rss is not None:
+            self._sample_task = asyncio.create_task(self._sample_loop())
+
+    def stop(self) -> Optional[int]:
+        """
+        Stop sampling and return the peak increment of memory,
+        None if memory of process cannot be sampled.
+        """
+        if self._sample_task is None:
+            return None
+        self._sample_task.cancel()
+        self._sample_task = None
+        self._sample()
+        return self._peak_rss - self._base_rss
+
+
 BASIC_META_FIELDS = ["memory_size", "store_size", "bands", "object_ref"]
 
 
@@ -142,6 +229,15 @@ class SubtaskProcessor:
     def subtask_id(self):
         return self.subtask.subtask_id
 
+    def _get_num_threads(self) -> int:
+        resource = self.subtask.required_resource
+        num_threads = int(resource.num_cpus) if resource is not None else 1
+        try:
+            num_available = len(os.sched_getaffinity(0))
+        except AttributeError:  # pragma: no cover
+            num_available = os.cpu_count()
+        return max(min(num_threads, num_available), 1)
+
     async def _load_input_data(self):
         keys, gets, accept_nones = [], [], []
         for key, is_shuffle in iter_input_data_keys(
@@ -158,6 +254,9 @@ class SubtaskProcessor:
                 self.subtask.subtask_id,
             )
             inputs = await self._storage_api.get.batch(*gets)
+            self.result.input_data_size = await asyncio.to_thread(
+                lambda: sum(calc_data_size(inp) for inp in inputs)
+            )
             self._processor_context.update(
                 {
                     key: get
@@ -172,6 +271,116 @@ class SubtaskProcessor:
             )
         return keys
 
+    @staticmethod
+    @alru_cache(cache_exceptions=False)
+    async def _get_result_cache_ref(worker_address: str):
+        try:
+            return await mo.actor_ref(
+                ResultCacheActor.default_uid(), address=worker_address
+            )
+        except mo.ActorNotExist:
+            # result cache not enabled
+            return None
+
+    async def _load_result_cache(
+        self, chunk_graph: ChunkGraph
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Generate cache key of the subtask and load cached results into
+        context if found. Returns the cache key, which is None if the
+        subtask is not cacheable, and whether the cache is hit.
+        """
+        cache_ref = await self._get_result_cache_ref(self._band[0])
+        if cache_ref is None or not is_subtask_cacheable(self.subtask, chunk_graph):
+            return None, False
+        input_tokens = await cache_ref.get_input_tokens(
+            get_input_chunk_keys(chunk_graph)
+        )
+        if input_tokens is None:
+            # inputs produced on other workers are unknown
+            return None, False
+        try:
+            cache_key = await asyncio.to_thread(
+                gen_result_cache_key, self.subtask, chunk_graph, input_tokens
+            )
+        except (OSError, ValueError, ImportError):  # pragma: no cover
+            logger.debug(
+                "Failed to fingerprint sources of subtask %s",
+                self.subtask.subtask_id,
+                exc_info=True,
+            )
+            return None, False
+
+        entry = await cache_ref.lookup(cache_key)
+        if entry is None:
+            return cache_key, False
+        storage_api = await StorageAPI.create(
+            RESULT_CACHE_SESSION_ID, self._band[0], entry.band_name
+        )
+        results = await storage_api.get.batch(
+            *(storage_api.get.delay(key, error="ignore") for key in entry.data_keys)
+        )
+        if any(result is None for result in results):
+            # cached data deleted
+            await cache_ref.invalidate(cache_key)
+            return cache_key, False
+
+        self._processor_context.update(zip(entry.chunk_keys, results))
+        for chunk in self._chunk_graph:
+            if not isinstance(chunk.op, (Fetch, FetchShuffle)):
+                self.set_op_progress(chunk.op.key, 1.0)
+        logger.debug(
+            "Reuse cached results of subtask %s, cache key: %s",
+            self.subtask.subtask_id,
+            cache_key,
+        )
+        return cache_key, True
+
+    def _get_result_cache_items(self, chunk_graph: ChunkGraph) -> Optional[Dict]:
+        cache_items = dict()
+        for key, data, is_shuffle in iter_output_data(
+            chunk_graph, self._processor_context
+        ):
+            if is_shuffle:
+                # mapper data are consumed by reducers only
+                return None
+            cache_items[key] = data
+        return cache_items
+
+    async def _put_result_cache(
+        self, cache_key: str, chunk_graph: ChunkGraph, cache_items: Optional[Dict]
+    ):
+        cache_ref = await self._get_result_cache_ref(self._band[0])
+        entry = None
+        if cache_items:
+            storage_api = await StorageAPI.create(
+                RESULT_CACHE_SESSION_ID, self._band[0], self._band[1]
+            )
+            data_keys = [f"{cache_key}_{i}" for i in range(len(cache_items))]
+            try:
+                store_infos = await storage_api.put.batch(
+                    *(
+                        storage_api.put.delay(data_key, data)
+                        for data_key, data in zip(data_keys, cache_items.values())
+                    )
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Failed to cache results of subtask %s",
+                    self.subtask.subtask_id,
+                    exc_info=True,
+                )
+            else:
+                entry = ResultCacheEntry(
+                    chunk_keys=list(cache_items),
+                    data_keys=data_keys,
+                    band_name=self._band[1],
+                    store_size=sum(info.store_size for info in store_infos),
+                )
+        await cache_ref.put(
+            cache_key, [c.key for c in chunk_graph.result_chunks], entry
+        )
+
     @staticmethod
     async def notify_task_manager_result(
         supervisor_address: str, result: SubtaskResult
@@ -447,6 +656,7 @@ class SubtaskProcessor:
         set_chunk_metas = []
         set_worker_chunk_metas = []
         result_data_size = 0
+        result_shuffle_data_size = 0
         set_meta_keys = []
         for result_chunk in chunk_graph.result_chunks:
             chunk_key = result_chunk.key
@@ -462,6 +672,7 @@ class SubtaskProcessor:
                 mapper_keys = get_mapper_data_keys(chunk_key, data_key_to_store_size)
                 store_size = sum(data_key_to_store_size[k] for k in mapper_keys)
                 memory_size = sum(data_key_to_memory_size[k] for k in mapper_keys)
+                result_shuffle_data_size += store_size
                 # Skip meta for shuffle
                 object_ref = None
             # for worker, if chunk in update_meta_chunks
@@ -526,6 +737,7 @@ class SubtaskProcessor:
                 raise
         # set result data size
         self.result.data_size = result_data_size
+        self.result.shuffle_data_size = result_shuffle_data_size
 
     @classmethod
     @alru_cache(cache_exceptions=False)
@@ -556,6 +768,7 @@ class SubtaskProcessor:
         self.result.status = SubtaskStatus.running
         input_keys = None
         unpinned = False
+        memory_sampler = None
         try:
             raw_result_chunks = list(self._chunk_graph.result_chunks)
             chunk_graph = optimize(self._chunk_graph, self._engines)
@@ -573,22 +786,44 @@ class SubtaskProcessor:
             }
 
             cost_times = defaultdict(tuple)
-            # load inputs data
-            with Timer() as timer:
-                input_keys = await self._load_input_data()
-            cost_times["load_data_time"] = (timer.start, timer.start + timer.duration)
-
-            try:
-                # execute chunk graph
-                with Timer() as timer:
-                    await self._execute_graph(chunk_graph)
-                cost_times["execute_time"] = (timer.start, timer.start + timer.duration)
-            finally:
-                # unpin inputs data
-                unpinned = True
+            if self._band[1].startswith("numa"):
+                set_num_threads(self._get_num_threads())
+
+            # reuse results of identical subtasks from result cache
+            cache_key, cache_hit = await self._load_result_cache(chunk_graph)
+            if not cache_hit:
+                memory_sampler = PeakMemorySampler()
+                memory_sampler.start()
+                # load inputs data
                 with Timer() as timer:
-                    await self._unpin_data(input_keys)
-                cost_times["unpin_time"] = (timer.start, timer.start + timer.duration)
+                    input_keys = await self._load_input_data()
+                cost_times["load_data_time"] = (
+                    timer.start,
+                    timer.start + timer.duration,
+                )
+
+                try:
+                    # execute chunk graph
+                    with Timer() as timer:
+                        await self._execute_graph(chunk_graph)
+                    cost_times["execute_time"] = (
+                        timer.start,
+                        timer.start + timer.duration,
+                    )
+                finally:
+                    self.result.peak_memory_size = memory_sampler.stop()
+                    # unpin inputs data
+                    unpinned = True
+                    with Timer() as timer:
+                        await self._unpin_data(input_keys)
+                    cost_times["unpin_time"] = (
+                        timer.start,
+                        timer.start + timer.duration,
+                    )
+
+            cache_items = None
+            if cache_key is not None and not cache_hit:
+                cache_items = self._get_result_cache_items(chunk_graph)
 
             # store results data
             with Timer() as timer:
@@ -614,6 +849,9 @@ class SubtaskProcessor:
                 )
             cost_times["store_meta_time"] = (timer.start, timer.start + timer.duration)
 
+            if cache_key is not None:
+                await self._put_result_cache(cache_key, chunk_graph, cache_items)
+
             await self._task_info_collector.collect_runtime_subtask_info(
                 self.subtask,
                 self._band,
@@ -640,6 +878,8 @@ class SubtaskProcessor:
             await self.done()
             raise
         finally:
+            if memory_sampler is not None:
+                memory_sampler.stop()
             if input_keys is not None and not unpinned:
                 await self._unpin_data(input_keys)
 
@@ -15,6 +15,11 @@
 
 from .... import oscar as mo
 from ...core import AbstractService
+from .cache import (
+    DEFAULT_RESULT_CACHE_CAPACITY,
+    DEFAULT_RESULT_CACHE_MAX_TOKENS,
+    ResultCacheActor,
+)
 from .manager import SubtaskRunnerManagerActor
 
 
@@ -26,7 +31,11 @@ class SubtaskWorkerService(AbstractService):
     ---------------------
     {
         "subtask" : {
-
+            "result_cache": {
+                "enabled": False,
+                "capacity": "10%",
+                "max_tokens": 100000
+            }
         }
     }
     """
@@ -42,7 +51,28 @@ class SubtaskWorkerService(AbstractService):
             uid=SubtaskRunnerManagerActor.default_uid(),
         )
 
+        result_cache_config = subtask_config.get("result_cache") or dict()
+        self._result_cache_enabled = result_cache_config.get("enabled", False)
+        if self._result_cache_enabled:
+            await mo.create_actor(
+                ResultCacheActor,
+                capacity=result_cache_config.get(
+                    "capacity", DEFAULT_RESULT_CACHE_CAPACITY
+                ),
+                max_tokens=result_cache_config.get(
+                    "max_tokens", DEFAULT_RESULT_CACHE_MAX_TOKENS
+                ),
+                address=self._address,
+                uid=ResultCacheActor.default_uid(),
+            )
+
     async def stop(self):
+        if self._result_cache_enabled:
+            await mo.destroy_actor(
+                mo.create_actor_ref(
+                    uid=ResultCacheActor.default_uid(), address=self._address
+                )
+            )
         await mo.destroy_actor(
             mo.create_actor_ref(
                 uid=SubtaskRunnerManagerActor.default_uid(), address=self._address
@@ -43,6 +43,7 @@ from ....task import MapReduceInfo, new_task_id
 from ....task.supervisor.manager import TaskConfigurationActor, TaskManagerActor
 from ....task.task_info_collector import TaskInfoCollectorActor
 from ... import Subtask, SubtaskResult, SubtaskStatus
+from ...worker.cache import ResultCacheActor
 from ...worker.manager import SubtaskRunnerManagerActor
 from ...worker.runner import SubtaskRunnerActor, SubtaskRunnerRef
 
@@ -303,6 +304,61 @@ async def test_subtask_op_progress(actor_pool):
     assert result.progress == 1.0
 
 
+@pytest.mark.asyncio
+async def test_subtask_result_cache(actor_pool, tmp_path):
+    pool, session_id, meta_api, storage_api, manager = actor_pool
+    cache_ref = await mo.create_actor(
+        ResultCacheActor,
+        capacity=1024**2,
+        uid=ResultCacheActor.default_uid(),
+        address=pool.external_address,
+    )
+    subtask_runner: SubtaskRunnerRef = await mo.actor_ref(
+        SubtaskRunnerActor.gen_uid("numa-0", 0), address=pool.external_address
+    )
+
+    path = str(tmp_path / "test.csv")
+    raw = pd.DataFrame({"a": np.arange(10), "b": np.random.rand(10)})
+    raw.to_csv(path, index=False)
+
+    async def run(expected):
+        df = md.read_csv(path) + 1
+        subtask = _gen_subtask(df, session_id)
+        await subtask_runner.run_subtask(subtask)
+        result = await subtask_runner.get_subtask_result()
+        assert result.status == SubtaskStatus.succeeded
+        assert result.progress == 1.0
+        result_key = subtask.chunk_graph.results[0].key
+        pd.testing.assert_frame_equal(await storage_api.get(result_key), expected)
+
+    await run(raw + 1)
+    stats = await cache_ref.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (0, 1, 1)
+
+    # identical subtask reuses cached results
+    await run(raw + 1)
+    stats = await cache_ref.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+    # modified source invalidates cached results
+    raw2 = pd.DataFrame({"a": np.arange(12), "b": np.random.rand(12)})
+    raw2.to_csv(path, index=False)
+    await run(raw2 + 1)
+    stats = await cache_ref.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+    # subtasks with side effects are not cached
+    df = md.read_csv(path)
+    subtask = _gen_subtask(
+        df.to_csv(str(tmp_path / "out.csv"), index=False), session_id
+    )
+    await subtask_runner.run_subtask(subtask)
+    result = await subtask_runner.get_subtask_result()
+    assert result.status == SubtaskStatus.succeeded
+    assert (await cache_ref.get_stats())["misses"] == 2
+
+
 def test_update_subtask_result():
     subtask_result = SubtaskResult(
         subtask_id="test_subtask_abc",
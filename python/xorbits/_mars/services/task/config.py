@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ...config import Config, is_bool, is_integer, is_list
+from ...config import Config, any_validator, is_bool, is_integer, is_list, is_null
 
 task_options = Config()
 
@@ -22,6 +22,13 @@ task_options.register_option("optimize_tileable_graph", True, validator=is_bool)
 task_options.register_option("optimize_chunk_graph", True, validator=is_bool)
 task_options.register_option("fuse_enabled", True, validator=is_bool)
 task_options.register_option("reserved_finish_tasks", 25, validator=is_integer)
+# stages with more chunks than this are split into independent regions of
+# about this size, each region is submitted once analyzed. None to disable.
+task_options.register_option(
+    "incremental_stage_chunk_limit",
+    None,
+    validator=any_validator(is_null, is_integer),
+)
 
 # worker
 task_options.register_option("runtime_engines", ["numexpr", "cupy"], validator=is_list)
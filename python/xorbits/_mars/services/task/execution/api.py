@@ -144,6 +144,8 @@ class ExecutionChunkResult:
 
 class TaskExecutor(ABC):
     name = None
+    # whether subtask graphs of different stages can be executed concurrently
+    support_concurrent_stages = False
 
     @classmethod
     @abstractmethod
@@ -56,7 +56,9 @@ def _get_n_reducers(subtask: Subtask) -> int:
 @register_executor_cls
 class MarsTaskExecutor(TaskExecutor):
     name = "mars"
+    support_concurrent_stages = True
     _stage_processors: List[TaskStageProcessor]
+    _running_stage_processors: Dict[str, TaskStageProcessor]
     _stage_tile_progresses: List[float]
     _cur_stage_processor: Optional[TaskStageProcessor]
     _meta_updated_tileables: Set[TileableType]
@@ -90,6 +92,7 @@ class MarsTaskExecutor(TaskExecutor):
         self._stage_processors = []
         self._stage_tile_progresses = []
         self._cur_stage_processor = None
+        self._running_stage_processors = dict()
         self._result_tileables_lifecycle = None
         self._subtask_decref_events = dict()
         self._meta_updated_tileables = set()
@@ -195,11 +198,15 @@ class MarsTaskExecutor(TaskExecutor):
         await self._resource_evaluator.evaluate(stage_processor)
         self._stage_processors.append(stage_processor)
         self._cur_stage_processor = stage_processor
+        self._running_stage_processors[stage_id] = stage_processor
         # get the tiled progress for current stage
         prev_progress = sum(self._stage_tile_progresses)
         curr_tile_progress = self._tile_context.get_all_progress() - prev_progress
         self._stage_tile_progresses.append(curr_tile_progress)
-        return await stage_processor.run()
+        try:
+            return await stage_processor.run()
+        finally:
+            self._running_stage_processors.pop(stage_id, None)
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         # clean-ups
@@ -249,14 +256,30 @@ class MarsTaskExecutor(TaskExecutor):
         return executor_progress
 
     async def cancel(self):
-        if self._cur_stage_processor is not None:
+        if self._running_stage_processors:
+            await asyncio.gather(
+                *(
+                    stage_processor.cancel()
+                    for stage_processor in list(self._running_stage_processors.values())
+                )
+            )
+        elif self._cur_stage_processor is not None:
             await self._cur_stage_processor.cancel()
 
-    async def set_subtask_result(self, subtask_result: SubtaskResult):
-        if self._cur_stage_processor is None or (
-            subtask_result.stage_id
-            and self._cur_stage_processor.stage_id != subtask_result.stage_id
+    def _get_stage_processor(self, stage_id: str) -> Optional[TaskStageProcessor]:
+        if not stage_id:
+            return self._cur_stage_processor
+        stage_processor = self._running_stage_processors.get(stage_id)
+        if stage_processor is None and (
+            self._cur_stage_processor is not None
+            and self._cur_stage_processor.stage_id == stage_id
         ):
+            stage_processor = self._cur_stage_processor
+        return stage_processor
+
+    async def set_subtask_result(self, subtask_result: SubtaskResult):
+        stage_processor = self._get_stage_processor(subtask_result.stage_id)
+        if stage_processor is None:
             logger.warning(
                 "Stage %s for subtask %s not exists, got stale subtask result %s which may be "
                 "speculative execution from previous stages, just ignore it.",
@@ -265,7 +288,6 @@ class MarsTaskExecutor(TaskExecutor):
                 subtask_result,
             )
             return
-        stage_processor = self._cur_stage_processor
         subtask = stage_processor.subtask_id_to_subtask[subtask_result.subtask_id]
 
         prev_result = stage_processor.subtask_results.get(subtask)
@@ -26,12 +26,25 @@ def register_resource_evaluator(evaluator_cls: Type["ResourceEvaluator"]):
     return evaluator_cls
 
 
+def _iter_chunk_ops(chunk_graph):
+    for chunk in chunk_graph:
+        yield chunk.op
+        for composed_chunk in getattr(chunk, "composed", None) or ():
+            yield composed_chunk.op
+
+
 def init_default_resource_for_subtask(subtask_graph: "SubtaskGraph"):  # noqa: F821
     for subtask in subtask_graph.iter_nodes():
         is_gpu = any(c.op.gpu for c in subtask.chunk_graph)
-        subtask.required_resource = (
-            Resource(num_gpus=1) if is_gpu else Resource(num_cpus=1)
-        )
+        if is_gpu:
+            subtask.required_resource = Resource(num_gpus=1)
+        else:
+            # operands running multi-threaded kernels may require more cpus
+            num_cpus = max(
+                (op.num_cpus or 1 for op in _iter_chunk_ops(subtask.chunk_graph)),
+                default=1,
+            )
+            subtask.required_resource = Resource(num_cpus=num_cpus)
 
 
 class ResourceEvaluator(ABC):
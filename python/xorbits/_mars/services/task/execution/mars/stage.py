@@ -24,6 +24,7 @@ from ..... import oscar as mo
 from .....core import Chunk, ChunkGraph
 from .....core.operand import Fetch, Fuse
 from .....metrics import Metrics
+from .....oscar.profiling import ProfilingData
 from .....typing import BandType, TileableType
 from .....utils import get_chunk_params
 from ....meta import MetaAPI, WorkerMetaAPI
@@ -140,6 +141,10 @@ class TaskStageProcessor:
         subtask = self.subtask_id_to_subtask[result.subtask_id]
         #  update subtask_results in `TaskProcessorActor.set_subtask_result`
         self._submitted_subtask_ids.difference_update([result.subtask_id])
+        if result.status == SubtaskStatus.succeeded and result.shuffle_data_size:
+            ProfilingData[self.task.task_id, "general"].inc(
+                "shuffle_bytes", result.shuffle_data_size
+            )
 
         all_done = len(self.subtask_results) == len(self.subtask_graph)
         error_or_cancelled = result.status in (
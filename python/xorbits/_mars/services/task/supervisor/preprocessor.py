@@ -15,9 +15,10 @@
 
 
 import asyncio
+import itertools
 import logging
 from functools import partial
-from typing import Callable, Dict, Iterable, List, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set
 
 from ....config import Config
 from ....core import ChunkGraph, ChunkGraphBuilder, TileableGraph, TileContext
@@ -208,6 +209,77 @@ class TaskPreprocessor:
                 )
             yield chunk_graph
 
+    def _get_incremental_stage_chunk_limit(self) -> Optional[int]:
+        extra_config = self._task.extra_config or dict()
+        if "incremental_stage_chunk_limit" in extra_config:
+            return extra_config["incremental_stage_chunk_limit"]
+        return getattr(self._config, "incremental_stage_chunk_limit", None)
+
+    def split_stage_chunk_graph(self, chunk_graph: ChunkGraph) -> List[ChunkGraph]:
+        """
+        Split chunk graph of a stage into regions which have no dependencies
+        between each other, thus every region can be analyzed and submitted
+        separately. Small weakly connected components are packed into one
+        region until the region reaches the chunk limit.
+
+        Returns
+        -------
+        region_graphs: list
+            Chunk graphs of regions, or the original chunk graph if
+            the stage is not large enough to split.
+        """
+        limit = self._get_incremental_stage_chunk_limit()
+        if not limit or len(chunk_graph) <= limit:
+            return [chunk_graph]
+
+        visited = set()
+        regions = []
+        region_chunks = []
+        for start in chunk_graph:
+            if start in visited:
+                continue
+            visited.add(start)
+            component = [start]
+            i = 0
+            while i < len(component):
+                chunk = component[i]
+                i += 1
+                for neighbor in itertools.chain(
+                    chunk_graph.iter_successors(chunk),
+                    chunk_graph.iter_predecessors(chunk),
+                ):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        component.append(neighbor)
+            region_chunks.extend(component)
+            if len(region_chunks) >= limit:
+                regions.append(region_chunks)
+                region_chunks = []
+        if region_chunks:
+            regions.append(region_chunks)
+        if len(regions) <= 1:
+            return [chunk_graph]
+
+        region_graphs = []
+        for chunks in regions:
+            chunk_set = set(chunks)
+            region_graph = ChunkGraph(
+                [c for c in chunk_graph.result_chunks if c in chunk_set]
+            )
+            for chunk in chunks:
+                region_graph.add_node(chunk)
+            for chunk in chunks:
+                for succ in chunk_graph.iter_successors(chunk):
+                    region_graph.add_edge(chunk, succ)
+            region_graphs.append(region_graph)
+        logger.debug(
+            "Split chunk graph of %s chunks into %s regions for task %s",
+            len(chunk_graph),
+            len(region_graphs),
+            self._task.task_id,
+        )
+        return region_graphs
+
     def post_chunk_graph_execution(self):  # pylint: disable=no-self-use
         """Post calling after execution of current chunk graph"""
 
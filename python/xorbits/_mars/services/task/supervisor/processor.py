@@ -21,13 +21,14 @@ import time
 from typing import Dict, Iterator, List, Optional, Set
 
 from ....core import Chunk, ChunkGraph, TileableGraph, TileContext
-from ....core.operand import Fetch
+from ....core.operand import Fetch, ShuffleFetchType
 from ....metrics import Metrics
 from ....optimization.logical import OptimizationRecords
 from ....oscar.profiling import MARS_ENABLE_PROFILING, ProfilingData
-from ....typing import ChunkType, TileableType
+from ....resource import Resource
+from ....typing import BandType, ChunkType, TileableType
 from ....utils import Timer
-from ...subtask import Subtask, SubtaskResult
+from ...subtask import Subtask, SubtaskGraph, SubtaskResult
 from ..core import MapReduceInfo, Task, TaskResult, TaskStatus, new_task_id
 from ..execution.api import ExecutionChunkResult, TaskExecutor
 from ..task_info_collector import TaskInfoCollector
@@ -222,6 +223,61 @@ class TaskProcessor:
         shuffle_fetch_type = (
             self._executor.get_execution_config().get_shuffle_fetch_type()
         )
+        if self._executor.support_concurrent_stages:
+            region_graphs = await asyncio.to_thread(
+                self._preprocessor.split_stage_chunk_graph, chunk_graph
+            )
+        else:
+            region_graphs = [chunk_graph]
+
+        tile_context = await asyncio.to_thread(
+            self._get_stage_tile_context,
+            {c for c in chunk_graph.result_chunks if not isinstance(c.op, Fetch)},
+        )
+
+        if len(region_graphs) == 1:
+            subtask_graph = await self._gen_subtask_graph(
+                stage_id,
+                stage_profiler,
+                chunk_graph,
+                available_bands,
+                fetch_op_to_bands,
+                shuffle_fetch_type,
+            )
+            with Timer() as timer:
+                chunk_to_result = await self._executor.execute_subtask_graph(
+                    stage_id, subtask_graph, chunk_graph, tile_context
+                )
+            stage_profiler.set("run", timer.duration)
+        else:
+            chunk_to_result = await self._process_stage_regions(
+                stage_id,
+                stage_profiler,
+                region_graphs,
+                tile_context,
+                available_bands,
+                fetch_op_to_bands,
+                shuffle_fetch_type,
+            )
+
+        self._preprocessor.post_chunk_graph_execution()
+        if self._preprocessor.chunk_optimization_records_list:
+            optimization_records = self._preprocessor.chunk_optimization_records_list[
+                -1
+            ]
+        else:
+            optimization_records = None
+        self._update_stage_meta(chunk_to_result, tile_context, optimization_records)
+
+    async def _gen_subtask_graph(
+        self,
+        stage_id: str,
+        stage_profiler,
+        chunk_graph: ChunkGraph,
+        available_bands: Dict[BandType, Resource],
+        fetch_op_to_bands: Dict[str, BandType],
+        shuffle_fetch_type: ShuffleFetchType,
+    ) -> SubtaskGraph:
         with Timer() as timer:
             subtask_graph = await asyncio.to_thread(
                 self._preprocessor.analyze,
@@ -253,26 +309,71 @@ class TaskProcessor:
                 "stage_id": stage_id,
             },
         )
+        return subtask_graph
 
-        tile_context = await asyncio.to_thread(
-            self._get_stage_tile_context,
-            {c for c in chunk_graph.result_chunks if not isinstance(c.op, Fetch)},
+    async def _process_stage_regions(
+        self,
+        stage_id: str,
+        stage_profiler,
+        region_graphs: List[ChunkGraph],
+        tile_context: TileContext,
+        available_bands: Dict[BandType, Resource],
+        fetch_op_to_bands: Dict[str, BandType],
+        shuffle_fetch_type: ShuffleFetchType,
+    ) -> Dict[Chunk, ExecutionChunkResult]:
+        """
+        Analyze regions of a stage one by one, and submit each of them
+        once its subtask graph is generated, thus analysis of later regions
+        overlaps execution of former ones.
+        """
+        logger.info(
+            "Execute stage %s of task %s incrementally in %s regions",
+            stage_id,
+            self._task.task_id,
+            len(region_graphs),
         )
-
+        run_tasks = []
         with Timer() as timer:
-            chunk_to_result = await self._executor.execute_subtask_graph(
-                stage_id, subtask_graph, chunk_graph, tile_context
-            )
+            try:
+                for i, region_graph in enumerate(region_graphs):
+                    region_stage_id = new_task_id()
+                    region_profiler = stage_profiler.nest(f"region_{i}")
+                    subtask_graph = await self._gen_subtask_graph(
+                        region_stage_id,
+                        region_profiler,
+                        region_graph,
+                        available_bands,
+                        fetch_op_to_bands,
+                        shuffle_fetch_type,
+                    )
+                    region_results = set(region_graph.result_chunks)
+                    region_tile_context = TileContext(
+                        (tileable, tiled)
+                        for tileable, tiled in tile_context.items()
+                        if all(c.data in region_results for c in tiled.chunks)
+                    )
+                    run_tasks.append(
+                        asyncio.create_task(
+                            self._executor.execute_subtask_graph(
+                                region_stage_id,
+                                subtask_graph,
+                                region_graph,
+                                region_tile_context,
+                            )
+                        )
+                    )
+                results = await asyncio.gather(*run_tasks)
+            except BaseException:
+                for run_task in run_tasks:
+                    run_task.cancel()
+                await self._executor.cancel()
+                raise
         stage_profiler.set("run", timer.duration)
 
-        self._preprocessor.post_chunk_graph_execution()
-        if self._preprocessor.chunk_optimization_records_list:
-            optimization_records = self._preprocessor.chunk_optimization_records_list[
-                -1
-            ]
-        else:
-            optimization_records = None
-        self._update_stage_meta(chunk_to_result, tile_context, optimization_records)
+        chunk_to_result = dict()
+        for result in results:
+            chunk_to_result.update(result)
+        return chunk_to_result
 
     def _get_stage_tile_context(self, result_chunks: Set[Chunk]) -> TileContext:
         collected = self._stage_tileables
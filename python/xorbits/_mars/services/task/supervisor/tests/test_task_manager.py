@@ -186,6 +186,60 @@ async def test_run_task(actor_pool):
     ) == [1] * len(result_tileable.chunks)
 
 
+@pytest.mark.asyncio
+async def test_run_task_incrementally(actor_pool):
+    (
+        execution_backend,
+        pool,
+        session_id,
+        meta_api,
+        lifecycle_api,
+        storage_api,
+        manager,
+    ) = actor_pool
+
+    raw = np.random.RandomState(0).rand(10, 10)
+    a = mt.tensor(raw, chunk_size=2)
+    b = (a + 1) * 2
+
+    graph = TileableGraph([b.data])
+    next(TileableGraphBuilder(graph).build())
+
+    task_id = await manager.submit_tileable_graph(
+        graph,
+        fuse_enabled=False,
+        extra_config={
+            "incremental_stage_chunk_limit": 10,
+            "enable_profiling": {"slow_calls_duration_threshold": 0},
+        },
+    )
+    await manager.wait_task(task_id)
+    task_result: TaskResult = await manager.get_task_result(task_id)
+
+    assert task_result.status == TaskStatus.terminated
+    if task_result.error is not None:
+        raise task_result.error.with_traceback(task_result.traceback)
+    assert await manager.get_task_progress(task_id) == 1.0
+
+    # 75 chunks are split into regions of 10 chunks at least
+    general = task_result.profiling["supervisor"]["general"]
+    [stage_profiling] = [v for k, v in general.items() if k.startswith("stage_")]
+    assert len([k for k in stage_profiling if k.startswith("region_")]) == 7
+
+    result_tileable = (await manager.get_task_result_tileables(task_id))[0]
+    assert result_tileable.shape == raw.shape
+    result = await _merge_data(
+        execution_backend, result_tileable, meta_api, storage_api
+    )
+    np.testing.assert_array_equal(result, (raw + 1) * 2)
+
+    assert (
+        await lifecycle_api.get_chunk_ref_counts(
+            [c.key for c in result_tileable.chunks]
+        )
+    ) == [1] * len(result_tileable.chunks)
+
+
 @pytest.mark.asyncio
 @pytest.mark.ray_dag
 async def test_run_tasks_with_same_name(actor_pool):
@@ -393,21 +447,22 @@ async def test_prune_in_iterative_tiling(actor_pool):
     subtask_graphs = await manager.get_subtask_graphs(task_id)
     assert len(subtask_graphs) == 2
 
-    # the first subtask graph should have only 2 subtasks after pruning
-    assert len(subtask_graphs[0]) == 2
+    # the first subtask graph runs map stage of all chunks,
+    # only 5 subtasks after pruning
+    assert len(subtask_graphs[0]) == 5
     nodes = [
         n
         for st in subtask_graphs[0]
         for n in st.chunk_graph
         if not isinstance(n.op, Fetch)
     ]
-    assert len(nodes) == 8
+    assert len(nodes) == 20
     result_nodes = [n for st in subtask_graphs[0] for n in st.chunk_graph.results]
-    assert len(result_nodes) == 4
+    assert len(result_nodes) == 10
     assert all("GroupByAgg" in str(n.op) for n in result_nodes)
 
     # second subtask graph
-    assert len(subtask_graphs[1]) == 6
+    assert len(subtask_graphs[1]) == 4
     all_nodes = nodes + [
         n
         for st in subtask_graphs[1]
@@ -13,12 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .deploy.oscar.session import execute, fetch, fetch_log, new_session, stop_server
+from .deploy.oscar.session import (
+    execute,
+    fetch,
+    fetch_log,
+    new_session,
+    persist,
+    stop_server,
+    unpersist,
+)
 
 __all__ = [
     "new_session",
     "execute",
     "fetch",
     "fetch_log",
+    "persist",
+    "unpersist",
     "stop_server",
 ]
@@ -41,6 +41,10 @@ class TensorTileDBDataSource(TensorNoInput):
     _tiledb_timestamp = Int64Field("tiledb_timestamp")
     _axis_offsets = TupleField("axis_offsets", FieldTypes.int64)
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(
         self,
         tiledb_config=None,
@@ -52,6 +52,10 @@ class TensorFromVineyard(TensorNoInput):
     # a dummy attr to make sure ops have different keys
     operator_index = Int32Field("operator_index")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, object_id=None, **kw):
         super().__init__(vineyard_socket=vineyard_socket, object_id=object_id, **kw)
 
@@ -117,6 +121,10 @@ class TensorFromVineyardChunk(TensorOperand, TensorOperandMixin):
     # ObjectID of chunk in vineyard
     object_id = StringField("object_id")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, vineyard_socket=None, object_id=None, **kw):
         super().__init__(vineyard_socket=vineyard_socket, object_id=object_id, **kw)
 
@@ -17,6 +17,10 @@ from ..operands import TensorHasInput, TensorOperandMixin
 
 
 class TensorDataStore(TensorHasInput, TensorOperandMixin):
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def _set_inputs(self, inputs):
         super()._set_inputs(inputs)
         self._input = inputs[0]
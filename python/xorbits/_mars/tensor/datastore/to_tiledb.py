@@ -197,6 +197,10 @@ class TensorTileDBConsolidate(TensorOperandMixin, TensorOperand):
     # encryption key to decrypt if provided
     _tiledb_key = StringField("tiledb_key")
 
+    @property
+    def cacheable(self) -> bool:
+        return False
+
     def __init__(self, tiledb_config=None, tiledb_uri=None, tiledb_key=None, **kw):
         super().__init__(
             _tiledb_config=tiledb_config,
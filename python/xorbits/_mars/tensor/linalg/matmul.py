@@ -20,12 +20,12 @@ import numpy as np
 from ... import opcodes as OperandDef
 from ...serialization.serializables import KeyField, StringField
 from ...utils import has_unknown_shape
-from ..arithmetic.utils import chunk_tree_add
 from ..array_utils import as_same_device, device, is_sparse_module
 from ..core import Tensor, TensorOrder
 from ..datasource import tensor as astensor
 from ..operands import TensorOperand, TensorOperandMixin
 from ..utils import broadcast_shape, check_order, check_out_param, unify_chunks
+from .tensordot import TensorTensorDot, gen_contraction_chunk, is_gram_operands
 
 
 class TensorMatmul(TensorOperand, TensorOperandMixin):
@@ -134,6 +134,16 @@ class TensorMatmul(TensorOperand, TensorOperandMixin):
         b_axes = list(range(b.ndim - 2))[::-1] + [tensor.ndim - 1, tensor.ndim]
         if has_unknown_shape(a, b):
             yield
+        if is_gram_operands(a, b):
+            out_chunks, nsplits = TensorTensorDot.tile_gram(op, b)
+            new_op = op.copy()
+            return new_op.new_tensors(
+                [a, b],
+                tensor.shape,
+                order=tensor.order,
+                chunks=out_chunks,
+                nsplits=nsplits,
+            )
         a, b = yield from unify_chunks((a, a_axes), (b, b_axes))
 
         get_nsplit = lambda i: a.nsplits[i] if a.nsplits[i] != (1,) else b.nsplits[i]
@@ -149,7 +159,7 @@ class TensorMatmul(TensorOperand, TensorOperandMixin):
 
         out_chunks = []
         for out_idx in itertools.product(*out_idxes):
-            chunks = []
+            chunk_pairs = []
             get_s = lambda x, idx: x[idx] if x != (1,) else x[0]
             shape = tuple(
                 max(get_s(a_s, j), get_s(b_s, j))
@@ -163,26 +173,17 @@ class TensorMatmul(TensorOperand, TensorOperandMixin):
                     b, out_idx[: b.ndim - 2] + (contract_idx,) + out_idx[-1:]
                 )
                 b_chunk = b.cix[b_idx]
-                chunk_op = op.copy().reset_key()
-                c = chunk_op.new_chunk(
-                    [a_chunk, b_chunk], shape=shape, order=tensor.order
-                )
-                chunks.append(c)
-
-            if len(chunks) == 1:
-                c = chunks[0]
-                out_chunk_op = c.op.copy()
-                out_chunk = out_chunk_op.new_chunk(
-                    out_chunk_op.inputs,
-                    shape=c.shape,
-                    index=out_idx,
-                    order=tensor.order,
-                )
-            else:
-                out_chunk = chunk_tree_add(
-                    tensor.op.dtype, chunks, out_idx, shape, sparse=tensor.op.sparse
-                )
-
+                chunk_pairs.append((a_chunk, b_chunk))
+
+            out_chunk = gen_contraction_chunk(
+                op,
+                chunk_pairs,
+                shape,
+                out_idx,
+                tensor.order,
+                sparse=tensor.op.sparse,
+                group=not (tensor.op.sparse or a.issparse() or b.issparse()),
+            )
             out_chunks.append(out_chunk)
 
         nsplits = tuple(get_nsplit(i) for i in range(a.ndim - 2)) + (
@@ -196,24 +197,32 @@ class TensorMatmul(TensorOperand, TensorOperandMixin):
 
     @classmethod
     def execute(cls, ctx, op):
-        (a, b), device_id, xp = as_same_device(
+        inputs, device_id, xp = as_same_device(
             [ctx[c.key] for c in op.inputs], device=op.device, ret_extra=True
         )
 
         with device(device_id):
             if not op.sparse and is_sparse_module(xp):
                 # tell sparse to do calculation on numpy or cupy matmul
+                a, b = inputs
                 ctx[op.outputs[0].key] = xp.matmul(a, b, sparse=False)
-            else:
+                return
+
+            ret = None
+            for a, b in zip(inputs[::2], inputs[1::2]):
                 try:
                     # `np.matmul` support `order` argument in version 1.16
-                    ctx[op.outputs[0].key] = xp.matmul(
-                        a, b, casting=op.casting, order=op.order
-                    )
+                    r = xp.matmul(a, b, casting=op.casting, order=op.order)
                 except TypeError:  # pragma: no cover
-                    ctx[op.outputs[0].key] = xp.matmul(a, b).astype(
+                    r = xp.matmul(a, b).astype(
                         dtype=op.dtype, casting=op.casting, order=op.order
                     )
+                if ret is None:
+                    ret = r
+                else:
+                    # accumulate partial products in place
+                    ret += r
+            ctx[op.outputs[0].key] = ret
 
 
 def matmul(a, b, sparse=None, out=None, **kw):
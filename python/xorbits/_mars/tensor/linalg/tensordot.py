@@ -15,18 +15,99 @@
 
 import itertools
 from collections.abc import Iterable
+from typing import List, Sequence, Tuple
 
 import numpy as np
 
 from ... import opcodes as OperandDef
-from ...serialization.serializables import FieldTypes, KeyField, TupleField
+from ...config import options
+from ...serialization.serializables import BoolField, FieldTypes, KeyField, TupleField
+from ...typing import ChunkType, TileableType
 from ...utils import has_unknown_shape
 from ..arithmetic.utils import chunk_tree_add
 from ..array_utils import as_same_device, device, is_sparse_module
+from ..base.transpose import TensorTranspose
 from ..core import TensorOrder
 from ..datasource import tensor as astensor
 from ..operands import TensorOperand, TensorOperandMixin
-from ..utils import unify_chunks
+from ..utils import reverse_order, unify_chunks
+
+
+def group_contraction_chunks(
+    chunk_pairs: Sequence[Tuple[ChunkType, ...]]
+) -> List[List[Tuple[ChunkType, ...]]]:
+    """
+    Group chunks to contract for an output chunk, thus partial products
+    in a group are accumulated in place within one subtask instead of
+    being stored and transferred before being added. Each group contains
+    at most ``options.combine_size`` pairs, and total size of its input
+    chunks is limited by ``options.chunk_store_limit * options.combine_size``.
+    """
+    max_pairs = options.combine_size
+    max_nbytes = options.chunk_store_limit * options.combine_size
+    groups, group, group_nbytes = [], [], 0
+    for pair in chunk_pairs:
+        # dtypes of some chunks are unknown, assume as float64
+        pair_nbytes = sum(
+            np.prod(c.shape) * (c.dtype.itemsize if c.dtype is not None else 8)
+            for c in pair
+        )
+        if group and (
+            len(group) >= max_pairs or group_nbytes + pair_nbytes > max_nbytes
+        ):
+            groups.append(group)
+            group, group_nbytes = [], 0
+        group.append(pair)
+        group_nbytes += pair_nbytes
+    if group:
+        groups.append(group)
+    return groups
+
+
+def gen_contraction_chunk(
+    op, chunk_pairs, shape, index, order, sparse=False, group=True, **kw
+) -> ChunkType:
+    """
+    Generate the output chunk of contraction. Chunk pairs are grouped
+    if ``group`` is True and contracted by copies of ``op``, whose results
+    are added by a tree if there are more than one group. Fields of the
+    copies are set by ``kw``.
+    """
+    if group:
+        groups = group_contraction_chunks(chunk_pairs)
+    else:
+        groups = [[pair] for pair in chunk_pairs]
+    chunks = []
+    for group in groups:
+        chunk_op = op.copy().reset_key()
+        for attr, value in kw.items():
+            setattr(chunk_op, attr, value)
+        chunks.append(
+            chunk_op.new_chunk(
+                list(itertools.chain.from_iterable(group)),
+                shape=shape,
+                order=order,
+            )
+        )
+    if len(chunks) == 1:
+        c = chunks[0]
+        chunk_op = c.op.copy()
+        return chunk_op.new_chunk(c.inputs, shape=shape, index=index, order=order)
+    return chunk_tree_add(op.dtype, chunks, index, shape, sparse=sparse)
+
+
+def is_gram_operands(a: TileableType, b: TileableType) -> bool:
+    """
+    Check if ``a`` is the transpose of 2-d dense tensor ``b``,
+    whose product ``a @ b`` is the Gram matrix of ``b``.
+    """
+    return (
+        a.ndim == b.ndim == 2
+        and isinstance(a.op, TensorTranspose)
+        and (a.op.axes is None or list(a.op.axes) == [1, 0])
+        and a.inputs[0].key == b.key
+        and not b.issparse()
+    )
 
 
 class TensorTensorDot(TensorOperand, TensorOperandMixin):
@@ -36,9 +117,21 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
     _b = KeyField("b")
     _a_axes = TupleField("a_axes", FieldTypes.int32)
     _b_axes = TupleField("b_axes", FieldTypes.int32)
+    # each input is a chunk x of X, and x.T is contracted with x
+    _symmetric = BoolField("symmetric")
+    # the first input of each pair is transposed before contraction
+    _transpose_a = BoolField("transpose_a")
 
-    def __init__(self, a_axes=None, b_axes=None, **kw):
-        super().__init__(_a_axes=a_axes, _b_axes=b_axes, **kw)
+    def __init__(
+        self, a_axes=None, b_axes=None, symmetric=None, transpose_a=None, **kw
+    ):
+        super().__init__(
+            _a_axes=a_axes,
+            _b_axes=b_axes,
+            _symmetric=symmetric,
+            _transpose_a=transpose_a,
+            **kw,
+        )
 
     @property
     def a(self):
@@ -56,10 +149,19 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
     def b_axes(self):
         return self._b_axes
 
+    @property
+    def symmetric(self):
+        return self._symmetric
+
+    @property
+    def transpose_a(self):
+        return self._transpose_a
+
     def _set_inputs(self, inputs):
         super()._set_inputs(inputs)
         self._a = self._inputs[0]
-        self._b = self._inputs[1]
+        if len(self._inputs) > 1:
+            self._b = self._inputs[1]
 
     def __call__(self, a, b):
         shape = tuple(
@@ -83,6 +185,52 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
 
         ctx[chunk.key] = (chunk.nbytes, calc_usage)
 
+    @classmethod
+    def tile_gram(cls, op, x: TileableType):
+        """
+        Tile Gram matrix ``X.T @ X`` of 2-d tensor ``X``. Chunks of ``X``
+        are contracted with themselves without transposing them, and
+        blocks below the diagonal are transposed from those above,
+        as the result is symmetric.
+        """
+        out = op.outputs[0]
+        col_nsplits = x.nsplits[1]
+        n_row_chunks = len(x.nsplits[0])
+        gram_op = TensorTensorDot(
+            a_axes=(1,), b_axes=(0,), dtype=out.dtype, sparse=False, gpu=op.gpu
+        )
+        out_chunks = []
+        upper_chunks = dict()
+        for i, j in itertools.product(range(len(col_nsplits)), repeat=2):
+            shape = (col_nsplits[i], col_nsplits[j])
+            if i > j:
+                upper = upper_chunks[j, i]
+                transpose_op = TensorTranspose(axes=[1, 0], dtype=out.dtype)
+                out_chunks.append(
+                    transpose_op.new_chunk(
+                        [upper],
+                        shape=shape,
+                        index=(i, j),
+                        order=reverse_order(upper.order),
+                    )
+                )
+                continue
+            if i == j:
+                chunk_pairs = [(x.cix[k, i],) for k in range(n_row_chunks)]
+            else:
+                chunk_pairs = [(x.cix[k, i], x.cix[k, j]) for k in range(n_row_chunks)]
+            chunk = upper_chunks[i, j] = gen_contraction_chunk(
+                gram_op,
+                chunk_pairs,
+                shape,
+                (i, j),
+                out.order,
+                _symmetric=i == j,
+                _transpose_a=i != j,
+            )
+            out_chunks.append(chunk)
+        return out_chunks, (col_nsplits, col_nsplits)
+
     @classmethod
     def tile(cls, op):
         a, b, a_axes, b_axes = op.a, op.b, op.a_axes, op.b_axes
@@ -92,6 +240,12 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
         b_ax = tuple(b_axes.index(i) if i in b_axes else next(c) for i in range(b.ndim))
         if has_unknown_shape(*op.inputs):
             yield
+        if a_axes == (1,) and b_axes == (0,) and is_gram_operands(a, b):
+            out_chunks, nsplits = cls.tile_gram(op, b)
+            new_op = op.copy()
+            return new_op.new_tensors(
+                [a, b], op.outputs[0].shape, chunks=out_chunks, nsplits=nsplits
+            )
         a, b = yield from unify_chunks((a, a_ax), (b, b_ax))
         out = op.outputs[0]
 
@@ -119,7 +273,7 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
                 tensor_shape.append(t.nsplits[axis][idx])
             tensor_shape = tuple(tensor_shape)
 
-            tensordot_chunks = []
+            chunk_pairs = []
             for contract_indexes in itertools.product(
                 *[range(len(a.nsplits[ax])) for ax in a_axes]
             ):
@@ -128,25 +282,18 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
                     a_indices[a_axis] = contract_index
                 for b_axis, contract_index in zip(b_axes, contract_indexes):
                     b_indices[b_axis] = contract_index
-
-                tensordot_chunk_op = op.copy().reset_key()
-                tensordot_chunk = tensordot_chunk_op.new_chunk(
-                    [a.cix[tuple(a_indices)], b.cix[tuple(b_indices)]],
-                    shape=tensor_shape,
-                    order=out.order,
-                )
-                tensordot_chunks.append(tensordot_chunk)
-
-            if len(tensordot_chunks) == 1:
-                c = tensordot_chunks[0]
-                chunk_op = c.op.copy()
-                chunk = chunk_op.new_chunk(
-                    c.inputs, shape=c.shape, index=out_idx, order=out.order
-                )
-            else:
-                chunk = chunk_tree_add(
-                    op.dtype, tensordot_chunks, out_idx, tensor_shape, sparse=op.sparse
-                )
+                chunk_pairs.append((a.cix[tuple(a_indices)], b.cix[tuple(b_indices)]))
+
+            chunk = gen_contraction_chunk(
+                op,
+                chunk_pairs,
+                tensor_shape,
+                out_idx,
+                out.order,
+                sparse=op.sparse,
+                # partial products of sparse tensors are not accumulated in place
+                group=not (op.sparse or a.issparse() or b.issparse()),
+            )
             out_chunks.append(chunk)
 
         get_nsplits = lambda t_idx, i: (a, b)[t_idx].nsplits[i]
@@ -156,17 +303,30 @@ class TensorTensorDot(TensorOperand, TensorOperandMixin):
 
     @classmethod
     def execute(cls, ctx, op):
-        (a, b), device_id, xp = as_same_device(
+        inputs, device_id, xp = as_same_device(
             [ctx[c.key] for c in op.inputs], device=op.device, ret_extra=True
         )
+        if op.symmetric:
+            pairs = [(x.T, x) for x in inputs]
+        else:
+            pairs = list(zip(inputs[::2], inputs[1::2]))
+            if op.transpose_a:
+                pairs = [(a.T, b) for a, b in pairs]
 
         axes = op.a_axes, op.b_axes
         with device(device_id):
             if not op.sparse and is_sparse_module(xp):
                 # tell sparse to do calculation on numpy or cupy dot
+                ((a, b),) = pairs
                 ctx[op.outputs[0].key] = xp.tensordot(a, b, axes, sparse=False)
             else:
-                ret = xp.tensordot(a, b, axes)
+                ret = None
+                for a, b in pairs:
+                    if ret is None:
+                        ret = xp.tensordot(a, b, axes)
+                    else:
+                        # accumulate partial products in place
+                        ret += xp.tensordot(a, b, axes)
                 out = op.outputs[0]
                 ctx[out.key] = ret.astype(ret.dtype, order=out.order.value, copy=False)
 
@@ -18,6 +18,7 @@ import pytest
 import scipy.sparse as sps
 
 from .... import tensor as mt
+from ....config import option_context
 from ....core import tile
 from ... import dot, empty, ones, tensor
 from ...core import SparseTensor, Tensor
@@ -410,6 +411,66 @@ def test_tensordot():
     assert c.shape == tuple(sum(s) for s in c.nsplits)
 
 
+def test_grouped_contraction():
+    from ...arithmetic.add import TensorTreeAdd
+    from .. import tensordot
+    from ..tensordot import TensorTensorDot
+
+    # partial products of 8 contraction chunks are accumulated in 2 groups
+    a = ones((4, 16), chunk_size=2)
+    b = ones((16, 4), chunk_size=2)
+    with option_context({"combine_size": 4}):
+        for c in (tile(tensordot(a, b, 1)), tile(matmul(a, b))):
+            assert len(c.chunks) == 4
+            for chunk in c.chunks:
+                assert isinstance(chunk.op, TensorTreeAdd)
+                assert len(chunk.inputs) == 2
+                assert all(len(inp.inputs) == 8 for inp in chunk.inputs)
+
+        # groups are limited by sizes of input chunks
+        with option_context({"chunk_store_limit": 32}):
+            c = tile(tensordot(a, b, 1))
+            for chunk in c.chunks:
+                assert len(chunk.inputs) == 4
+                assert all(len(inp.inputs) == 4 for inp in chunk.inputs)
+
+    # sparse chunks are not grouped
+    a = tensor(np.eye(4), chunk_size=2).tosparse()
+    c = tile(a.dot(a))
+    assert all(
+        len(inp.inputs) == 2 and isinstance(inp.op, TensorTensorDot)
+        for chunk in c.chunks
+        for inp in chunk.inputs
+    )
+
+
+def test_gram_matrix():
+    from ...base.transpose import TensorTranspose
+    from ..tensordot import TensorTensorDot
+
+    x = ones((20, 6), chunk_size=(10, 3))
+    for gram in (x.T @ x, x.T.dot(x), dot(x.T, x)):
+        gram = tile(gram)
+        assert gram.nsplits == ((3, 3), (3, 3))
+        assert len(gram.chunks) == 4
+        diag = gram.cix[0, 0]
+        assert isinstance(diag.op, TensorTensorDot)
+        assert diag.op.symmetric
+        # chunks of x are contracted without transposing
+        assert [inp.key for inp in diag.inputs] == [c.key for c in tile(x).cix[:, 0]]
+        upper = gram.cix[0, 1]
+        assert upper.op.transpose_a
+        assert len(upper.inputs) == 4
+        lower = gram.cix[1, 0]
+        assert isinstance(lower.op, TensorTranspose)
+        assert lower.inputs[0].key == upper.key
+
+    # not a gram matrix
+    y = x + 1
+    c = tile(x.T @ y)
+    assert not any(isinstance(chunk.op, TensorTranspose) for chunk in c.chunks)
+
+
 def test_dot():
     t1 = tensor([[0, 1, 0], [1, 0, 0]], chunk_size=2).tosparse()
     t2 = t1.T
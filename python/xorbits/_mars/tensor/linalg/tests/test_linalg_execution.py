@@ -903,6 +903,24 @@ def test_vdot_execution(setup):
     np.testing.assert_equal(res, expected)
 
 
+def test_gram_matrix_execution(setup):
+    rs = np.random.RandomState(0)
+    data = rs.randn(100, 7)
+    x = tensor(data, chunk_size=(9, 3))
+    expected = data.T @ data
+
+    for gram in (x.T @ x, x.T.dot(x), tensordot(x.T, x, 1)):
+        res = gram.execute().fetch()
+        np.testing.assert_allclose(res, expected)
+        # the result is symmetric
+        np.testing.assert_array_equal(res, res.T)
+
+    data = rs.randint(10, size=(30, 4))
+    x = tensor(data, chunk_size=(7, 2))
+    res = (x.T @ x).execute().fetch()
+    np.testing.assert_array_equal(res, data.T @ data)
+
+
 def test_matmul_execution(setup):
     rs = np.random.RandomState(0)
 
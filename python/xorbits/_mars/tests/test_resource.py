@@ -18,6 +18,7 @@ import os
 import tempfile
 import time
 
+import numpy as np
 import pytest
 
 from ..resource import Resource, ZeroResource
@@ -224,3 +225,56 @@ def test_resource():
     assert Resource(num_cpus=100, num_gpus=10, mem_bytes=1024) - Resource(
         num_cpus=10, num_gpus=20, mem_bytes=512
     ) == Resource(num_cpus=90, num_gpus=-10, mem_bytes=512)
+
+
+def test_numa_nodes(monkeypatch):
+    from .. import resource
+
+    with tempfile.TemporaryDirectory() as node_dir:
+        assert resource.numa_nodes(os.path.join(node_dir, "not_exist")) == []
+
+        for node_id, cpu_list, mem_kb in [
+            (0, "0-3,8", 1024),
+            (1, "4-7", 2048),
+            (2, "", 512),
+        ]:
+            os.makedirs(os.path.join(node_dir, f"node{node_id}"))
+            with open(os.path.join(node_dir, f"node{node_id}", "cpulist"), "w") as f:
+                f.write(cpu_list + "\n")
+            with open(os.path.join(node_dir, f"node{node_id}", "meminfo"), "w") as f:
+                f.write(f"Node {node_id} MemTotal:       {mem_kb} kB\n")
+                f.write(f"Node {node_id} MemFree:        {mem_kb // 2} kB\n")
+        os.makedirs(os.path.join(node_dir, "power"))
+
+        if hasattr(os, "sched_getaffinity"):
+            monkeypatch.setattr(os, "sched_getaffinity", lambda _: set(range(16)))
+        nodes = resource.numa_nodes(node_dir)
+        assert [node.node_id for node in nodes] == [0, 1]
+        assert nodes[0].cpus == [0, 1, 2, 3, 8]
+        assert nodes[0].mem_total == 1024 * 1024
+        assert nodes[1].cpus == [4, 5, 6, 7]
+        assert nodes[1].mem_total == 2048 * 1024
+
+        if hasattr(os, "sched_getaffinity"):
+            # only CPUs available to current process are counted
+            monkeypatch.setattr(os, "sched_getaffinity", lambda _: {0, 1})
+            nodes = resource.numa_nodes(node_dir)
+            assert [node.node_id for node in nodes] == [0]
+            assert nodes[0].cpus == [0, 1]
+
+
+def test_process_private_rss():
+    from .. import resource
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        assert resource.process_private_rss(os.path.join(tempdir, "not_exist")) is None
+
+        statm_file = os.path.join(tempdir, "statm")
+        with open(statm_file, "w") as f:
+            f.write("1000 300 100 10 0 500 0\n")
+        assert resource.process_private_rss(statm_file) == 200 * resource._page_size
+
+    if os.path.exists(resource.PROC_STATM_FILE):
+        rss = resource.process_private_rss()
+        data = np.ones(10 * 1024**2, dtype=np.uint8)
+        assert resource.process_private_rss() - rss >= data.nbytes // 2
@@ -13,4 +13,4 @@
 # limitations under the License.
 
 from .data import Data, DataRef, DataRefMeta, DataType
-from .execution import run
+from .execution import cache, run, uncache
@@ -26,9 +26,11 @@ from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type,
 from .._mars import dataframe as mars_dataframe
 from .._mars import execute as mars_execute
 from .._mars import new_session as mars_new_session
+from .._mars import persist as mars_persist
 from .._mars import remote as mars_remote
 from .._mars import stop_server as mars_stop_server
 from .._mars import tensor as mars_tensor
+from .._mars import unpersist as mars_unpersist
 from .._mars.core import Entity as MarsEntity
 from .._mars.core import OutputType as MarsOutputType
 from .._mars.core.entity.objects import OBJECT_TYPE as MARS_OBJECT_TYPE
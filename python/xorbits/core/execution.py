@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import builtins
 
-from .adapter import MarsEntity, mars_execute
+from .adapter import MarsEntity, mars_execute, mars_persist, mars_unpersist
 from .data import DataRef
 
 
@@ -60,6 +60,49 @@ def run(obj: DataRef | list[DataRef] | tuple[DataRef], **kwargs) -> None:
         mars_execute(mars_tileables, **kwargs)
 
 
+def cache(
+    obj: DataRef | list[DataRef] | tuple[DataRef], level: str = "memory", **kwargs
+):
+    """
+    Execute and keep data in the cluster across executions.
+
+    Later computations that build the same objects, e.g. reading the
+    same source with the same arguments, reuse the cached data instead
+    of computing it again. Cached data is spilled after other data when
+    memory is short. The cache is not refreshed when sources change,
+    call ``uncache`` to release it.
+
+    Parameters
+    ----------
+    obj : DataRef or collection of DataRefs
+        DataRef or collection of DataRefs to cache.
+    level : str
+        Storage level to keep data, 'memory' or 'disk'. Caching on disk
+        requires a disk storage backend of workers.
+
+    Returns
+    -------
+    DataRef or collection of DataRefs
+        Objects passed in.
+    """
+    refs = [obj] if isinstance(obj, DataRef) else list(obj)
+    mars_persist([_get_mars_entity(ref) for ref in refs], level=level, **kwargs)
+    return obj
+
+
+def uncache(obj: DataRef | list[DataRef] | tuple[DataRef]) -> None:
+    """
+    Release cached data, which is deleted when objects are not referenced.
+
+    Parameters
+    ----------
+    obj : DataRef or collection of DataRefs
+        DataRef or collection of DataRefs to release.
+    """
+    refs = [obj] if isinstance(obj, DataRef) else list(obj)
+    mars_unpersist([_get_mars_entity(ref) for ref in refs])
+
+
 def need_to_execute(ref: DataRef) -> bool:
     mars_entity = _get_mars_entity(ref)
     return (
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
 import pytest
 
 from ...pandas import get_dummies
 from ...remote import spawn
-from ..execution import need_to_execute, run
+from ..execution import cache, need_to_execute, run, uncache
 
 
 def test_deferred_execution_repr(setup, dummy_df):
@@ -119,6 +120,18 @@ def test_manual_execution(setup, dummy_int_series):
     assert not any([need_to_execute(ref) for ref in series_to_execute])
 
 
+def test_cache(setup, dummy_int_series):
+    series = dummy_int_series + 1
+    assert cache(series) is series
+    assert not need_to_execute(series)
+
+    # same computation reuses the cached data
+    series2 = dummy_int_series + 1
+    assert need_to_execute(series2)
+    pd.testing.assert_series_equal(series2.to_pandas(), series.to_pandas())
+    uncache([series])
+
+
 def test_len(setup, dummy_df, dummy_int_series, dummy_int_2d_array):
     assert need_to_execute(dummy_df)
     assert need_to_execute(dummy_int_series)